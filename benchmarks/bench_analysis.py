@@ -0,0 +1,23 @@
+"""Palette analysis: uncached distance matrices and categorical cycle search."""
+
+from dubois_style import categorical_cycle, delta_e_matrix
+from dubois_style.analysis import _coordinates, _delta_e, dubois_candidates
+
+_CANDIDATES = dubois_candidates(24)
+
+
+def time_delta_e_matrix_uncached(metric):
+    """Conversion and distances for ~40 colors under all four visions."""
+    _coordinates.cache_clear()
+    _delta_e.cache_clear()
+    delta_e_matrix(_CANDIDATES, metric=metric, cvd="all")
+
+
+time_delta_e_matrix_uncached.params = ["cam02ucs", "ciede2000"]
+
+
+def time_categorical_cycle(n):
+    categorical_cycle(n)
+
+
+time_categorical_cycle.params = [7, 14, 24]
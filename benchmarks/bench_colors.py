@@ -0,0 +1,28 @@
+"""Palette mapping throughput."""
+
+import numpy as np
+
+from dubois_style import map_values
+
+_VALUES = {n: np.random.default_rng(0).uniform(0, 100, n) for n in (10_000, 1_000_000)}
+
+
+def time_map_values(n):
+    map_values(_VALUES[n])
+
+
+time_map_values.params = [10_000, 1_000_000]
+
+
+def time_map_values_uint8(n):
+    map_values(_VALUES[n], dtype=np.uint8)
+
+
+time_map_values_uint8.params = [10_000, 1_000_000]
+
+
+def time_map_values_bins(n):
+    map_values(_VALUES[n], bins=[0, 10, 25, 50, 75, 90, 95, 100])
+
+
+time_map_values_bins.params = [1_000_000]
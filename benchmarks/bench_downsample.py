@@ -0,0 +1,71 @@
+"""Downsampling throughput and the draw time it saves on long and dense series."""
+
+import io
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from dubois_style import (
+    dubois_line,
+    dubois_scatter,
+    dubois_style_context,
+    lttb_downsample,
+    minmax_downsample,
+)
+
+_rng = np.random.default_rng(0)
+_SERIES = {n: (np.arange(n, dtype=float), _rng.normal(size=n).cumsum())
+           for n in (1_000_000, 10_000_000)}
+
+
+def time_minmax(n):
+    minmax_downsample(*_SERIES[n], 1000)
+
+
+time_minmax.params = [1_000_000, 10_000_000]
+
+
+def time_lttb(n):
+    lttb_downsample(*_SERIES[n], 2000)
+
+
+time_lttb.params = [1_000_000, 10_000_000]
+
+
+def _render(n, reduce):
+    x, y = _SERIES[n]
+    with dubois_style_context():
+        fig = Figure(figsize=(10, 4))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        if reduce:
+            dubois_line(ax, x, y, dpi=100)
+        else:
+            ax.plot(x, y)
+        fig.savefig(io.BytesIO(), format="png", dpi=100)
+
+
+def time_render_line_full(n):
+    _render(n, reduce=False)
+
+
+def time_render_line_downsampled(n):
+    _render(n, reduce=True)
+
+
+time_render_line_full.params = [1_000_000]
+time_render_line_downsampled.params = [1_000_000, 10_000_000]
+
+
+def time_render_scatter(n):
+    x, y = _SERIES[n]
+    groups = np.arange(n) % 3
+    with dubois_style_context():
+        fig = Figure(figsize=(8, 6))
+        FigureCanvasAgg(fig)
+        dubois_scatter(fig.subplots(), y, np.roll(y, 1), groups)
+        fig.savefig(io.BytesIO(), format="svg")
+
+
+time_render_scatter.params = [1_000_000, 10_000_000]
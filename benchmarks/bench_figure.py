@@ -0,0 +1,37 @@
+"""Rendering with DuboisFigure, serially and from a pool of worker threads."""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from dubois_style import DuboisFigure
+
+_VALUES = np.array([85, 72, 68, 91, 55])
+_CYCLES = ["light", "dark"] * 8
+
+
+def _render(cycle):
+    fig = DuboisFigure(figsize=(4, 3), cycle=cycle, use_contrast_colors=True)
+    with fig:
+        ax = fig.subplots()
+        ax.bar(np.arange(5), _VALUES)
+        ax.set_title("Du Bois–Style Bar Chart")
+    fig.savefig(io.BytesIO(), format="png", dpi=50)
+
+
+def time_chart_dubois_figure():
+    _render("light")
+
+
+def time_render_16_charts(workers):
+    """16 charts in alternating styles; ``workers=1`` is serial."""
+    if workers == 1:
+        for cycle in _CYCLES:
+            _render(cycle)
+        return
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(_render, _CYCLES))
+
+
+time_render_16_charts.params = [1, 4]
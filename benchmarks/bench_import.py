@@ -0,0 +1,33 @@
+"""Import cost of the package, measured in a fresh interpreter each time."""
+
+import subprocess
+import sys
+
+_CHILD = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def _import_seconds(statement: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(statement=statement)],
+        capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout)
+
+
+def track_import_package():
+    return _import_seconds("import dubois_style")
+
+
+def track_import_palettes():
+    return _import_seconds("from dubois_style import DUBOIS_CATEGORICAL_CYCLE")
+
+
+def track_first_apply():
+    return _import_seconds(
+        "from dubois_style import apply_dubois_style; apply_dubois_style()"
+    )
@@ -0,0 +1,49 @@
+"""Legend placement cost with many series."""
+
+import io
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from dubois_style import dubois_legend, dubois_style_context
+
+_X = np.linspace(0, 1, 20)
+
+
+def _figure(n_series):
+    fig = Figure(figsize=(8, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    for i in range(n_series):
+        ax.plot(_X, _X * i, label=f"Series {i}")
+    return fig, ax
+
+
+def time_legend_create(n_series):
+    with dubois_style_context(use_contrast_colors=True):
+        fig, ax = _figure(n_series)
+        dubois_legend(ax, outside=True)
+
+
+time_legend_create.params = [10, 50, 200]
+
+
+def time_legend_save_tight(n_series):
+    with dubois_style_context(use_contrast_colors=True):
+        fig, ax = _figure(n_series)
+        dubois_legend(ax, outside=True)
+        fig.savefig(io.BytesIO(), format="png", dpi=50, bbox_inches="tight")
+
+
+time_legend_save_tight.params = [10, 50, 200]
+
+
+def time_legend_save_reserved(n_series):
+    with dubois_style_context(use_contrast_colors=True):
+        fig, ax = _figure(n_series)
+        dubois_legend(ax, outside=True, reserve_space=True)
+        fig.savefig(io.BytesIO(), format="png", dpi=50)
+
+
+time_legend_save_reserved.params = [10, 50, 200]
@@ -0,0 +1,14 @@
+"""Text measurement through the metrics cache: cold misses against warm hits."""
+
+from dubois_style import text_extents, text_metrics
+
+_LABELS = [f"Series {i}" for i in range(200)]
+
+
+def time_text_extents_miss():
+    text_metrics.clear()
+    text_extents(_LABELS, size=10)
+
+
+def time_text_extents_hit():
+    text_extents(_LABELS, size=10)
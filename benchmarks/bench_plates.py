@@ -0,0 +1,88 @@
+"""Du Bois plate charts as one collection versus one patch per segment."""
+
+import io
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Wedge
+from matplotlib.path import Path
+
+from dubois_style import dubois_fan, dubois_spiral, dubois_stacked_bars, dubois_style_context
+from dubois_style.geometry import spiral_path
+
+_rng = np.random.default_rng(0)
+
+
+def _render(draw, n):
+    with dubois_style_context():
+        fig = Figure(figsize=(6, 6))
+        FigureCanvasAgg(fig)
+        draw(fig.subplots(), _rng.uniform(1, 10, n))
+        fig.savefig(io.BytesIO(), format="png", dpi=72)
+
+
+def time_spiral(n):
+    _render(lambda ax, v: dubois_spiral(ax, v, max_turns=2), n)
+
+
+time_spiral.params = [10, 1000, 10000]
+
+
+def _spiral_args(n):
+    step = 0.5 / n
+    sweep = -_rng.uniform(0, 2 * np.pi, n)
+    r_outer = 1 - step * np.arange(n)
+    return sweep, r_outer - 0.8 * step, r_outer, n * step
+
+
+def time_spiral_path(n):
+    sweep, r_inner, r_outer, pitch = _SPIRALS[n]
+    spiral_path(np.pi / 2, sweep, r_inner, r_outer, pitch=pitch)
+
+
+time_spiral_path.params = [10, 100, 1000, 10000, 100000]
+
+
+def time_spiral_path_loop(n):
+    """Reference: one ``Path`` per bar built in Python, as before the generator."""
+    sweep, r_inner, r_outer, pitch = _SPIRALS[n]
+    for s, ri, ro in zip(sweep, r_inner, r_outer):
+        m = max(2, int(np.ceil(abs(s) / (2 * np.pi) * 64)) + 1)
+        theta = np.pi / 2 + np.linspace(0, s, m)
+        drift = pitch * np.linspace(0, abs(s) / (2 * np.pi), m)
+        r = np.concatenate((ro - drift, (ri - drift)[::-1]))
+        angles = np.concatenate((theta, theta[::-1]))
+        Path(np.column_stack((r * np.cos(angles), r * np.sin(angles))), closed=True)
+
+
+time_spiral_path_loop.params = [10, 1000, 10000]
+
+_SPIRALS = {n: _spiral_args(n) for n in time_spiral_path.params}
+
+
+def time_fan(n):
+    _render(dubois_fan, n)
+
+
+time_fan.params = [10, 1000, 10000]
+
+
+def time_fan_patches(n):
+    def draw(ax, values):
+        edges = 180 - 180 * np.concatenate(([0], np.cumsum(values) / values.sum()))
+        for lo, hi in zip(edges[1:], edges[:-1]):
+            ax.add_patch(Wedge((0, 0), 1, lo, hi))
+        ax.autoscale_view()
+
+    _render(draw, n)
+
+
+time_fan_patches.params = [10, 1000]
+
+
+def time_stacked_bars(n):
+    _render(lambda ax, v: dubois_stacked_bars(ax, v.reshape(-1, 10)), n)
+
+
+time_stacked_bars.params = [10, 1000, 10000]
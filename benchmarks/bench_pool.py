@@ -0,0 +1,34 @@
+"""Small-chart latency with pooled figures versus a new figure per chart."""
+
+import io
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from dubois_style import FigurePool, dubois_style_context
+
+_STYLE = {"use_contrast_colors": True}
+_VALUES = np.array([85, 72, 68, 91, 55])
+_POOLS = {reset: FigurePool(reset=reset) for reset in ("artists", "full")}
+
+
+def _draw(fig, ax):
+    ax.bar(np.arange(5), _VALUES)
+    ax.set_title("Du Bois–Style Bar Chart")
+    fig.savefig(io.BytesIO(), format="png", dpi=50)
+
+
+def time_chart_new_figure():
+    with dubois_style_context(**_STYLE):
+        fig = Figure(figsize=(4, 3))
+        FigureCanvasAgg(fig)
+        _draw(fig, fig.subplots())
+
+
+def time_chart_pooled(reset):
+    with _POOLS[reset].figure(figsize=(4, 3), style=_STYLE) as (fig, ax):
+        _draw(fig, ax)
+
+
+time_chart_pooled.params = ["artists", "full"]
@@ -0,0 +1,28 @@
+"""Cost of profiling: the same chart rendered with and without profile()."""
+
+import io
+
+import numpy as np
+
+from dubois_style import DuboisFigure, dubois_legend, profile
+
+_VALUES = np.random.default_rng(0).random((4, 50)).cumsum(axis=1)
+
+
+def _render():
+    fig = DuboisFigure(figsize=(4, 3), use_contrast_colors=True)
+    with fig:
+        ax = fig.subplots()
+        for k, values in enumerate(_VALUES):
+            ax.plot(values, label=f"Series {k}")
+        dubois_legend(ax)
+    fig.savefig(io.BytesIO(), format="png", dpi=50)
+
+
+def time_chart_unprofiled():
+    _render()
+
+
+def time_chart_profiled():
+    with profile():
+        _render()
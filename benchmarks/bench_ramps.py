@@ -0,0 +1,23 @@
+"""Interpolated ramps: building them uncached and mapping values onto them."""
+
+import numpy as np
+
+from dubois_style import dubois_ramp, map_values
+from dubois_style.ramps import _ramp
+
+_VALUES = np.random.default_rng(0).uniform(0, 100, 1_000_000)
+
+
+def time_dubois_ramp_uncached(steps):
+    _ramp.cache_clear()
+    dubois_ramp(steps, "dark")
+
+
+time_dubois_ramp_uncached.params = [256, 65536]
+
+
+def time_map_values_ramp(steps):
+    map_values(_VALUES, palette="dark", steps=steps)
+
+
+time_map_values_ramp.params = [4096, 65536]
@@ -0,0 +1,83 @@
+"""End-to-end render time of the gallery chart types at several data sizes.
+
+Each benchmark builds the chart on a bare ``Figure`` with the Du Bois style
+applied and saves a PNG to memory, mirroring the ``create_*`` functions in
+``notebooks/gallery.py``.
+"""
+
+import io
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from dubois_style import dubois_legend, dubois_style_context
+
+SIZES = [10, 1_000, 100_000]
+
+_rng = np.random.default_rng(42)
+
+
+def _render(draw, n):
+    with dubois_style_context(use_contrast_colors=True, show_x_axis=True, show_y_axis=True):
+        fig = Figure(figsize=(8, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        draw(ax, n)
+        fig.savefig(io.BytesIO(), format="png", dpi=72)
+
+
+def _bar(ax, n):
+    ax.bar(np.arange(n), _rng.uniform(0, 100, n))
+
+
+def _barh(ax, n):
+    ax.barh(np.arange(n), _rng.uniform(0, 100, n))
+
+
+def _line(ax, n):
+    x = np.linspace(0, 10, n)
+    for i in range(3):
+        ax.plot(x, np.sin(x + i), label=f"Series {i + 1}")
+    dubois_legend(ax, outside=True)
+
+
+def _area(ax, n):
+    x = np.arange(n)
+    ys = _rng.uniform(1, 5, (3, n)).cumsum(axis=0)
+    lower = np.zeros(n)
+    for i, upper in enumerate(ys):
+        ax.fill_between(x, lower, upper, label=f"Group {i + 1}", alpha=0.7)
+        lower = upper
+    dubois_legend(ax, outside=True)
+
+
+def _scatter(ax, n):
+    for i in range(2):
+        ax.scatter(*_rng.normal(5 + 2 * i, 1, (2, n)), label=f"Group {i + 1}", alpha=0.7, s=60)
+    dubois_legend(ax, outside=True)
+
+
+def time_bar(n):
+    _render(_bar, n)
+
+
+def time_barh(n):
+    _render(_barh, n)
+
+
+def time_line(n):
+    _render(_line, n)
+
+
+def time_area(n):
+    _render(_area, n)
+
+
+def time_scatter(n):
+    _render(_scatter, n)
+
+
+# 100k bars take minutes per call and say nothing new about the style
+time_bar.params = time_barh.params = SIZES[:2]
+time_line.params = time_area.params = time_scatter.params = SIZES
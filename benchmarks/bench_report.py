@@ -0,0 +1,42 @@
+"""Multi-page PDF reports: template pages versus a new figure per page."""
+
+import io
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from dubois_style import DuboisReport, dubois_style_context
+
+_X = np.linspace(0, 10, 200)
+
+
+def _draw(fig, axes, i):
+    top, bottom = axes
+    top.plot(_X, np.sin(_X + i), label="Series 1")
+    top.legend()
+    bottom.bar(np.arange(12), np.abs(np.cos(np.arange(12) + i)))
+    fig.suptitle(f"Page {i}")
+
+
+def time_report_pages(n_pages):
+    with DuboisReport(io.BytesIO()) as report:
+        for i in range(n_pages):
+            with report.page(figsize=(8.5, 11), nrows=2) as (fig, axes):
+                _draw(fig, axes, i)
+
+
+time_report_pages.params = [10, 100]
+
+
+def time_pdfpages_new_figures(n_pages):
+    with dubois_style_context(), PdfPages(io.BytesIO()) as pdf:
+        for i in range(n_pages):
+            fig = Figure(figsize=(8.5, 11))
+            FigureCanvasAgg(fig)
+            _draw(fig, fig.subplots(2), i)
+            pdf.savefig(fig)
+
+
+time_pdfpages_new_figures.params = [10, 100]
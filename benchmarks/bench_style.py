@@ -0,0 +1,31 @@
+"""Per-call cost of ``apply_dubois_style`` and ``dubois_style_context``.
+
+``time_apply_uncached`` is the pre-cache implementation: build the rc dict,
+construct a cycler, push everything through matplotlib's validators and
+write the result into rcParams on every call. Compare it with
+``time_apply_switching`` (two cached applications that each change the
+style) and ``time_apply_already_active`` (a cached no-op).
+"""
+
+import matplotlib as mpl
+
+from dubois_style import apply_dubois_style, dubois_style_context
+from dubois_style.style import _build_rc
+
+
+def time_apply_uncached():
+    mpl.rcParams.update(_build_rc.__wrapped__("light", True, True, True, ("DejaVu Sans",)))
+
+
+def time_apply_already_active():
+    apply_dubois_style(show_x_axis=True, show_y_axis=True, use_contrast_colors=True)
+
+
+def time_apply_switching():
+    apply_dubois_style(cycle="light")
+    apply_dubois_style(cycle="dark")
+
+
+def time_style_context():
+    with dubois_style_context(cycle="dark"):
+        pass
@@ -0,0 +1,129 @@
+"""Run the dubois-style benchmark suite and compare against a baseline.
+
+Benchmarks follow the asv naming conventions:
+
+- ``time_*`` functions are timed (best of several repeats, per call);
+- ``track_*`` functions return their own measurement (e.g. a time taken in
+  a subprocess);
+- a ``params`` attribute on either kind runs it once per parameter value.
+
+Usage::
+
+    python benchmarks/run.py                       # run and print
+    python benchmarks/run.py -k legend             # only matching benchmarks
+    python benchmarks/run.py --save                # overwrite the baseline
+    python benchmarks/run.py --compare             # exit 1 on regressions
+
+Baselines are machine-specific; regenerate ``baseline.json`` with ``--save``
+when benchmarking on different hardware.
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_BASELINE = HERE / "baseline.json"
+
+
+def _load_modules():
+    for path in sorted(HERE.glob("bench_*.py")):
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module
+
+
+def _collect(pattern: str | None):
+    for module in _load_modules():
+        for name in sorted(vars(module)):
+            func = getattr(module, name)
+            if not callable(func) or not name.startswith(("time_", "track_")):
+                continue
+            for param in getattr(func, "params", [None]):
+                bench_id = f"{module.__name__}.{name}"
+                if param is not None:
+                    bench_id += f"[{param}]"
+                if pattern and pattern not in bench_id:
+                    continue
+                yield bench_id, func, param
+
+
+def _measure(func, param, repeat: int) -> float:
+    """Seconds per call (time_*) or the returned value (track_*)."""
+    call = func if param is None else (lambda: func(param))
+    if func.__name__.startswith("track_"):
+        return min(call() for _ in range(repeat))
+    timer = timeit.Timer(call)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _format_seconds(value: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:8.2f} {unit}"
+    return f"{value / 1e-9:8.2f} ns"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="only run benchmarks containing this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="write results as the baseline")
+    parser.add_argument("--compare", action="store_true",
+                        help="fail if a benchmark is slower than baseline * threshold")
+    parser.add_argument("--threshold", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+
+    results = {}
+    regressions = []
+    for bench_id, func, param in _collect(args.pattern):
+        value = _measure(func, param, args.repeat)
+        results[bench_id] = value
+        line = f"{bench_id:<48}{_format_seconds(value)}"
+        if bench_id in baseline:
+            ratio = value / baseline[bench_id]
+            line += f"   {ratio:5.2f}x baseline"
+            if ratio > args.threshold:
+                regressions.append(bench_id)
+                line += "  << REGRESSION"
+        print(line, flush=True)
+
+    if args.save:
+        if args.pattern and baseline:
+            # partial run: keep the other baseline entries
+            baseline.update(results)
+            results = baseline
+        import matplotlib
+        import numpy
+
+        args.baseline.write_text(json.dumps({
+            "machine": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "processor": platform.processor(),
+                "matplotlib": matplotlib.__version__,
+                "numpy": numpy.__version__,
+            },
+            "results": dict(sorted(results.items())),
+        }, indent=2) + "\n")
+        print(f"baseline written to {args.baseline}")
+
+    if args.compare and regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold}x baseline")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""Build the static assets of the WebAssembly gallery.
+
+Writes into ``notebooks/public/``, which ``marimo export html-wasm`` ships
+next to the exported notebook:
+
+- ``dubois_bundle.json``: palettes and prebuilt rc dictionaries from
+  :func:`dubois_style.bundle.wasm_bundle`, so the notebook needs neither the
+  package nor an inlined copy of the style;
+- ``gallery/<chart>-<hash>@<resolution>.<format>``: every chart of
+  :data:`gallery_charts.GALLERY`, pre-rendered at each resolution (a
+  thumbnail, 1x and 2x by default) as WebP and PNG;
+- ``gallery/manifest.json``: per chart, its input hash, what went into it
+  and every image with its pixel size, for the notebook to build
+  ``srcset`` lists from.
+
+A chart's hash covers its inputs: the source of its draw function and of
+every function in ``notebooks`` or ``dubois_style`` it references by global
+name (recursively), the values of module-level data it reads, the resolved
+rc of its style options, its figure size, the resolutions and formats, and
+the matplotlib, NumPy and package versions. A rebuild re-renders only the
+charts whose hash changed and reports which inputs did; images no longer
+in the manifest are deleted.
+
+Usage::
+
+    python notebooks/build.py
+    python notebooks/build.py --formats webp png --jobs 4
+    python notebooks/build.py --force
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+if str(HERE.parent) not in sys.path:
+    # run as a script: make the ``notebooks`` package importable
+    sys.path.insert(0, str(HERE.parent))
+
+from dubois_style.bundle import write_wasm_bundle  # noqa: E402
+from notebooks.gallery_charts import GALLERY  # noqa: E402
+
+DEFAULT_OUT = HERE / "public"
+MANIFEST_VERSION = 1
+
+# resolution name -> dpi; an 8 x 6 in chart is 320, 800 and 1600 px wide
+RESOLUTIONS = {"thumb": 40, "1x": 100, "2x": 200}
+FORMATS = ("webp", "png")
+
+# packages whose functions are followed when collecting a chart's inputs
+_TRACKED = ("notebooks", "dubois_style")
+_DATA = (str, bytes, int, float, bool, tuple, list, dict)
+
+
+def _referenced_names(code: types.CodeType):
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _referenced_names(const)
+
+
+def _versions() -> dict:
+    import matplotlib
+    import numpy
+
+    import dubois_style
+
+    return {
+        "matplotlib": matplotlib.__version__,
+        "numpy": numpy.__version__,
+        "dubois_style": dubois_style.__version__,
+    }
+
+
+def chart_inputs(chart) -> dict[str, str]:
+    """
+    Everything a chart's images depend on, as ``{input name: text}``.
+
+    Functions are followed through the names their code references in
+    their module globals, as long as they belong to a tracked package;
+    functions imported inside other functions are not followed, but the
+    resolved style rc and the library versions cover the package itself.
+    """
+    from dubois_style import build_dubois_rc
+
+    inputs = {
+        "style": repr(sorted(build_dubois_rc(**chart.style).items())),
+        "figsize": repr(tuple(chart.figsize)),
+        **{f"version:{name}": value for name, value in _versions().items()},
+    }
+    todo = [chart.draw]
+    while todo:
+        func = todo.pop()
+        name = f"function:{func.__module__}.{func.__qualname__}"
+        if name in inputs:
+            continue
+        inputs[name] = inspect.getsource(func)
+        for ref in _referenced_names(func.__code__):
+            # attribute names also show up here; they aren't module globals
+            obj = func.__globals__.get(ref)
+            if isinstance(obj, types.FunctionType):
+                if obj.__module__.split(".")[0] in _TRACKED:
+                    todo.append(obj)
+            elif isinstance(obj, _DATA):
+                inputs[f"data:{func.__module__}.{ref}"] = repr(obj)
+    return inputs
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode()).hexdigest()
+
+
+def _render_chart(name, chart, gallery_dir, key, resolutions, formats) -> list[dict]:
+    """Draw one chart once and save every resolution and format of it."""
+    from dubois_style import DuboisFigure
+
+    fig = DuboisFigure(figsize=chart.figsize, **chart.style)
+    with fig:
+        chart.draw(fig)
+    images = []
+    width, height = fig.get_size_inches()
+    for resolution, dpi in resolutions.items():
+        for fmt in formats:
+            path = gallery_dir / f"{name}-{key[:16]}@{resolution}.{fmt}"
+            fig.savefig(path, format=fmt, dpi=dpi)
+            images.append({
+                "path": f"{gallery_dir.name}/{path.name}",
+                "format": fmt,
+                "resolution": resolution,
+                "dpi": dpi,
+                "width": round(width * dpi),
+                "height": round(height * dpi),
+                "bytes": path.stat().st_size,
+            })
+    return images
+
+
+def _load_manifest(path: Path) -> dict:
+    try:
+        manifest = json.loads(path.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("charts", {})
+
+
+def build(
+    out_dir: Path = DEFAULT_OUT,
+    *,
+    resolutions: dict[str, float] | None = None,
+    formats=FORMATS,
+    charts: dict | None = None,
+    jobs: int | None = 1,
+    force: bool = False,
+) -> dict:
+    """
+    Write the bundle, the gallery images and their manifest into ``out_dir``.
+
+    Parameters
+    ----------
+    out_dir : Path
+        The notebook's ``public/`` folder.
+    resolutions : dict[str, float] | None
+        Resolution name to dpi; :data:`RESOLUTIONS` by default.
+    formats : Sequence[str]
+        Image formats, best first; the last one is the fallback ``<img>``.
+    charts : dict | None
+        Name to ``GalleryChart``; all of :data:`GALLERY` by default.
+    jobs : int | None, default 1
+        Worker processes for the charts that need rendering (one per CPU
+        if None).
+    force : bool, default False
+        Re-render every chart even if its inputs are unchanged.
+
+    Returns
+    -------
+    dict
+        ``manifest`` (as written), ``rendered`` (chart name to the inputs
+        that changed, ``["*"]`` when new or forced), ``up_to_date`` (chart
+        names) and ``seconds``.
+    """
+    start = time.perf_counter()
+    out_dir = Path(out_dir)
+    resolutions = dict(RESOLUTIONS if resolutions is None else resolutions)
+    formats = tuple(fmt.lower().lstrip(".") for fmt in formats)
+    charts = GALLERY if charts is None else charts
+    write_wasm_bundle(out_dir / "dubois_bundle.json")
+
+    gallery_dir = out_dir / "gallery"
+    gallery_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = gallery_dir / "manifest.json"
+    previous = _load_manifest(manifest_path)
+
+    entries, stale, rendered, up_to_date = {}, {}, {}, []
+    for name, chart in charts.items():
+        inputs = {key: _digest(text) for key, text in chart_inputs(chart).items()}
+        key = _digest({"inputs": inputs, "resolutions": resolutions, "formats": formats})
+        entry = {"hash": key, "figsize": list(chart.figsize), "inputs": inputs}
+        old = previous.get(name, {})
+        if (not force and old.get("hash") == key
+                and all((out_dir / image["path"]).exists() for image in old["images"])):
+            entries[name] = {**entry, "images": old["images"]}
+            up_to_date.append(name)
+            continue
+        entries[name] = entry
+        old_inputs = old.get("inputs")
+        if force or not old_inputs:
+            rendered[name] = ["*"]
+        else:
+            rendered[name] = sorted(k for k in inputs.keys() | old_inputs.keys()
+                                    if inputs.get(k) != old_inputs.get(k)) or ["*"]
+        stale[name] = (name, chart, gallery_dir, key, resolutions, formats)
+
+    if stale:
+        if jobs == 1 or len(stale) == 1:
+            images = [_render_chart(*args) for args in stale.values()]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                images = list(pool.map(_render_chart, *zip(*stale.values())))
+        for name, chart_images in zip(stale, images):
+            entries[name]["images"] = chart_images
+
+    # images of charts that changed or were removed
+    current = {Path(image["path"]).name for entry in entries.values() for image in entry["images"]}
+    for path in gallery_dir.iterdir():
+        if path.suffix.lstrip(".") in ("png", "webp", "jpg", "svg") and path.name not in current:
+            path.unlink()
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "resolutions": resolutions,
+        "formats": list(formats),
+        "charts": entries,
+    }
+    tmp = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    os.replace(tmp, manifest_path)
+
+    return {
+        "manifest": manifest,
+        "rendered": rendered,
+        "up_to_date": up_to_date,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS),
+                        help="image formats, best first (default: webp png)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="re-render every chart")
+    args = parser.parse_args(argv)
+
+    summary = build(args.out, formats=args.formats, jobs=args.jobs, force=args.force)
+    for name, changed in summary["rendered"].items():
+        reason = "new or forced" if changed == ["*"] else ", ".join(changed)
+        print(f"  rendered {name}: {reason}")
+    print(f"{len(summary['rendered'])} rendered, {len(summary['up_to_date'])} up to date "
+          f"in {summary['seconds']:.2f} s -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+"""The charts shown in the gallery notebook.
+
+Each chart is a ``draw(fig)`` function following the
+:class:`~dubois_style.render.RenderJob` contract: it fills an empty
+``Figure`` and never touches pyplot. :data:`GALLERY` lists every chart with
+the style options and figure size it is rendered with; ``notebooks/build.py``
+pre-renders them for the deployed gallery, and locally they can be drawn
+directly::
+
+    from dubois_style import DuboisFigure
+    from notebooks.gallery_charts import GALLERY
+
+    chart = GALLERY["bar"]
+    fig = DuboisFigure(figsize=chart.figsize, **chart.style)
+    with fig:
+        chart.draw(fig)
+"""
+
+from dataclasses import dataclass, field
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.lines import Line2D
+
+from dubois_style import DUBOIS_FAMILIES, DUBOIS_LIGHT_CYCLE, dubois_legend
+
+__all__ = [
+    "GalleryChart",
+    "GALLERY",
+]
+
+# the style applied to the gallery as a whole
+GALLERY_STYLE = {
+    "cycle": "light",
+    "use_contrast_colors": True,
+    "show_x_axis": True,
+    "show_y_axis": True,
+}
+
+
+def _cycle_colors(n: int) -> list[str]:
+    return [prop["color"] for prop in mpl.rcParams["axes.prop_cycle"]][:n]
+
+
+# ========== BASIC EXAMPLES ==========
+
+
+def bar_chart(fig):
+    ax = fig.subplots()
+
+    categories = ["Category A", "Category B", "Category C", "Category D"]
+    values = [45, 78, 32, 91]
+
+    ax.bar(categories, values, color=_cycle_colors(len(categories)))
+    ax.set_title("Du Bois–Style Bar Chart", fontsize=14, fontweight="bold")
+    ax.set_ylabel("Values")
+
+    fig.tight_layout()
+
+
+def line_plot(fig):
+    ax = fig.subplots()
+
+    x = np.linspace(0, 10, 100)
+    ax.plot(x, np.sin(x), label="Series 1")
+    ax.plot(x, np.cos(x), label="Series 2")
+    ax.plot(x, np.sin(x) * np.cos(x), label="Series 3")
+
+    ax.set_title("Du Bois–Style Line Plot", fontsize=14, fontweight="bold")
+    ax.set_xlabel("X Axis")
+    ax.set_ylabel("Y Axis")
+
+    dubois_legend(ax, outside=True)
+    fig.tight_layout()
+
+
+def area_chart(fig):
+    ax = fig.subplots()
+
+    x = np.arange(0, 10)
+    y1 = np.array([2, 3, 4, 3, 5, 6, 7, 8, 9, 10])
+    y2 = np.array([1, 2, 3, 4, 5, 4, 3, 4, 5, 6])
+    y3 = np.array([1, 1, 2, 2, 3, 3, 4, 4, 5, 5])
+
+    ax.fill_between(x, 0, y1, label="Group 1", alpha=0.7)
+    ax.fill_between(x, y1, y1 + y2, label="Group 2", alpha=0.7)
+    ax.fill_between(x, y1 + y2, y1 + y2 + y3, label="Group 3", alpha=0.7)
+
+    ax.set_title("Du Bois–Style Stacked Area Chart", fontsize=14, fontweight="bold")
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Cumulative Value")
+
+    dubois_legend(ax, outside=True)
+    fig.tight_layout()
+
+
+def scatter(fig):
+    ax = fig.subplots()
+
+    rng = np.random.RandomState(42)
+    x1 = rng.normal(5, 1, 50)
+    y1 = rng.normal(5, 1, 50)
+    x2 = rng.normal(7, 1, 50)
+    y2 = rng.normal(7, 1, 50)
+
+    ax.scatter(x1, y1, label="Group 1", alpha=0.7, s=60)
+    ax.scatter(x2, y2, label="Group 2", alpha=0.7, s=60)
+
+    ax.set_title("Du Bois–Style Scatter Plot", fontsize=14, fontweight="bold")
+    ax.set_xlabel("X Variable")
+    ax.set_ylabel("Y Variable")
+
+    dubois_legend(ax, outside=True)
+    fig.tight_layout()
+
+
+def horizontal_bar(fig):
+    ax = fig.subplots()
+
+    categories = ["Item 1", "Item 2", "Item 3", "Item 4", "Item 5"]
+    values = [85, 72, 68, 91, 55]
+
+    ax.barh(categories, values, color=_cycle_colors(len(categories)))
+    ax.set_title("Du Bois–Style Horizontal Bar Chart", fontsize=14, fontweight="bold")
+    ax.set_xlabel("Values")
+
+    fig.tight_layout()
+
+
+# ========== COMPREHENSIVE MULTI-PLOT ==========
+
+
+def comprehensive(fig):
+    x = np.arange(1, 6)
+    y1 = np.array([3, 4, 2, 5, 4])
+    y2 = np.array([2, 3, 3, 2, 1])
+    y3 = np.array([1, 2, 1, 3, 2])
+
+    axs = fig.subplots(2, 3)
+    (ax_line, ax_bar, ax_stacked), (ax_pie, ax_scatter, ax_box) = axs
+
+    # Line plot
+    ax_line.plot(x, y1, marker="o", label="Series A", linewidth=2)
+    ax_line.plot(x, y2, marker="o", label="Series B", linewidth=2)
+    ax_line.set_title("Line Plot", fontsize=12, fontweight="bold")
+    ax_line.set_xlabel("X", fontsize=10)
+    ax_line.set_ylabel("Y", fontsize=10)
+    dubois_legend(ax_line)
+
+    # Bar chart
+    bar_width = 0.35
+    ax_bar.bar(x - bar_width / 2, y1, width=bar_width, label="Group A")
+    ax_bar.bar(x + bar_width / 2, y2, width=bar_width, label="Group B")
+    ax_bar.set_title("Bar Chart", fontsize=12, fontweight="bold")
+    ax_bar.set_xlabel("Category", fontsize=10)
+    ax_bar.set_ylabel("Value", fontsize=10)
+    dubois_legend(ax_bar)
+
+    # Stacked bar chart
+    ax_stacked.bar(x, y1, label="Bottom")
+    ax_stacked.bar(x, y2, bottom=y1, label="Middle")
+    ax_stacked.bar(x, y3, bottom=y1 + y2, label="Top")
+    ax_stacked.set_title("Stacked Bar Chart", fontsize=12, fontweight="bold")
+    ax_stacked.set_xlabel("Category", fontsize=10)
+    ax_stacked.set_ylabel("Total", fontsize=10)
+    dubois_legend(ax_stacked)
+
+    # Pie chart
+    ax_pie.pie(
+        np.array([y1.sum(), y2.sum(), y3.sum()]),
+        labels=["A", "B", "C"],
+        colors=DUBOIS_LIGHT_CYCLE[:3],
+        autopct="%1.0f%%",
+        textprops={"color": "#111111", "fontsize": 10},
+    )
+    ax_pie.set_title("Pie Chart", fontsize=12, fontweight="bold")
+
+    # Scatter plot
+    rng = np.random.default_rng(0)
+    ax_scatter.scatter(rng.normal(0, 1, 50), rng.normal(0, 1, 50), alpha=0.8, s=60)
+    ax_scatter.set_title("Scatter Plot", fontsize=12, fontweight="bold")
+    ax_scatter.set_xlabel("X", fontsize=10)
+    ax_scatter.set_ylabel("Y", fontsize=10)
+
+    # Box plot
+    data = [
+        rng.normal(0, 1, 100),
+        rng.normal(1.5, 0.5, 100),
+        rng.normal(-1, 0.7, 100),
+    ]
+    bp = ax_box.boxplot(data, patch_artist=True, tick_labels=["Set 1", "Set 2", "Set 3"])
+    for patch, color in zip(bp["boxes"], DUBOIS_LIGHT_CYCLE):
+        patch.set_facecolor(color)
+    ax_box.set_title("Box Plot", fontsize=12, fontweight="bold")
+
+    fig.suptitle("Comprehensive Du Bois Style Examples", fontsize=16,
+                 fontweight="bold", y=0.98)
+    fig.tight_layout(rect=[0, 0, 1, 0.96])
+    fig.patch.set_alpha(0.0)
+
+
+# ========== COLOR PALETTE SHOWCASE ==========
+
+
+def palette_showcase(fig):
+    labels = list(DUBOIS_FAMILIES.keys())
+    colors = [DUBOIS_FAMILIES[name]["light"] for name in labels]
+    x = np.arange(len(labels))
+    values = np.linspace(1, 7, len(labels))
+
+    ax_bar, ax_pie, ax_line = fig.subplots(1, 3)
+
+    # Horizontal bar chart showing all 7 colors
+    ax_bar.barh(x, values, color=colors)
+    ax_bar.set_yticks(x)
+    ax_bar.set_yticklabels(labels, fontsize=9)
+    ax_bar.set_xlabel("Value", fontsize=10)
+    ax_bar.set_title("All 7 Colors (Bar)", fontsize=12, fontweight="bold")
+
+    # Pie chart showing all 7 colors
+    ax_pie.pie(
+        values,
+        labels=None,
+        colors=colors,
+        autopct="%1.0f%%",
+        textprops={"color": "#111111", "fontsize": 9},
+    )
+    ax_pie.set_title("All 7 Colors (Pie)", fontsize=12, fontweight="bold")
+    legend_handles = [
+        Line2D([], [], marker="o", linestyle="None", color=c, label=lab, markersize=10)
+        for lab, c in zip(labels, colors)
+    ]
+    ax_pie.legend(handles=legend_handles, loc="center left",
+                  bbox_to_anchor=(1.05, 0.5), frameon=False, fontsize=9)
+
+    # Line plot with 7 colored points
+    for i, (lab, c) in enumerate(zip(labels, colors)):
+        ax_line.plot(i + 1, values[i], marker="o", markersize=10,
+                     linestyle="None", color=c, label=lab)
+    ax_line.set_xlim(0.5, len(labels) + 0.5)
+    ax_line.set_xticks(range(1, len(labels) + 1))
+    ax_line.set_xlabel("Category Index", fontsize=10)
+    ax_line.set_ylabel("Value", fontsize=10)
+    ax_line.set_title("All 7 Colors (Points)", fontsize=12, fontweight="bold")
+
+    fig.suptitle("Du Bois Palette – All Seven Colors", fontsize=16,
+                 fontweight="bold", y=0.98)
+    fig.tight_layout(rect=[0, 0, 1, 0.95])
+    fig.patch.set_alpha(0.0)
+
+
+# ========== STYLE CONFIGURATIONS ==========
+
+
+def style_light_sequential(fig):
+    ax = fig.subplots()
+
+    categories = ["A", "B", "C", "D", "E"]
+    values = [45, 67, 32, 78, 54]
+
+    ax.bar(categories, values, color=_cycle_colors(len(categories)))
+    ax.set_title("Light Cycle, Sequential Colors, No Axes", fontsize=14,
+                 fontweight="bold", pad=15)
+
+    fig.tight_layout()
+
+
+def style_light_contrast(fig):
+    ax = fig.subplots()
+
+    x = np.linspace(0, 10, 100)
+    for i in range(4):
+        ax.plot(x, np.sin(x + i * np.pi / 4), label=f"Series {i + 1}", linewidth=2)
+
+    ax.set_title("Light Cycle, High Contrast, Axes Visible", fontsize=14, fontweight="bold")
+    ax.set_xlabel("X Axis", fontsize=11)
+    ax.set_ylabel("Y Axis", fontsize=11)
+    ax.legend(loc="upper right", frameon=False)
+
+    fig.tight_layout()
+
+
+def style_dark_contrast(fig):
+    ax = fig.subplots()
+
+    categories = ["Q1", "Q2", "Q3", "Q4"]
+    revenue = [120, 145, 178, 165]
+    expenses = [80, 95, 110, 105]
+
+    x = np.arange(len(categories))
+    width = 0.35
+    ax.bar(x - width / 2, revenue, width, label="Revenue")
+    ax.bar(x + width / 2, expenses, width, label="Expenses")
+
+    ax.set_xticks(x)
+    ax.set_xticklabels(categories)
+    ax.set_title("Dark Cycle, High Contrast, Axes Visible", fontsize=14, fontweight="bold")
+    ax.set_xlabel("Quarter", fontsize=11)
+    ax.set_ylabel("Amount ($K)", fontsize=11)
+    ax.legend(loc="upper left", frameon=False)
+
+    fig.tight_layout()
+
+
+def style_dark_sequential(fig):
+    ax = fig.subplots()
+
+    x = np.arange(0, 10, 0.5)
+    y1 = np.sin(x) + 3
+    y2 = np.cos(x) + 2
+    y3 = np.sin(x * 0.5) + 1
+
+    ax.fill_between(x, 0, y1, alpha=0.7, label="Layer 1")
+    ax.fill_between(x, y1, y1 + y2, alpha=0.7, label="Layer 2")
+    ax.fill_between(x, y1 + y2, y1 + y2 + y3, alpha=0.7, label="Layer 3")
+
+    ax.set_title("Dark Cycle, Sequential Colors, No Axes", fontsize=14,
+                 fontweight="bold", pad=15)
+    ax.legend(loc="upper right", frameon=False)
+
+    fig.tight_layout()
+
+
+@dataclass(frozen=True)
+class GalleryChart:
+    """A gallery chart: its draw function, style options and figure size."""
+
+    draw: object
+    figsize: tuple[float, float] = (8, 6)
+    style: dict = field(default_factory=lambda: dict(GALLERY_STYLE))
+
+
+GALLERY = {
+    "bar": GalleryChart(bar_chart),
+    "line": GalleryChart(line_plot),
+    "area": GalleryChart(area_chart),
+    "scatter": GalleryChart(scatter),
+    "barh": GalleryChart(horizontal_bar),
+    "comprehensive": GalleryChart(comprehensive, figsize=(14, 8)),
+    "palette": GalleryChart(palette_showcase, figsize=(15, 5)),
+    "style_light_sequential": GalleryChart(
+        style_light_sequential, (8, 5),
+        {"cycle": "light", "use_contrast_colors": False},
+    ),
+    "style_light_contrast": GalleryChart(
+        style_light_contrast, (8, 5),
+        {"cycle": "light", "use_contrast_colors": True, "show_x_axis": True, "show_y_axis": True},
+    ),
+    "style_dark_contrast": GalleryChart(
+        style_dark_contrast, (8, 5),
+        {"cycle": "dark", "use_contrast_colors": True, "show_x_axis": True, "show_y_axis": True},
+    ),
+    "style_dark_sequential": GalleryChart(
+        style_dark_sequential, (8, 5),
+        {"cycle": "dark", "use_contrast_colors": False},
+    ),
+}
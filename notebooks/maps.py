@@ -10,17 +10,13 @@ app = marimo.App(width="medium")
 def _():
     import numpy as np
     import matplotlib.pyplot as plt
-    from matplotlib.patches import Rectangle
-    from dubois_style import apply_dubois_style, dubois_legend, DUBOIS_FAMILIES, DUBOIS_LIGHT_CYCLE
+    from dubois_style import apply_dubois_style, dubois_map
 
     return (
-        DUBOIS_FAMILIES,
-        DUBOIS_LIGHT_CYCLE,
-        Rectangle,
-        dubois_legend,
+        apply_dubois_style,
+        dubois_map,
         np,
         plt,
-        apply_dubois_style,
     )
 
 
@@ -37,7 +33,7 @@ def _(apply_dubois_style):
 
 
 @app.cell
-def _(DUBOIS_LIGHT_CYCLE, Rectangle, dubois_legend, np, plt):
+def _(dubois_map, np, plt):
     # Example: Simplified Georgia map visualization
     # Inspired by Du Bois' "Georgia Negro" map from the 1900 Paris Exposition
     # This is a simplified representation using rectangles
@@ -61,41 +57,22 @@ def _(DUBOIS_LIGHT_CYCLE, Rectangle, dubois_legend, np, plt):
         {"name": "Region 12", "x": 0.7, "y": 0.1, "width": 0.15, "height": 0.2, "value": 95},
     ]
 
-    # Normalize values for color mapping
+    # Each region as a polygon; real data would come from shapely/geopandas
+    polygons = [
+        np.array([
+            [r["x"], r["y"]],
+            [r["x"] + r["width"], r["y"]],
+            [r["x"] + r["width"], r["y"] + r["height"]],
+            [r["x"], r["y"] + r["height"]],
+        ])
+        for r in regions
+    ]
     values = [r["value"] for r in regions]
-    min_val, max_val = min(values), max(values)
 
-    # Use Du Bois light color cycle
-    colors = DUBOIS_LIGHT_CYCLE
-    
-    for i, region in enumerate(regions):
-        # Map value to color
-        normalized = (region["value"] - min_val) / (max_val - min_val) if max_val > min_val else 0
-        color_idx = int(normalized * (len(colors) - 1))
-        color = colors[color_idx]
-        
-        rect = Rectangle(
-            (region["x"], region["y"]),
-            region["width"],
-            region["height"],
-            facecolor=color,
-            edgecolor="#111111",
-            linewidth=1.5,
-        )
-        ax.add_patch(rect)
-        
-        # Add value label
-        ax.text(
-            region["x"] + region["width"] / 2,
-            region["y"] + region["height"] / 2,
-            str(region["value"]),
-            ha="center",
-            va="center",
-            fontsize=10,
-            fontweight="bold",
-            color="white" if normalized > 0.5 else "#111111",
-        )
-    
+    # One collection for all regions, colored from the Du Bois light ramp,
+    # with value labels placed at each region's centroid
+    dubois_map(ax, polygons, values, palette="light", labels=True, autoscale=False)
+
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
     ax.set_title(
@@ -108,6 +85,6 @@ def _(DUBOIS_LIGHT_CYCLE, Rectangle, dubois_legend, np, plt):
     
     plt.tight_layout()
     fig
-    return ax, color, color_idx, colors, fig, max_val, min_val, normalized, rect, region, regions, values
+    return ax, fig, polygons, regions, values
 
 
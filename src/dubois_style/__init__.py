@@ -1,4 +1,13 @@
-"""A W.E.B. Du Bois–inspired Matplotlib style and color palette."""
+"""A W.E.B. Du Bois–inspired Matplotlib style and color palette.
+
+Palettes are plain Python data and are imported eagerly. Everything that
+needs matplotlib is resolved lazily through the module-level ``__getattr__``
+below, so ``from dubois_style import DUBOIS_CATEGORICAL_CYCLE`` never pays for
+``matplotlib.pyplot`` or a font cache scan.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 from .palettes import (
     DUBOIS_FAMILIES,
@@ -8,10 +17,126 @@ from .palettes import (
     DUBOIS_DARK_CYCLE,
     DUBOIS_CATEGORICAL_CYCLE,
 )
-from .style import (
-    apply_dubois_style,
-    dubois_legend,
-)
+
+if TYPE_CHECKING:
+    from .profiling import profile
+    from .ramps import dubois_ramp
+    from .analysis import (
+        categorical_cycle,
+        delta_e_matrix,
+        order_palette,
+        palette_coordinates,
+        simulate_cvd,
+    )
+    from .figure import DuboisFigure
+    from .pool import FigurePool
+    from .report import DuboisReport
+    from .plates import (
+        dubois_fan,
+        dubois_spiral,
+        dubois_stacked_bars,
+    )
+    from .charts import (
+        dubois_area,
+        dubois_line,
+        dubois_scatter,
+    )
+    from .downsample import (
+        lttb_downsample,
+        minmax_downsample,
+        pixel_buckets,
+    )
+    from .live import (
+        DuboisLiveChart,
+        RingBuffer,
+    )
+    from .metrics import (
+        TextMetricsCache,
+        text_extent,
+        text_extents,
+        text_metrics,
+    )
+    from .maps import (
+        dubois_map,
+        polygon_centroids,
+    )
+    from .cache import RenderCache
+    from .render import (
+        RenderJob,
+        RenderResult,
+        render_batch,
+    )
+    from .colormaps import (
+        DUBOIS_CMAP_NAMES,
+        get_dubois_cmap,
+        register_dubois_colormaps,
+    )
+    from .colors import (
+        PALETTES,
+        map_values,
+        palette_rgba,
+        palette_rgba8,
+    )
+    from .fonts import (
+        FontRegistry,
+        register_font_directory,
+        register_fonts,
+    )
+    from .style import (
+        apply_dubois_style,
+        build_dubois_rc,
+        dubois_legend,
+        dubois_style_context,
+    )
+
+# public name -> submodule that defines it (imported on first access)
+_LAZY_ATTRS = {
+    "apply_dubois_style": "style",
+    "build_dubois_rc": "style",
+    "dubois_legend": "style",
+    "dubois_style_context": "style",
+    "FontRegistry": "fonts",
+    "register_fonts": "fonts",
+    "register_font_directory": "fonts",
+    "PALETTES": "colors",
+    "palette_rgba": "colors",
+    "palette_rgba8": "colors",
+    "map_values": "colors",
+    "DUBOIS_CMAP_NAMES": "colormaps",
+    "get_dubois_cmap": "colormaps",
+    "register_dubois_colormaps": "colormaps",
+    "RenderJob": "render",
+    "RenderResult": "render",
+    "render_batch": "render",
+    "RenderCache": "cache",
+    "dubois_map": "maps",
+    "polygon_centroids": "maps",
+    "TextMetricsCache": "metrics",
+    "text_extent": "metrics",
+    "text_extents": "metrics",
+    "text_metrics": "metrics",
+    "DuboisLiveChart": "live",
+    "RingBuffer": "live",
+    "minmax_downsample": "downsample",
+    "lttb_downsample": "downsample",
+    "pixel_buckets": "downsample",
+    "dubois_line": "charts",
+    "dubois_area": "charts",
+    "dubois_scatter": "charts",
+    "dubois_spiral": "plates",
+    "dubois_fan": "plates",
+    "dubois_stacked_bars": "plates",
+    "DuboisReport": "report",
+    "FigurePool": "pool",
+    "DuboisFigure": "figure",
+    "palette_coordinates": "analysis",
+    "delta_e_matrix": "analysis",
+    "simulate_cvd": "analysis",
+    "order_palette": "analysis",
+    "categorical_cycle": "analysis",
+    "dubois_ramp": "ramps",
+    "profile": "profiling",
+}
 
 __all__ = [
     "DUBOIS_FAMILIES",
@@ -21,9 +146,64 @@ __all__ = [
     "DUBOIS_DARK_CYCLE",
     "DUBOIS_CATEGORICAL_CYCLE",
     "apply_dubois_style",
+    "build_dubois_rc",
+    "dubois_style_context",
     "dubois_legend",
+    "FontRegistry",
+    "register_fonts",
+    "register_font_directory",
+    "PALETTES",
+    "palette_rgba",
+    "palette_rgba8",
+    "map_values",
+    "DUBOIS_CMAP_NAMES",
+    "get_dubois_cmap",
+    "register_dubois_colormaps",
+    "RenderJob",
+    "RenderResult",
+    "render_batch",
+    "RenderCache",
+    "dubois_map",
+    "polygon_centroids",
+    "TextMetricsCache",
+    "text_extent",
+    "text_extents",
+    "text_metrics",
+    "DuboisLiveChart",
+    "RingBuffer",
+    "minmax_downsample",
+    "lttb_downsample",
+    "pixel_buckets",
+    "dubois_line",
+    "dubois_area",
+    "dubois_scatter",
+    "dubois_spiral",
+    "dubois_fan",
+    "dubois_stacked_bars",
+    "DuboisReport",
+    "FigurePool",
+    "DuboisFigure",
+    "palette_coordinates",
+    "delta_e_matrix",
+    "simulate_cvd",
+    "order_palette",
+    "categorical_cycle",
+    "dubois_ramp",
+    "profile",
 ]
 
 __version__ = "0.1.0"
 
 
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    # cache on the package so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,31 @@
+"""Helpers shared by the modules that reuse figures between charts."""
+
+_SUPLABELS = ("_suptitle", "_supxlabel", "_supylabel")
+
+
+def _clear_figure(fig, keep=()) -> None:
+    """
+    Remove every axes not in ``keep`` and all figure-level artists.
+
+    Subplot parameters go back to the rcParams defaults, unless the
+    figure's layout engine (e.g. ``"constrained"``) manages them.
+    """
+    import matplotlib as mpl
+
+    keep = set(keep)
+    for ax in list(fig.axes):
+        if ax not in keep:
+            ax.remove()
+    for artist in [*fig.texts, *fig.legends, *fig.images, *fig.lines,
+                   *fig.patches, *fig.artists]:
+        artist.remove()
+    for name in _SUPLABELS:
+        # suptitle() re-uses this Text if set; it was removed with fig.texts
+        setattr(fig, name, None)
+    engine = fig.get_layout_engine()
+    if engine is not None and not engine.adjust_compatible:
+        return
+    fig.subplots_adjust(**{
+        key: mpl.rcParams[f"figure.subplot.{key}"]
+        for key in ("left", "right", "bottom", "top", "wspace", "hspace")
+    })
@@ -0,0 +1,589 @@
+"""Perceptual analysis of palettes: color spaces, ΔE and category ordering.
+
+Colors are converted from sRGB to CIELAB or CAM02-UCS with vectorized NumPy
+code, once per palette: coordinates and distance matrices are memoized on
+the palette's colors and returned as read-only arrays.
+
+Distances can be taken under simulated color vision deficiency (Machado,
+Oliveira & Fernandes 2009, applied in linear RGB), and ``cvd="all"`` takes
+the worst case of normal vision and the three dichromacies, so a palette
+ordered on it stays distinguishable for most readers.
+
+:func:`categorical_cycle` picks and orders ``n`` colors for ``n`` series: an
+exact branch-and-bound search for the subset with the largest minimum
+pairwise distance, ordered so that every prefix is as well separated as a
+greedy farthest-first pass can make it. Without an explicit palette, the
+Du Bois families are expanded with lighter and darker steps in CAM02-UCS
+as needed, so 20 or more series need no hand tuning.
+
+CAM02-UCS uses the CIECAM02 viewing conditions customary for sRGB displays
+(D65 white, 64/π/5 cd/m² adapting luminance, 20% background, average
+surround).
+"""
+
+import math
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+
+from .colors import _palette_colors, _rgba_table
+from .palettes import DUBOIS_FAMILIES
+
+__all__ = [
+    "SPACES",
+    "METRICS",
+    "srgb_to_lab",
+    "lab_to_srgb",
+    "srgb_to_cam02ucs",
+    "cam02ucs_to_srgb",
+    "simulate_cvd",
+    "palette_coordinates",
+    "delta_e_matrix",
+    "order_palette",
+    "dubois_candidates",
+    "categorical_cycle",
+]
+
+SPACES = ("lab", "cam02ucs")
+METRICS = ("cam02ucs", "ciede2000", "cie76")
+CVD_KINDS = ("protan", "deutan", "tritan")
+
+# ---------------------------------------------------------------------------
+# sRGB <-> XYZ (D65) <-> CIELAB
+# ---------------------------------------------------------------------------
+
+_RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+_XYZ_TO_RGB = np.linalg.inv(_RGB_TO_XYZ)
+_WHITE = _RGB_TO_XYZ.sum(axis=1)  # D65, Y = 1
+
+
+def _to_linear(rgb: np.ndarray) -> np.ndarray:
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def _from_linear(lin: np.ndarray) -> np.ndarray:
+    # sign-symmetric, so out-of-gamut colors stay recognizable
+    mag = np.abs(lin)
+    return np.sign(lin) * np.where(mag <= 0.0031308, 12.92 * mag, 1.055 * mag ** (1 / 2.4) - 0.055)
+
+
+def srgb_to_lab(rgb) -> np.ndarray:
+    """``(..., 3)`` sRGB in [0, 1] to CIELAB (D65)."""
+    xyz = _to_linear(np.asarray(rgb, dtype=float)) @ _RGB_TO_XYZ.T / _WHITE
+    f = np.where(xyz > (6 / 29) ** 3, np.cbrt(xyz), xyz / (3 * (6 / 29) ** 2) + 4 / 29)
+    return np.stack(
+        (116 * f[..., 1] - 16, 500 * (f[..., 0] - f[..., 1]), 200 * (f[..., 1] - f[..., 2])),
+        axis=-1,
+    )
+
+
+def lab_to_srgb(lab) -> np.ndarray:
+    """CIELAB (D65) to ``(..., 3)`` sRGB; out-of-gamut values are not clipped."""
+    lab = np.asarray(lab, dtype=float)
+    fy = (lab[..., 0] + 16) / 116
+    f = np.stack((fy + lab[..., 1] / 500, fy, fy - lab[..., 2] / 200), axis=-1)
+    xyz = np.where(f > 6 / 29, f ** 3, 3 * (6 / 29) ** 2 * (f - 4 / 29)) * _WHITE
+    return _from_linear(xyz @ _XYZ_TO_RGB.T)
+
+
+# ---------------------------------------------------------------------------
+# CIECAM02 / CAM02-UCS
+# ---------------------------------------------------------------------------
+
+_M_CAT02 = np.array([
+    [0.7328, 0.4296, -0.1624],
+    [-0.7036, 1.6975, 0.0061],
+    [0.0030, 0.0136, 0.9834],
+])
+_M_HPE = np.array([
+    [0.38971, 0.68898, -0.07868],
+    [-0.22981, 1.18340, 0.04641],
+    [0.0, 0.0, 1.0],
+])
+
+
+def _viewing_conditions(white=_WHITE * 100, y_b=20.0, l_a=64 / np.pi / 5,
+                        f=1.0, c=0.69, n_c=1.0) -> dict:
+    rgb_w = _M_CAT02 @ white
+    d = np.clip(f * (1 - (1 / 3.6) * np.exp((-l_a - 42) / 92)), 0, 1)
+    d_rgb = d * white[1] / rgb_w + 1 - d
+    k = 1 / (5 * l_a + 1)
+    f_l = 0.2 * k ** 4 * 5 * l_a + 0.1 * (1 - k ** 4) ** 2 * np.cbrt(5 * l_a)
+    n = y_b / white[1]
+    z = 1.48 + np.sqrt(n)
+    n_bb = 0.725 * n ** -0.2
+    to_hpe = _M_HPE @ np.linalg.inv(_M_CAT02)
+    vc = dict(d_rgb=d_rgb, f_l=f_l, n=n, z=z, n_bb=n_bb, c=c, n_c=n_c,
+              to_hpe=to_hpe, from_hpe=np.linalg.inv(to_hpe),
+              from_cat02=np.linalg.inv(_M_CAT02))
+    rgb_aw = _compress(to_hpe @ (d_rgb * rgb_w), f_l)
+    vc["a_w"] = (rgb_aw @ [2, 1, 1 / 20] - 0.305) * n_bb
+    return vc
+
+
+def _compress(rgb: np.ndarray, f_l: float) -> np.ndarray:
+    x = (f_l * np.abs(rgb) / 100) ** 0.42
+    return np.sign(rgb) * 400 * x / (x + 27.13) + 0.1
+
+
+_VC = _viewing_conditions()
+
+
+def srgb_to_cam02ucs(rgb) -> np.ndarray:
+    """``(..., 3)`` sRGB in [0, 1] to CAM02-UCS ``J'a'b'``."""
+    vc = _VC
+    xyz = _to_linear(np.asarray(rgb, dtype=float)) @ _RGB_TO_XYZ.T * 100
+    rgb_c = (xyz @ _M_CAT02.T) * vc["d_rgb"]
+    r, g, b = np.moveaxis(_compress(rgb_c @ vc["to_hpe"].T, vc["f_l"]), -1, 0)
+
+    a = r - 12 * g / 11 + b / 11
+    bb = (r + g - 2 * b) / 9
+    h = np.arctan2(bb, a)
+    e_t = 0.25 * (np.cos(h + 2) + 3.8)
+    j = 100 * np.clip((2 * r + g + b / 20 - 0.305) * vc["n_bb"] / vc["a_w"], 0, None) ** (
+        vc["c"] * vc["z"]
+    )
+    t = (50000 / 13 * vc["n_c"] * vc["n_bb"] * e_t * np.hypot(a, bb)) / (r + g + 21 / 20 * b)
+    chroma = t ** 0.9 * np.sqrt(j / 100) * (1.64 - 0.29 ** vc["n"]) ** 0.73
+    m = chroma * vc["f_l"] ** 0.25
+
+    m_ucs = np.log1p(0.0228 * m) / 0.0228
+    return np.stack(
+        (1.7 * j / (1 + 0.007 * j), m_ucs * np.cos(h), m_ucs * np.sin(h)), axis=-1
+    )
+
+
+def cam02ucs_to_srgb(jab) -> np.ndarray:
+    """CAM02-UCS ``J'a'b'`` to ``(..., 3)`` sRGB; out-of-gamut values are not clipped."""
+    vc = _VC
+    jab = np.asarray(jab, dtype=float)
+    j_ucs, a_ucs, b_ucs = np.moveaxis(jab, -1, 0)
+    j = j_ucs / (1.7 - 0.007 * j_ucs)
+    h = np.arctan2(b_ucs, a_ucs)
+    m = np.expm1(0.0228 * np.hypot(a_ucs, b_ucs)) / 0.0228
+    chroma = m / vc["f_l"] ** 0.25
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (chroma / (np.sqrt(j / 100) * (1.64 - 0.29 ** vc["n"]) ** 0.73)) ** (1 / 0.9)
+        t = np.nan_to_num(t)
+        e_t = 0.25 * (np.cos(h + 2) + 3.8)
+        p1 = 50000 / 13 * vc["n_c"] * vc["n_bb"] * e_t / t
+        p2 = vc["a_w"] * (j / 100) ** (1 / (vc["c"] * vc["z"])) / vc["n_bb"] + 0.305
+        p3 = 21 / 20
+        sin, cos = np.sin(h), np.cos(h)
+        use_sin = np.abs(sin) >= np.abs(cos)
+        b_from_sin = p2 * (2 + p3) * (460 / 1403) / (
+            p1 / sin + (2 + p3) * (220 / 1403) * (cos / sin) - 27 / 1403 + p3 * (6300 / 1403)
+        )
+        a_from_cos = p2 * (2 + p3) * (460 / 1403) / (
+            p1 / cos + (2 + p3) * (220 / 1403) - (27 / 1403 - p3 * (6300 / 1403)) * (sin / cos)
+        )
+        a = np.where(use_sin, b_from_sin * cos / sin, a_from_cos)
+        b = np.where(use_sin, b_from_sin, a_from_cos * sin / cos)
+    achromatic = t == 0
+    a = np.where(achromatic, 0.0, a)
+    b = np.where(achromatic, 0.0, b)
+
+    rgb_a = np.stack((
+        460 * p2 + 451 * a + 288 * b,
+        460 * p2 - 891 * a - 261 * b,
+        460 * p2 - 220 * a - 6300 * b,
+    ), axis=-1) / 1403 - 0.1
+    rgb_p = np.sign(rgb_a) * 100 / vc["f_l"] * (
+        27.13 * np.abs(rgb_a) / (400 - np.abs(rgb_a))
+    ) ** (1 / 0.42)
+    rgb = (rgb_p @ vc["from_hpe"].T) / vc["d_rgb"]
+    xyz = rgb @ vc["from_cat02"].T / 100
+    return _from_linear(xyz @ _XYZ_TO_RGB.T)
+
+
+_FROM_SRGB = {"lab": srgb_to_lab, "cam02ucs": srgb_to_cam02ucs}
+_TO_SRGB = {"lab": lab_to_srgb, "cam02ucs": cam02ucs_to_srgb}
+
+# ---------------------------------------------------------------------------
+# Color vision deficiency
+# ---------------------------------------------------------------------------
+
+# Machado et al. (2009), severity 1.0, for linear RGB
+_CVD_MATRICES = {
+    "protan": np.array([
+        [0.152286, 1.052583, -0.204868],
+        [0.114503, 0.786281, 0.099216],
+        [-0.003882, -0.048116, 1.051998],
+    ]),
+    "deutan": np.array([
+        [0.367322, 0.860646, -0.227968],
+        [0.280085, 0.672501, 0.047413],
+        [-0.011820, 0.042940, 0.968881],
+    ]),
+    "tritan": np.array([
+        [1.255528, -0.076749, -0.178779],
+        [-0.078411, 0.930809, 0.147602],
+        [0.004733, 0.691367, 0.303900],
+    ]),
+}
+
+
+def simulate_cvd(rgb, kind: str, severity: float = 1.0) -> np.ndarray:
+    """
+    How ``(..., 3)`` sRGB colors appear with a color vision deficiency.
+
+    Parameters
+    ----------
+    rgb : array_like
+        sRGB in [0, 1].
+    kind : {"protan", "deutan", "tritan"}
+        Deficient cone type.
+    severity : float, default 1.0
+        1 simulates dichromacy; smaller values blend the matrix linearly
+        toward normal vision, an approximation of anomalous trichromacy.
+    """
+    try:
+        matrix = _CVD_MATRICES[kind]
+    except KeyError:
+        raise ValueError(f"unknown cvd kind {kind!r}; expected one of {CVD_KINDS}") from None
+    matrix = severity * matrix + (1 - severity) * np.eye(3)
+    lin = _to_linear(np.asarray(rgb, dtype=float)) @ matrix.T
+    return _from_linear(np.clip(lin, 0.0, 1.0))
+
+
+# ---------------------------------------------------------------------------
+# Cached palette coordinates and distances
+# ---------------------------------------------------------------------------
+
+
+def _check(value, allowed, what):
+    if value not in allowed:
+        raise ValueError(f"unknown {what} {value!r}; expected one of {allowed}")
+
+
+def _cvd_list(cvd) -> tuple:
+    if cvd is None:
+        return (None,)
+    if cvd == "all":
+        return (None, *CVD_KINDS)
+    _check(cvd, CVD_KINDS + ("all",), "cvd")
+    return (cvd,)
+
+
+@lru_cache(maxsize=256)
+def _coordinates(colors: tuple[str, ...], space: str, cvd: str | None) -> np.ndarray:
+    rgb = _rgba_table(colors)[:, :3]
+    if cvd is not None:
+        rgb = simulate_cvd(rgb, cvd)
+    coords = _FROM_SRGB[space](rgb)
+    coords.setflags(write=False)
+    return coords
+
+
+def palette_coordinates(
+    palette: str | Sequence[str] = "categorical",
+    space: str = "cam02ucs",
+    cvd: str | None = None,
+) -> np.ndarray:
+    """
+    Perceptual coordinates of a palette, as a read-only ``(N, 3)`` array.
+
+    Parameters
+    ----------
+    palette : str | Sequence[str], default "categorical"
+        A name from :data:`~dubois_style.colors.PALETTES` or colors.
+    space : {"cam02ucs", "lab"}, default "cam02ucs"
+        ``J'a'b'`` or ``L*a*b*``.
+    cvd : {None, "protan", "deutan", "tritan"}, default None
+        Convert the colors as seen with this deficiency.
+    """
+    _check(space, SPACES, "space")
+    _check(cvd, (None, *CVD_KINDS), "cvd")
+    return _coordinates(_palette_colors(palette), space, cvd)
+
+
+def _ciede2000(lab1: np.ndarray, lab2: np.ndarray) -> np.ndarray:
+    """CIEDE2000 between broadcastable CIELAB arrays."""
+    l1, a1, b1 = np.moveaxis(lab1, -1, 0)
+    l2, a2, b2 = np.moveaxis(lab2, -1, 0)
+    c_bar = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2
+    g = 0.5 * (1 - np.sqrt(c_bar ** 7 / (c_bar ** 7 + 25.0 ** 7)))
+    a1p, a2p = (1 + g) * a1, (1 + g) * a2
+    c1p, c2p = np.hypot(a1p, b1), np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+
+    dl = l2 - l1
+    dc = c2p - c1p
+    dh = h2p - h1p
+    dh = np.where(dh > 180, dh - 360, np.where(dh < -180, dh + 360, dh))
+    dh = np.where(c1p * c2p == 0, 0.0, dh)
+    dh_big = 2 * np.sqrt(c1p * c2p) * np.sin(np.radians(dh / 2))
+
+    l_bar = (l1 + l2) / 2
+    cp_bar = (c1p + c2p) / 2
+    h_sum = h1p + h2p
+    hp_bar = np.where(
+        c1p * c2p == 0, h_sum,
+        np.where(np.abs(h1p - h2p) <= 180, h_sum / 2,
+                 np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2)),
+    )
+    t = (1 - 0.17 * np.cos(np.radians(hp_bar - 30)) + 0.24 * np.cos(np.radians(2 * hp_bar))
+         + 0.32 * np.cos(np.radians(3 * hp_bar + 6)) - 0.20 * np.cos(np.radians(4 * hp_bar - 63)))
+    d_theta = 30 * np.exp(-(((hp_bar - 275) / 25) ** 2))
+    r_c = 2 * np.sqrt(cp_bar ** 7 / (cp_bar ** 7 + 25.0 ** 7))
+    s_l = 1 + 0.015 * (l_bar - 50) ** 2 / np.sqrt(20 + (l_bar - 50) ** 2)
+    s_c = 1 + 0.045 * cp_bar
+    s_h = 1 + 0.015 * cp_bar * t
+    r_t = -np.sin(np.radians(2 * d_theta)) * r_c
+    return np.sqrt(
+        (dl / s_l) ** 2 + (dc / s_c) ** 2 + (dh_big / s_h) ** 2
+        + r_t * (dc / s_c) * (dh_big / s_h)
+    )
+
+
+def _pairwise(coords: np.ndarray, metric: str) -> np.ndarray:
+    if metric == "ciede2000":
+        return _ciede2000(coords[:, None, :], coords[None, :, :])
+    diff = coords[:, None, :] - coords[None, :, :]
+    return np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+
+
+@lru_cache(maxsize=256)
+def _delta_e(colors: tuple[str, ...], metric: str, cvd) -> np.ndarray:
+    space = "cam02ucs" if metric == "cam02ucs" else "lab"
+    matrix = None
+    for kind in _cvd_list(cvd):
+        d = _pairwise(_coordinates(colors, space, kind), metric)
+        matrix = d if matrix is None else np.minimum(matrix, d)
+    matrix.setflags(write=False)
+    return matrix
+
+
+def delta_e_matrix(
+    palette: str | Sequence[str] = "categorical",
+    *,
+    metric: str = "cam02ucs",
+    cvd: str | None = None,
+) -> np.ndarray:
+    """
+    Pairwise color differences of a palette, as a read-only ``(N, N)`` array.
+
+    Parameters
+    ----------
+    palette : str | Sequence[str], default "categorical"
+        A name from :data:`~dubois_style.colors.PALETTES` or colors.
+    metric : {"cam02ucs", "ciede2000", "cie76"}, default "cam02ucs"
+        Euclidean distance in CAM02-UCS (ΔE'), CIEDE2000, or Euclidean
+        distance in CIELAB.
+    cvd : {None, "protan", "deutan", "tritan", "all"}, default None
+        Measure the colors as seen with this deficiency; ``"all"`` takes,
+        per pair, the smallest difference of normal vision and the three
+        deficiencies.
+
+    Examples
+    --------
+    >>> d = delta_e_matrix("categorical", cvd="all")
+    >>> d[np.triu_indices_from(d, 1)].min()   # the palette's weakest pair
+    """
+    _check(metric, METRICS, "metric")
+    _cvd_list(cvd)
+    return _delta_e(_palette_colors(palette), metric, cvd)
+
+
+# ---------------------------------------------------------------------------
+# Ordering and selection
+# ---------------------------------------------------------------------------
+
+
+def _greedy_order(d: np.ndarray, start: int | None, members=None) -> list[int]:
+    """Farthest-first order: each next color maximizes its distance to the placed ones."""
+    members = np.arange(len(d)) if members is None else np.asarray(members)
+    sub = d[np.ix_(members, members)]
+    if start is None:
+        # begin with the most separated pair
+        i, j = np.unravel_index(np.argmax(sub), sub.shape)
+        order = [int(i), int(j)] if len(members) > 1 else [0]
+    else:
+        order = [int(np.flatnonzero(members == start)[0])]
+    nearest = sub[order].min(axis=0)
+    nearest[order] = -np.inf
+    while len(order) < len(members):
+        k = int(np.argmax(nearest))
+        order.append(k)
+        np.minimum(nearest, sub[k], out=nearest)
+        nearest[order] = -np.inf
+    return [int(members[k]) for k in order]
+
+
+def _min_distance(d: np.ndarray, members) -> float:
+    members = list(members)
+    if len(members) < 2:
+        return np.inf
+    sub = d[np.ix_(members, members)]
+    return float(sub[np.triu_indices(len(members), 1)].min())
+
+
+def _best_subset(d: np.ndarray, n: int, incumbent: list[int], max_nodes: int):
+    """
+    Branch and bound for the ``n`` colors with the largest minimum distance.
+
+    Any improving set must have every pair above the incumbent's minimum,
+    so candidates are filtered down to those compatible with everything
+    chosen so far; a branch ends when too few candidates are left. Returns
+    the best set found and whether the search finished within
+    ``max_nodes``.
+    """
+    best = list(incumbent)
+    best_value = _min_distance(d, best)
+    nodes = 0
+
+    def search(chosen, candidates, current):
+        nonlocal best, best_value, nodes
+        nodes += 1
+        if nodes > max_nodes:
+            return
+        if len(chosen) == n:
+            if current > best_value:
+                best, best_value = list(chosen), current
+            return
+        need = n - len(chosen)
+        for pos, c in enumerate(candidates):
+            if len(candidates) - pos < need or nodes > max_nodes:
+                return
+            rest = candidates[pos + 1:]
+            rest = rest[d[c, rest] > best_value]
+            if len(rest) < need - 1:
+                continue
+            value = min(current, float(d[c, chosen].min())) if chosen else current
+            if value <= best_value:
+                continue
+            search(chosen + [c], rest, value)
+
+    search([], np.arange(len(d)), np.inf)
+    return best, best_value, nodes <= max_nodes
+
+
+def order_palette(
+    palette: str | Sequence[str] = "categorical",
+    *,
+    metric: str = "cam02ucs",
+    cvd: str | None = "all",
+    start: int | None = None,
+) -> list[str]:
+    """
+    Reorder a palette so that every prefix is as distinguishable as possible.
+
+    A greedy farthest-first pass: each color added is the one farthest from
+    its nearest already-placed color.
+
+    Parameters
+    ----------
+    palette : str | Sequence[str], default "categorical"
+        Palette name or colors.
+    metric, cvd
+        As for :func:`delta_e_matrix`; ``cvd`` defaults to ``"all"``.
+    start : int | None, default None
+        Index of the color to begin with; by default the most separated
+        pair goes first.
+
+    Returns
+    -------
+    list[str]
+    """
+    colors = _palette_colors(palette)
+    d = delta_e_matrix(colors, metric=metric, cvd=cvd)
+    return [colors[i] for i in _greedy_order(d, start)]
+
+
+def _in_gamut(values: np.ndarray) -> np.ndarray:
+    return np.all((values >= -1e-6) & (values <= 1 + 1e-6), axis=-1)
+
+
+@lru_cache(maxsize=32)
+def _dubois_candidates(levels: int) -> tuple[str, ...]:
+    from matplotlib.colors import to_hex
+
+    if levels <= 2:
+        return tuple(c for family in DUBOIS_FAMILIES.values()
+                     for c in (family["light"], family["dark"]))
+    out = []
+    for family in DUBOIS_FAMILIES.values():
+        stops = srgb_to_cam02ucs(_rgba_table((family["dark"], family["light"]))[:, :3])
+        # the family's lightness direction, extended past both stops
+        t = np.linspace(-0.75, 1.75, levels)
+        jab = stops[0] + t[:, None] * (stops[1] - stops[0])
+        rgb = cam02ucs_to_srgb(jab)
+        keep = _in_gamut(rgb)
+        out.extend(to_hex(np.clip(c, 0, 1)) for c in rgb[keep])
+    return tuple(dict.fromkeys(out))
+
+
+def dubois_candidates(n: int = 14) -> list[str]:
+    """
+    Du Bois family colors to choose ``n`` categorical colors from.
+
+    Up to 14 colors these are the light and dark stop of every family.
+    Beyond that each family contributes evenly spaced steps along its
+    light–dark line in CAM02-UCS, extended past both stops and limited to
+    the sRGB gamut, about ``n / 7 + 2`` per family.
+    """
+    if n <= 2 * len(DUBOIS_FAMILIES):
+        return list(_dubois_candidates(2))
+    return list(_dubois_candidates(math.ceil(n / len(DUBOIS_FAMILIES)) + 2))
+
+
+def categorical_cycle(
+    n: int,
+    palette: str | Sequence[str] | None = None,
+    *,
+    metric: str = "cam02ucs",
+    cvd: str | None = "all",
+    method: str = "auto",
+    max_nodes: int = 20_000,
+) -> list[str]:
+    """
+    ``n`` well-separated colors for ``n`` categories, in cycle order.
+
+    The subset of ``palette`` with the largest minimum pairwise distance
+    is found by branch and bound (``method="exact"``; ``"auto"`` does the
+    same but stops after ``max_nodes`` search nodes with the best set found
+    so far) or taken from the greedy order (``"greedy"``). The chosen colors
+    are then put in farthest-first order, so the first few series are the
+    easiest to tell apart.
+
+    Parameters
+    ----------
+    n : int
+        Number of categories.
+    palette : str | Sequence[str] | None, default None
+        Candidate colors; by default :func:`dubois_candidates` for ``n``.
+    metric, cvd
+        As for :func:`delta_e_matrix`; ``cvd`` defaults to ``"all"``.
+    method : {"auto", "exact", "greedy"}, default "auto"
+        Search strategy.
+    max_nodes : int, default 20_000
+        Node budget of the ``"auto"`` search.
+
+    Returns
+    -------
+    list[str]
+
+    Examples
+    --------
+    >>> colors = categorical_cycle(24)
+    >>> ax.set_prop_cycle(color=colors)
+    """
+    _check(method, ("auto", "exact", "greedy"), "method")
+    colors = _palette_colors(dubois_candidates(n) if palette is None else palette)
+    if not 0 < n <= len(colors):
+        raise ValueError(f"n must be between 1 and {len(colors)} for this palette")
+    d = delta_e_matrix(colors, metric=metric, cvd=cvd)
+    greedy = _greedy_order(d, None)[:n]
+    if method == "greedy" or n < 3 or n == len(colors):
+        chosen = greedy
+    else:
+        budget = max_nodes if method == "auto" else math.inf
+        chosen, _, _ = _best_subset(d, n, sorted(greedy), budget)
+    return [colors[i] for i in _greedy_order(d, None, members=sorted(chosen))]
@@ -0,0 +1,145 @@
+"""A static, JSON-serializable snapshot of the Du Bois style.
+
+Environments that can't install the package, such as the marimo gallery
+exported to WebAssembly, load this bundle instead: the palettes as plain
+data and the validated rc dictionary of every style option set, built once
+from the package source. Applying a style from the bundle is a single
+``rcParams.update`` with nothing left to compute.
+
+All values are JSON types. The one exception to matplotlib's own rc value
+types is ``axes.prop_cycle``, stored as ``{"color": [...]}``; pass it to
+``cycler(**value)`` when loading.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+from pathlib import Path
+
+from .palettes import (
+    DUBOIS_CATEGORICAL_CYCLE,
+    DUBOIS_COLORS_DARK,
+    DUBOIS_COLORS_LIGHT,
+    DUBOIS_DARK_CYCLE,
+    DUBOIS_FAMILIES,
+    DUBOIS_LIGHT_CYCLE,
+)
+
+__all__ = [
+    "bundle_key",
+    "wasm_bundle",
+    "write_wasm_bundle",
+]
+
+BUNDLE_VERSION = 1
+
+
+def bundle_key(
+    *,
+    cycle: str = "light",
+    show_x_axis: bool = False,
+    show_y_axis: bool = False,
+    use_contrast_colors: bool = False,
+) -> str:
+    """
+    Key of one option set in the bundle's ``"rc"`` table.
+
+    ``"<cycle>,<contrast>,<x axis>,<y axis>"`` with the flags as 0 or 1,
+    e.g. ``"dark,1,1,0"``; simple enough to rebuild without the package.
+    """
+    if cycle not in ("light", "dark"):
+        raise ValueError("cycle must be 'light' or 'dark'")
+    flags = (use_contrast_colors, show_x_axis, show_y_axis)
+    return ",".join([cycle, *(str(int(bool(flag))) for flag in flags)])
+
+
+def _json_rc(rc) -> dict:
+    """``rc`` with every value as a JSON type."""
+    out = {}
+    for key, value in rc.items():
+        if key == "axes.prop_cycle":
+            value = {name: list(values) for name, values in value.by_key().items()}
+        elif isinstance(value, tuple):
+            value = list(value)
+        out[key] = value
+    return out
+
+
+def wasm_bundle(*, base_font: str | list[str] = "DejaVu Sans") -> dict:
+    """
+    The palettes and every prebuilt rc dictionary, as JSON-ready data.
+
+    Parameters
+    ----------
+    base_font : str | list[str], default "DejaVu Sans"
+        Font family chain baked into every rc dictionary.
+
+    Returns
+    -------
+    dict
+        ``version``, ``families``, ``colors`` (``"light"``/``"dark"``),
+        ``cycles`` (``"light"``/``"dark"``/``"categorical"``) and ``rc``,
+        a table from :func:`bundle_key` to rcParams.
+
+    Examples
+    --------
+    Loading it without the package::
+
+        rc = dict(bundle["rc"]["light,1,1,1"])
+        rc["axes.prop_cycle"] = cycler(**rc["axes.prop_cycle"])
+        matplotlib.rcParams.update(rc)
+    """
+    from .style import build_dubois_rc
+
+    rc = {}
+    for cycle, contrast, show_x, show_y in itertools.product(
+        ("light", "dark"), (False, True), (False, True), (False, True)
+    ):
+        options = dict(cycle=cycle, use_contrast_colors=contrast,
+                       show_x_axis=show_x, show_y_axis=show_y)
+        rc[bundle_key(**options)] = _json_rc(build_dubois_rc(**options, base_font=base_font))
+
+    return {
+        "version": BUNDLE_VERSION,
+        "families": DUBOIS_FAMILIES,
+        "colors": {"light": DUBOIS_COLORS_LIGHT, "dark": DUBOIS_COLORS_DARK},
+        "cycles": {
+            "light": DUBOIS_LIGHT_CYCLE,
+            "dark": DUBOIS_DARK_CYCLE,
+            "categorical": DUBOIS_CATEGORICAL_CYCLE,
+        },
+        "rc": rc,
+    }
+
+
+def write_wasm_bundle(path: str | os.PathLike, **kwargs) -> str:
+    """
+    Write :func:`wasm_bundle` as compact JSON, only if its content changed.
+
+    An unchanged bundle keeps its file (and mtime), so build caches keyed on
+    it stay valid.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Output file.
+    **kwargs
+        Passed to :func:`wasm_bundle`.
+
+    Returns
+    -------
+    str
+        SHA-256 of the written content.
+    """
+    data = json.dumps(wasm_bundle(**kwargs), separators=(",", ":"), sort_keys=True).encode()
+    digest = hashlib.sha256(data).hexdigest()
+    path = Path(path)
+    try:
+        unchanged = path.read_bytes() == data
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return digest
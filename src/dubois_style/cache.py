@@ -0,0 +1,297 @@
+"""Content-addressed on-disk cache of rendered figures.
+
+A rendered figure is identified by a hash of everything that can change its
+bytes: the draw callable (including its bytecode) and its arguments, the Du
+Bois style options, the custom font files in play, the matplotlib version,
+the output format, dpi and savefig options. A cache hit returns the stored
+bytes without creating a figure or touching Agg.
+
+Entries are evicted least-recently-used once the cache exceeds ``max_bytes``.
+"""
+
+import hashlib
+import io
+import os
+import pickle
+import threading
+import types
+from pathlib import Path
+
+__all__ = [
+    "RenderCache",
+]
+
+_KEY_VERSION = b"dubois-render-cache/1"
+
+
+def _feed(h, obj) -> None:
+    """Feed a canonical encoding of ``obj`` into hash object ``h``."""
+    if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        h.update(b"bytes:%d:" % len(obj))
+        h.update(obj)
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}[{len(obj)}](".encode())
+        for item in obj:
+            _feed(h, item)
+        h.update(b")")
+    elif isinstance(obj, dict):
+        h.update(f"dict[{len(obj)}](".encode())
+        for key in sorted(obj, key=repr):
+            _feed(h, key)
+            _feed(h, obj[key])
+        h.update(b")")
+    elif isinstance(obj, (set, frozenset)):
+        h.update(f"set[{len(obj)}](".encode())
+        for item in sorted(obj, key=repr):
+            _feed(h, item)
+        h.update(b")")
+    elif isinstance(obj, os.PathLike):
+        _feed(h, os.fspath(obj))
+    elif isinstance(obj, types.CodeType):
+        h.update(obj.co_code)
+        _feed(h, obj.co_names)
+        _feed(h, tuple(c for c in obj.co_consts if not isinstance(c, types.CodeType)))
+        for const in obj.co_consts:
+            if isinstance(const, types.CodeType):
+                _feed(h, const)
+    elif isinstance(obj, types.FunctionType):
+        # identity plus bytecode: editing a draw function invalidates its entries
+        _feed(h, (obj.__module__, obj.__qualname__))
+        _feed(h, obj.__code__)
+        _feed(h, obj.__defaults__)
+        _feed(h, obj.__kwdefaults__)
+        # closures over different data are different draw functions
+        for name, cell in zip(obj.__code__.co_freevars, obj.__closure__ or ()):
+            _feed_cell(h, obj, name, cell)
+    elif hasattr(obj, "func") and hasattr(obj, "args") and hasattr(obj, "keywords"):
+        # functools.partial
+        _feed(h, (obj.func, obj.args, obj.keywords))
+    elif hasattr(obj, "__array_interface__") and hasattr(obj, "tobytes"):
+        # numpy arrays (and array-likes exposing the same protocol)
+        h.update(f"ndarray:{obj.dtype.str}:{obj.shape};".encode())
+        if obj.dtype.hasobject:
+            # tobytes() would hash object pointers, not the objects
+            for item in obj.ravel().tolist():
+                _feed(h, item)
+        else:
+            h.update(obj.tobytes())
+    else:
+        h.update(f"pickle:{type(obj).__qualname__};".encode())
+        h.update(pickle.dumps(obj, protocol=4))
+
+
+def _feed_cell(h, func, name: str, cell) -> None:
+    h.update(f"cell:{name};".encode())
+    try:
+        contents = cell.cell_contents
+    except ValueError:
+        h.update(b"empty;")
+        return
+    if contents is func:
+        # a recursive inner function refers to itself
+        h.update(b"self;")
+        return
+    try:
+        _feed(h, contents)
+    except (pickle.PicklingError, TypeError, AttributeError) as exc:
+        raise TypeError(
+            f"can't build a cache key for {func.__qualname__}: the variable "
+            f"{name!r} it closes over can't be hashed ({exc})"
+        ) from exc
+
+
+def _font_fingerprint(style: dict) -> list:
+    """(path, mtime, size) of every custom font that can affect a render."""
+    from .fonts import font_registry
+
+    paths = set(font_registry.registered)
+    paths.update(os.path.abspath(os.fspath(p)) for p in style.get("custom_font_paths") or ())
+    keys = []
+    for path in sorted(paths):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        keys.append((path, stat.st_mtime_ns, stat.st_size))
+    return keys
+
+
+class RenderCache:
+    """
+    Size-bounded, content-addressed cache of rendered figure bytes.
+
+    Parameters
+    ----------
+    directory : str | os.PathLike
+        Where entries are stored. Safe to share between processes: writes go
+        through a temporary file and an atomic rename.
+    max_bytes : int, default 512 MiB
+        Total size above which the least recently used entries are evicted.
+
+    Examples
+    --------
+    >>> cache = RenderCache("~/.cache/dubois-renders", max_bytes=2**30)
+    >>> png = cache.get_or_render(bar_chart, values, fmt="png", dpi=150,
+    ...                           style={"cycle": "dark"})
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int = 512 * 2**20):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._size = sum(p.stat().st_size for p in self._entries())
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate total size of stored entries."""
+        return self._size
+
+    def key(
+        self,
+        draw,
+        args: tuple = (),
+        kwargs: dict | None = None,
+        *,
+        style: dict | None = None,
+        fmt: str = "png",
+        dpi: float | None = None,
+        figsize: tuple[float, float] | None = None,
+        savefig_kwargs: dict | None = None,
+    ) -> str:
+        """
+        Return the content hash identifying one rendered output.
+
+        ``draw`` contributes its module, qualified name, bytecode and the
+        values of the variables it closes over, so editing it invalidates
+        its entries; helpers it calls are identified by name only. NumPy
+        arrays are hashed by dtype, shape and raw bytes, other unknown
+        objects by their pickle.
+
+        Raises
+        ------
+        TypeError
+            If ``draw`` closes over a value that can't be hashed or pickled.
+        """
+        import matplotlib
+
+        style = style or {}
+        h = hashlib.sha256(_KEY_VERSION)
+        _feed(h, matplotlib.__version__)
+        _feed(h, (draw, tuple(args), kwargs or {}))
+        _feed(h, style)
+        _feed(h, _font_fingerprint(style))
+        _feed(h, (fmt.lower().lstrip("."), dpi, figsize, savefig_kwargs or {}))
+        return h.hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Return stored bytes for ``key`` (and mark it recently used)."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        # mtime doubles as the LRU timestamp
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``, evicting old entries if needed."""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        with self._lock:
+            try:
+                # an overwritten entry no longer counts
+                self._size -= path.stat().st_size
+            except FileNotFoundError:
+                pass
+            os.replace(tmp, path)
+            self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def get_or_render(
+        self,
+        draw,
+        *args,
+        fmt: str = "png",
+        dpi: float | None = None,
+        figsize: tuple[float, float] | None = None,
+        style: dict | None = None,
+        savefig_kwargs: dict | None = None,
+        **kwargs,
+    ) -> bytes:
+        """
+        Return cached bytes for a figure, rendering and storing it on a miss.
+
+        ``draw(fig, *args, **kwargs)`` follows the
+        :class:`~dubois_style.render.RenderJob` contract. On a miss the figure
+        is rendered inside :func:`~dubois_style.dubois_style_context` with
+        ``style`` applied.
+        """
+        key = self.key(draw, args, kwargs, style=style, fmt=fmt, dpi=dpi,
+                       figsize=figsize, savefig_kwargs=savefig_kwargs)
+        data = self.get(key)
+        if data is not None:
+            return data
+
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        from .style import dubois_style_context
+
+        with dubois_style_context(**(style or {})):
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+            returned = draw(fig, *args, **kwargs)
+            if returned is not None:
+                fig = returned
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=fmt, dpi=dpi if dpi is not None else "figure",
+                        **(savefig_kwargs or {}))
+        data = buffer.getvalue()
+        self.put(key, data)
+        return data
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            for path in self._entries():
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def _entries(self):
+        return (p for p in self.directory.glob("??/*") if not p.name.endswith(".tmp"))
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        # evict down to 90% so a full cache doesn't rescan on every put
+        target = self.max_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._size = total
@@ -0,0 +1,273 @@
+"""Du Bois chart helpers that stay fast on very large inputs.
+
+These wrap the usual ``Axes`` calls used in the gallery (``plot``,
+``fill_between``, ``scatter``) and reduce the data to what can actually be
+seen at the target resolution before matplotlib builds any artists.
+"""
+
+import numpy as np
+
+from .downsample import lttb_downsample, minmax_downsample, pixel_buckets
+
+__all__ = [
+    "dubois_line",
+    "dubois_area",
+    "dubois_scatter",
+]
+
+
+def _reduce(ax, x, y, method: str, dpi: float | None, max_points: int | None):
+    """Indices to keep for ``method`` at the axes' pixel resolution."""
+    buckets = pixel_buckets(ax, dpi)
+    if method == "minmax":
+        if max_points is not None:
+            buckets = min(buckets, max(1, max_points // 4))
+        return minmax_downsample(x, y, buckets)
+    if method == "lttb":
+        return lttb_downsample(x, y, max_points or 2 * buckets)
+    if method == "none":
+        return slice(None)
+    raise ValueError("method must be 'minmax', 'lttb' or 'none'")
+
+
+def dubois_line(
+    ax,
+    x,
+    y,
+    *,
+    method: str = "minmax",
+    dpi: float | None = None,
+    max_points: int | None = None,
+    **kwargs,
+):
+    """
+    Plot a long series as a line after pixel-aware downsampling.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Axes to draw on; its current size sets the pixel budget.
+    x, y : array_like
+        Sorted x values (numeric or datetime64) and y values.
+    method : {"minmax", "lttb", "none"}, default "minmax"
+        ``"minmax"`` keeps each pixel column's first, last, lowest and
+        highest point (M4), so every column spans the same range as the
+        full-resolution line at the target resolution. ``"lttb"``
+        keeps about two points per pixel column chosen for visual shape.
+    dpi : float | None, default None
+        Resolution the figure will be saved at; defaults to the figure dpi.
+    max_points : int | None, default None
+        Upper bound on points kept.
+    **kwargs
+        Passed to ``ax.plot``.
+
+    Returns
+    -------
+    matplotlib.lines.Line2D
+
+    Examples
+    --------
+    >>> fig, ax = plt.subplots(figsize=(10, 4))
+    >>> dubois_line(ax, timestamps, readings, label="Sensor A", dpi=150)
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    keep = _reduce(ax, x, y, method, dpi, max_points)
+    (line,) = ax.plot(x[keep], y[keep], **kwargs)
+    return line
+
+
+def dubois_area(
+    ax,
+    x,
+    y,
+    *,
+    baseline=0.0,
+    method: str = "minmax",
+    dpi: float | None = None,
+    max_points: int | None = None,
+    alpha: float = 0.7,
+    **kwargs,
+):
+    """
+    Fill between ``baseline`` and ``y`` after pixel-aware downsampling.
+
+    ``baseline`` may be a scalar or an array (for stacked areas, pass the
+    previous layer's top); it is reduced with the same indices as ``y``.
+    Other parameters are as for :func:`dubois_line`; ``kwargs`` go to
+    ``ax.fill_between``. The default ``alpha`` matches the gallery's area
+    chart.
+
+    Returns
+    -------
+    matplotlib.collections.PolyCollection
+
+    Examples
+    --------
+    >>> dubois_area(ax, t, low, label="Group 1")
+    >>> dubois_area(ax, t, low + high, baseline=low, label="Group 2")
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    baseline = np.asarray(baseline, dtype=float)
+    # stacked layers: downsample on the band's top, the visible edge
+    keep = _reduce(ax, x, y, method, dpi, max_points)
+    if baseline.ndim:
+        baseline = baseline[keep]
+    return ax.fill_between(x[keep], baseline, y[keep], alpha=alpha, **kwargs)
+
+
+def _bin_counts(x, y, codes, n_groups, extent, shape):
+    """Per-group 2D histograms, shape ``(n_groups, ny, nx)``, via one bincount."""
+    (x0, x1, y0, y1), (ny, nx) = extent, shape
+    ix = ((x - x0) * (nx / (x1 - x0 or 1.0))).astype(np.intp)
+    iy = ((y - y0) * (ny / (y1 - y0 or 1.0))).astype(np.intp)
+    np.clip(ix, 0, nx - 1, out=ix)
+    np.clip(iy, 0, ny - 1, out=iy)
+    flat = (codes * ny + iy) * nx + ix
+    return np.bincount(flat, minlength=n_groups * ny * nx).reshape(n_groups, ny, nx)
+
+
+def _span(values: np.ndarray) -> tuple[float, float]:
+    """Data range of ``values``, widened when every value is the same."""
+    lo, hi = float(values.min()), float(values.max())
+    return (lo - 0.5, hi + 0.5) if lo == hi else (lo, hi)
+
+
+def _colormap(cmap):
+    """A Du Bois colormap name, any registered name, or a ``Colormap``."""
+    from .colormaps import DUBOIS_CMAP_NAMES, get_dubois_cmap
+
+    if not isinstance(cmap, str):
+        return cmap
+    if cmap in DUBOIS_CMAP_NAMES:
+        return get_dubois_cmap(cmap)
+    import matplotlib
+
+    return matplotlib.colormaps[cmap]
+
+
+def dubois_scatter(
+    ax,
+    x,
+    y,
+    groups=None,
+    *,
+    threshold: int = 50_000,
+    bin_size: float = 2.0,
+    dpi: float | None = None,
+    cmap="dubois_dark",
+    s: float = 60,
+    alpha: float = 0.7,
+    scatter_kwargs: dict | None = None,
+    image_kwargs: dict | None = None,
+):
+    """
+    Scatter plot that switches to a density image for large point counts.
+
+    Up to ``threshold`` points this is ``ax.scatter`` once per group, with
+    the gallery's marker size and transparency. Above it, points are binned
+    with NumPy into a grid of ``bin_size``-pixel cells and drawn as a single
+    rasterized ``imshow``, which keeps draw time flat and SVG/PDF output
+    small.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Axes to draw on; its pixel size sets the density grid.
+    x, y : array_like
+        Point coordinates.
+    groups : array_like, optional
+        Group label per point. Each group gets its own legend entry and a
+        color from ``DUBOIS_CATEGORICAL_CYCLE``.
+    threshold : int, default 50_000
+        Point count above which the density mode is used.
+    bin_size : float, default 2.0
+        Density cell size in pixels at ``dpi``.
+    dpi : float | None, default None
+        Output resolution used to size the grid; defaults to the figure dpi.
+    cmap : str | matplotlib.colors.Colormap, default "dubois_dark"
+        Colormap for a single group's density (log-scaled): a Du Bois or
+        registered matplotlib colormap name, or a ``Colormap``. With several
+        groups, each cell instead blends the group colors by their counts and
+        its opacity follows the log of the total count.
+    s, alpha : float
+        Marker size and alpha in scatter mode.
+    scatter_kwargs : dict, optional
+        Passed to ``ax.scatter`` in scatter mode, over ``s``, ``alpha`` and
+        the group colors; ``marker`` also applies to the legend proxies of
+        density mode.
+    image_kwargs : dict, optional
+        Passed to ``ax.imshow`` in density mode.
+
+    Returns
+    -------
+    list
+        ``PathCollection`` per group in scatter mode; in density mode the
+        ``AxesImage`` followed by empty legend-proxy collections. Input with
+        no finite points is drawn in scatter mode (as nothing).
+
+    Examples
+    --------
+    >>> dubois_scatter(ax, x, y, groups=cohort)      # 5M points -> density
+    >>> dubois_legend(ax, outside=True)
+    """
+    from .colors import palette_rgba
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if groups is None:
+        names, codes = [None], np.zeros(len(x), dtype=np.intp)
+    else:
+        names, codes = np.unique(np.asarray(groups), return_inverse=True)
+        names = list(names)
+    colors = palette_rgba("categorical")
+    group_colors = colors[np.arange(len(names)) % len(colors)]
+    scatter_kwargs = {"s": s, "alpha": alpha, **(scatter_kwargs or {})}
+
+    finite = np.isfinite(x) & np.isfinite(y)
+    if len(x) <= threshold or not finite.any():
+        if groups is None:
+            return [ax.scatter(x, y, **scatter_kwargs)]
+        return [
+            ax.scatter(x[codes == i], y[codes == i],
+                       **{"color": group_colors[i], **scatter_kwargs, "label": name})
+            for i, name in enumerate(names)
+        ]
+
+    x, y, codes = x[finite], y[finite], codes[finite]
+    extent = (*_span(x), *_span(y))
+    fig = ax.get_figure()
+    dpi = fig.dpi if dpi is None else dpi
+    box = ax.get_position()
+    nx = max(1, int(box.width * fig.get_figwidth() * dpi / bin_size))
+    ny = max(1, int(box.height * fig.get_figheight() * dpi / bin_size))
+    counts = _bin_counts(x, y, codes, len(names), extent, (ny, nx))
+
+    image_kwargs = {**dict(origin="lower", extent=extent, aspect="auto",
+                           interpolation="nearest", rasterized=True), **(image_kwargs or {})}
+    if len(names) == 1:
+        from matplotlib.colors import LogNorm
+
+        density = np.ma.masked_equal(counts[0], 0)
+        image = ax.imshow(density, cmap=_colormap(cmap), norm=LogNorm(),
+                          **image_kwargs)
+    else:
+        total = counts.sum(axis=0)
+        occupied = total > 0
+        rgba = np.zeros(total.shape + (4,))
+        # count-weighted mix of the group colors in every occupied cell
+        rgba[..., :3] = np.einsum("gyx,gc->yxc", counts, group_colors[:, :3])
+        rgba[occupied, :3] /= total[occupied, None]
+        weight = np.log1p(total) / np.log1p(total.max())
+        rgba[..., 3] = np.where(occupied, 0.25 + 0.75 * weight, 0.0)
+        image = ax.imshow(rgba, **image_kwargs)
+
+    artists = [image]
+    if groups is not None:
+        # empty collections so dubois_legend() lists the groups
+        marker = scatter_kwargs.get("marker")
+        artists.extend(
+            ax.scatter([], [], s=scatter_kwargs["s"], color=group_colors[i], label=name,
+                       marker=marker)
+            for i, name in enumerate(names)
+        )
+    return artists
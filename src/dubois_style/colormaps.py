@@ -0,0 +1,124 @@
+"""Du Bois colormaps for ``imshow``, ``pcolormesh`` and friends.
+
+Colormaps are built on first use, cached per ``(name, lut)`` with their
+lookup table already computed, and registered with matplotlib so they can be
+referenced by name::
+
+    ax.imshow(grid, cmap="dubois_dark")
+
+Available names: ``dubois_light``, ``dubois_dark``, ``dubois_categorical``,
+``dubois_diverging`` and the reversed ``*_r`` variant of each.
+"""
+
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from .colors import palette_rgba
+from .palettes import DUBOIS_COLORS_DARK, DUBOIS_COLORS_LIGHT
+
+__all__ = [
+    "DUBOIS_CMAP_NAMES",
+    "get_dubois_cmap",
+    "register_dubois_colormaps",
+]
+
+# name -> (kind, colors); "linear" maps interpolate, "listed" maps do not
+_CMAP_SPECS = {
+    "dubois_light": ("linear", "light"),
+    "dubois_dark": ("linear", "dark"),
+    "dubois_categorical": ("listed", "categorical"),
+    # cool -> neutral -> warm, anchored on the darkest navy and red
+    "dubois_diverging": ("linear", (
+        DUBOIS_COLORS_DARK["deep_navy"],
+        DUBOIS_COLORS_LIGHT["deep_navy"],
+        DUBOIS_COLORS_LIGHT["warm_tan"],
+        DUBOIS_COLORS_LIGHT["red"],
+        DUBOIS_COLORS_DARK["red"],
+    )),
+}
+
+DUBOIS_CMAP_NAMES = tuple(
+    name + suffix for name in _CMAP_SPECS for suffix in ("", "_r")
+)
+
+_registered_lut: int | None = None
+_register_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_dubois_cmap(name: str = "dubois_light", lut: int | None = None):
+    """
+    Return a cached Du Bois colormap with its lookup table precomputed.
+
+    Parameters
+    ----------
+    name : str, default "dubois_light"
+        One of :data:`DUBOIS_CMAP_NAMES`.
+    lut : int | None, default None
+        Number of lookup-table entries. Defaults to 256 for interpolated
+        maps and to the number of palette colors for listed maps.
+
+    Returns
+    -------
+    matplotlib.colors.Colormap
+        Shared instance; call ``.copy()`` before mutating it (e.g. with
+        ``set_bad``).
+
+    Examples
+    --------
+    >>> cmap = get_dubois_cmap("dubois_dark", lut=1024)
+    >>> ax.pcolormesh(x, y, z, cmap=cmap)
+    """
+    from matplotlib.colors import LinearSegmentedColormap, ListedColormap
+
+    base, reverse = (name[:-2], True) if name.endswith("_r") else (name, False)
+    try:
+        kind, colors = _CMAP_SPECS[base]
+    except KeyError:
+        raise ValueError(
+            f"unknown colormap {name!r}; expected one of {list(DUBOIS_CMAP_NAMES)}"
+        ) from None
+
+    rgba = palette_rgba(colors)
+    if reverse:
+        rgba = rgba[::-1]
+    if kind == "listed":
+        # a listed map with `lut` entries cycles through the palette
+        cmap = ListedColormap(np.resize(rgba, (lut or len(rgba), 4)), name=name)
+    else:
+        cmap = LinearSegmentedColormap.from_list(name, rgba, N=lut or 256)
+    # build the lookup table now rather than on the first draw
+    cmap(0.0)
+    return cmap
+
+
+def register_dubois_colormaps(lut: int | None = None) -> None:
+    """
+    Register every Du Bois colormap with ``matplotlib.colormaps``.
+
+    Idempotent and thread-safe: repeated calls with the same ``lut`` return
+    immediately.
+    Called automatically by :func:`~dubois_style.apply_dubois_style` and
+    :func:`~dubois_style.dubois_style_context`.
+
+    Parameters
+    ----------
+    lut : int | None, default None
+        Lookup-table size for the registered maps (see
+        :func:`get_dubois_cmap`). Registering again with a different size
+        replaces the previous registrations.
+    """
+    global _registered_lut
+    if _registered_lut == (lut or 0):
+        return
+
+    import matplotlib
+
+    with _register_lock:
+        if _registered_lut == (lut or 0):
+            return
+        for name in DUBOIS_CMAP_NAMES:
+            matplotlib.colormaps.register(get_dubois_cmap(name, lut), name=name, force=True)
+        _registered_lut = lut or 0
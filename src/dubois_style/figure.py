@@ -0,0 +1,161 @@
+"""Du Bois figures that carry their own style and never touch pyplot.
+
+:class:`DuboisFigure` is a ``matplotlib.figure.Figure`` with an Agg canvas
+that carries its own resolved rc settings. While one of its methods runs,
+or inside ``with fig:``, those settings are applied with
+``matplotlib.rc_context``; the global rcParams are restored as soon as the
+method or block ends, so figures with different styles can be built and
+rendered side by side without a global ``apply_dubois_style``.
+
+matplotlib keeps rcParams in one process-wide dict, so an active figure's
+settings are visible to every thread. Activations are therefore serialized
+with a process-wide re-entrant lock: several threads can each build and
+render their own figures, and the results match serial rendering, but only
+one figure renders at a time.
+
+Thread-safety contract
+----------------------
+- A ``DuboisFigure`` and its axes and artists must be used by one thread at
+  a time. Different figures may be used from different threads.
+- Create artists inside ``with fig:`` (``Figure`` methods such as
+  ``subplots``, ``legend``, ``savefig`` and ``draw`` activate the figure by
+  themselves); artists created outside read the global rcParams.
+- rcParams changes made inside an active figure (``rcParams[...] = ...``,
+  ``apply_dubois_style``, ...) last until it is deactivated. To change the
+  figure's own settings for later draws, edit :attr:`DuboisFigure.rc`.
+- Code that reads or changes the global rcParams without going through a
+  ``DuboisFigure`` (pyplot, ``dubois_style_context``) is not serialized and
+  can see an active figure's settings: avoid it while other threads render.
+- Custom font registration and colormap registration happen when the
+  figure is created; both are idempotent and serialized.
+"""
+
+import functools
+import threading
+from collections.abc import Mapping
+from contextlib import ExitStack
+
+import matplotlib as mpl
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+__all__ = [
+    "DuboisFigure",
+]
+
+# held while any figure's settings are applied to the global rcParams
+_rc_lock = threading.RLock()
+
+
+def _activated(rc: dict) -> ExitStack:
+    """Hold the rc lock and apply ``rc`` until the returned stack is closed."""
+    stack = ExitStack()
+    _rc_lock.acquire()
+    stack.callback(_rc_lock.release)
+    try:
+        stack.enter_context(mpl.rc_context(rc))
+    except BaseException:
+        stack.close()
+        raise
+    return stack
+
+
+class DuboisFigure(Figure):
+    """
+    A pyplot-free ``Figure`` that renders with its own Du Bois style.
+
+    Takes the ``Figure`` arguments (``figsize``, ``dpi``, ``layout``, ...)
+    plus the options of :func:`~dubois_style.apply_dubois_style`. The
+    figure gets an Agg canvas; see the module documentation for the
+    thread-safety contract.
+
+    Parameters
+    ----------
+    *args, **kwargs
+        Passed to ``matplotlib.figure.Figure``.
+    cycle, show_x_axis, show_y_axis, use_contrast_colors, base_font, custom_font_paths
+        Style options, as for :func:`~dubois_style.apply_dubois_style`.
+    rc : Mapping | None, default None
+        Extra rcParams for this figure, applied over the style.
+
+    Attributes
+    ----------
+    rc : dict
+        The figure's own settings: the validated Du Bois rc plus ``rc``.
+        Applied each time the figure is activated.
+
+    Examples
+    --------
+    >>> def render(values, cycle):
+    ...     fig = DuboisFigure(figsize=(6, 4), cycle=cycle)
+    ...     with fig:
+    ...         ax = fig.subplots()
+    ...         ax.bar(range(len(values)), values)
+    ...     buf = io.BytesIO()
+    ...     fig.savefig(buf, format="png")
+    ...     return buf.getvalue()
+    >>> with ThreadPoolExecutor(8) as pool:
+    ...     images = list(pool.map(render, datasets, cycles))
+    """
+
+    def __init__(
+        self,
+        *args,
+        cycle: str = "light",
+        show_x_axis: bool = False,
+        show_y_axis: bool = False,
+        use_contrast_colors: bool = False,
+        base_font: str | list[str] = "DejaVu Sans",
+        custom_font_paths: list[str] | None = None,
+        rc: Mapping | None = None,
+        **kwargs,
+    ):
+        from .colormaps import register_dubois_colormaps
+        from .style import _rc_value, _register_fonts, build_dubois_rc
+
+        _register_fonts(custom_font_paths)
+        register_dubois_colormaps()
+
+        style_rc = build_dubois_rc(
+            cycle=cycle,
+            show_x_axis=show_x_axis,
+            show_y_axis=show_y_axis,
+            use_contrast_colors=use_contrast_colors,
+            base_font=base_font,
+        )
+        # fresh lists, so edits to self.rc can't reach the cache
+        self.rc = {k: _rc_value(v) for k, v in style_rc.items()}
+        if rc:
+            self.rc.update(mpl.RcParams(rc))
+        self._active: list[ExitStack] = []
+        with _activated(self.rc):
+            super().__init__(*args, **kwargs)
+            FigureCanvasAgg(self)
+
+    def __enter__(self) -> "DuboisFigure":
+        self._active.append(_activated(self.rc))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._active.pop().close()
+
+
+def _activating(name: str):
+    @functools.wraps(getattr(Figure, name))
+    def wrapper(self, *args, **kwargs):
+        with _activated(self.rc):
+            # looked up per call, so patches of Figure (e.g. profiling) apply
+            return getattr(Figure, name)(self, *args, **kwargs)
+
+    return wrapper
+
+
+# Figure methods that create artists or render; each runs with the figure active
+for _name in (
+    "add_axes", "add_subplot", "subplots", "subplot_mosaic", "add_gridspec",
+    "subfigures", "add_subfigure", "legend", "text", "suptitle", "supxlabel",
+    "supylabel", "colorbar", "figimage", "clear", "tight_layout", "draw",
+    "draw_without_rendering", "savefig",
+):
+    setattr(DuboisFigure, _name, _activating(_name))
+del _name
@@ -0,0 +1,323 @@
+"""Idempotent, cached font registration for custom Du Bois fonts.
+
+``matplotlib.font_manager.fontManager.addfont`` re-parses a font file and
+appends a new entry every time it is called. The registries here remember
+what has been registered, keyed on ``(path, mtime, size)``, so repeated calls
+are free, changed files are picked up, and the font list never grows
+duplicates. What is registered is tracked per font manager, not per
+registry, so any number of registries (including the shared
+:data:`font_registry` behind ``apply_dubois_style(custom_font_paths=...)``)
+can register the same files.
+
+Files are registered with the public ``fontManager.addfont``. Parsed entries
+can optionally be persisted to a JSON cache so a cold worker can register a
+known font set without opening a single font file, and a directory can be
+parsed in worker processes. Installing such pre-parsed entries needs
+matplotlib's font lookup cache to be invalidated, for which there is no
+public API; it is done through the private ``FontManager._findfont_cached``
+when that exists, and otherwise every file goes through ``addfont``.
+Parsing happens outside the module lock, which is held only to merge the
+results into the font manager.
+"""
+
+import dataclasses
+import json
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .profiling import _profiled
+
+__all__ = [
+    "FontRegistry",
+    "font_registry",
+    "register_fonts",
+    "register_font_directory",
+]
+
+FONT_SUFFIXES = (".ttf", ".otf", ".ttc", ".afm")
+
+_CACHE_FORMAT = 1
+
+# font manager -> {path: (file key, ttf entries, afm entries)} it holds
+_registered: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _file_key(path: str) -> tuple[str, int, int]:
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def _parse_font(path: str) -> tuple[list, list]:
+    """Parse one font file into ``(ttf_entries, afm_entries)``."""
+    from matplotlib import font_manager
+
+    # FontManager.addfont on an empty manager: the same entries matplotlib
+    # makes for the file, without scanning the system fonts
+    scratch = object.__new__(font_manager.FontManager)
+    scratch.ttflist, scratch.afmlist = [], []
+    scratch.addfont(path)
+    return scratch.ttflist, scratch.afmlist
+
+
+def _lookup_cache(manager):
+    """
+    The clear function of ``manager``'s font lookup cache, if it has one.
+
+    matplotlib has no public way to invalidate font lookups after entries
+    are added other than ``addfont`` itself. Pre-parsed entries (from the
+    disk cache or worker processes) are only installed directly when this
+    hook exists; otherwise every file goes through ``addfont``.
+    """
+    cache = getattr(manager, "_findfont_cached", None)
+    return getattr(cache, "cache_clear", None)
+
+
+def _manager_registry() -> dict[str, tuple[tuple, list, list]]:
+    """What the current ``fontManager`` holds from any registry."""
+    from matplotlib import font_manager
+
+    return _registered.setdefault(font_manager.fontManager, {})
+
+
+class FontRegistry:
+    """
+    Register fonts with matplotlib's global font manager, once per file.
+
+    Registrations are shared: a file registered by any registry is not
+    registered again by another, unless it changed on disk.
+
+    Parameters
+    ----------
+    cache_file : str | os.PathLike | None, default None
+        Optional JSON file where parsed font entries are persisted. Entries
+        are reused only when the file's path, mtime and size still match and
+        the cache was written by the same matplotlib version. Can also be set
+        later through the :attr:`cache_file` attribute.
+
+    Examples
+    --------
+    >>> registry = FontRegistry(cache_file="~/.cache/dubois-fonts.json")
+    >>> registry.register(["/fonts/LibreFranklin-Regular.ttf"])
+    ['/fonts/LibreFranklin-Regular.ttf']
+    >>> registry.register(["/fonts/LibreFranklin-Regular.ttf"])  # no-op
+    []
+    """
+
+    def __init__(self, cache_file: str | os.PathLike | None = None):
+        self._paths: set[str] = set()
+        self.cache_file = cache_file
+
+    @property
+    def cache_file(self) -> Path | None:
+        """
+        JSON file for parsed font entries, or None.
+
+        Setting it (e.g. ``font_registry.cache_file = "~/.cache/fonts.json"``
+        for :func:`~dubois_style.apply_dubois_style`) takes effect from the
+        next registration.
+        """
+        return self._cache_file
+
+    @cache_file.setter
+    def cache_file(self, value: str | os.PathLike | None) -> None:
+        with _lock:
+            self._cache_file = Path(value).expanduser() if value is not None else None
+            self._disk_cache: dict[str, dict] | None = None
+
+    @property
+    def registered(self) -> list[str]:
+        """Paths of the font files registered through this registry."""
+        return sorted(self._paths.intersection(_manager_registry()))
+
+    @_profiled("fonts")
+    def register(
+        self,
+        paths,
+        *,
+        max_workers: int | None = 1,
+    ) -> list[str]:
+        """
+        Register font files, skipping any that are already registered.
+
+        Parameters
+        ----------
+        paths : iterable of str | os.PathLike
+            Font files (.ttf, .otf, .ttc, .afm).
+        max_workers : int | None, default 1
+            Number of processes used to parse files that are neither
+            registered nor in the on-disk cache. ``1`` registers them one
+            by one with ``fontManager.addfont``; ``None`` uses one process
+            per CPU.
+
+        Returns
+        -------
+        list[str]
+            Paths that were newly registered (or re-registered because the
+            file changed on disk); files registered before, by this or any
+            other registry, are not included.
+        """
+        from matplotlib import font_manager
+
+        keys = [_file_key(os.path.abspath(os.fspath(p))) for p in paths]
+
+        with _lock:
+            registered = _manager_registry()
+            self._paths.update(key[0] for key in keys)
+            pending = [
+                key for key in dict.fromkeys(keys)
+                if registered.get(key[0], (None,))[0] != key
+            ]
+            if not pending:
+                return []
+            disk_cache = dict(self._load_disk_cache())
+
+        # outside the lock: reuse persisted entries and parse the rest in
+        # worker processes, so other threads can register meanwhile
+        parsed = {}
+        from_disk = set()
+        if _lookup_cache(font_manager.fontManager) is not None:
+            for key in pending:
+                cached = disk_cache.get(key[0])
+                if cached is not None and tuple(cached["key"]) == key:
+                    from_disk.add(key)
+                    parsed[key] = (
+                        [font_manager.FontEntry(**e) for e in cached["ttf"]],
+                        [font_manager.FontEntry(**e) for e in cached["afm"]],
+                    )
+            to_parse = [key for key in pending if key not in parsed]
+            if max_workers != 1 and len(to_parse) > 1:
+                with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                    parsed.update(zip(to_parse, pool.map(_parse_font, [k[0] for k in to_parse])))
+
+        with _lock:
+            registered = _manager_registry()
+            manager = font_manager.fontManager
+            added = []
+            for key in pending:
+                if registered.get(key[0], (None,))[0] == key:
+                    continue  # registered by another thread meanwhile
+                _unregister(key[0])
+                if key in parsed:
+                    ttf, afm = parsed[key]
+                    manager.ttflist.extend(ttf)
+                    manager.afmlist.extend(afm)
+                else:
+                    n_ttf, n_afm = len(manager.ttflist), len(manager.afmlist)
+                    manager.addfont(key[0])
+                    ttf, afm = manager.ttflist[n_ttf:], manager.afmlist[n_afm:]
+                registered[key[0]] = (key, ttf, afm)
+                added.append(key)
+            if parsed:
+                # one lookup cache invalidation for the pre-parsed batch
+                _lookup_cache(manager)()
+            if not from_disk.issuperset(added):
+                self._save_disk_cache()
+            return [key[0] for key in added]
+
+    @_profiled("fonts")
+    def register_directory(
+        self,
+        directory: str | os.PathLike,
+        *,
+        recursive: bool = False,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """
+        Register every font file in ``directory``.
+
+        Files are parsed in parallel (``max_workers=None`` uses one process
+        per CPU). See :meth:`register` for the return value.
+        """
+        directory = Path(directory)
+        candidates = directory.rglob("*") if recursive else directory.iterdir()
+        paths = sorted(
+            p for p in candidates
+            if p.suffix.lower() in FONT_SUFFIXES and p.is_file()
+        )
+        return self.register(paths, max_workers=max_workers)
+
+    def _load_disk_cache(self) -> dict[str, dict]:
+        if self._disk_cache is not None:
+            return self._disk_cache
+        self._disk_cache = {}
+        if self.cache_file is None or not self.cache_file.exists():
+            return self._disk_cache
+
+        import matplotlib
+
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return self._disk_cache
+        if (
+            data.get("format") == _CACHE_FORMAT
+            and data.get("matplotlib") == matplotlib.__version__
+        ):
+            self._disk_cache = data.get("fonts", {})
+        return self._disk_cache
+
+    def _save_disk_cache(self) -> None:
+        if self.cache_file is None:
+            return
+
+        import matplotlib
+
+        fonts = self._load_disk_cache()
+        registered = _manager_registry()
+        for path in self._paths.intersection(registered):
+            key, ttf, afm = registered[path]
+            fonts[path] = {
+                "key": list(key),
+                "ttf": [dataclasses.asdict(e) for e in ttf],
+                "afm": [dataclasses.asdict(e) for e in afm],
+            }
+        payload = {
+            "format": _CACHE_FORMAT,
+            "matplotlib": matplotlib.__version__,
+            "fonts": fonts,
+        }
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # write-then-rename so concurrent workers never read a partial file
+        tmp = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload))
+        os.replace(tmp, self.cache_file)
+
+
+def _unregister(path: str) -> None:
+    """Drop entries previously added for ``path`` from the font manager."""
+    from matplotlib import font_manager
+
+    previous = _manager_registry().pop(path, None)
+    if previous is None:
+        return
+    manager = font_manager.fontManager
+    _, ttf, afm = previous
+    stale = {id(entry) for entry in ttf + afm}
+    manager.ttflist[:] = [e for e in manager.ttflist if id(e) not in stale]
+    manager.afmlist[:] = [e for e in manager.afmlist if id(e) not in stale]
+
+
+# Registry used by apply_dubois_style(custom_font_paths=...); set its
+# ``cache_file`` to persist parsed entries for those fonts too
+font_registry = FontRegistry()
+
+
+def register_fonts(paths, *, max_workers: int | None = 1) -> list[str]:
+    """Register font files with the shared :data:`font_registry`."""
+    return font_registry.register(paths, max_workers=max_workers)
+
+
+def register_font_directory(
+    directory: str | os.PathLike,
+    *,
+    recursive: bool = False,
+    max_workers: int | None = None,
+) -> list[str]:
+    """Register every font file in ``directory`` with :data:`font_registry`."""
+    return font_registry.register_directory(
+        directory, recursive=recursive, max_workers=max_workers
+    )
@@ -0,0 +1,171 @@
+"""Vectorized geometry for the Du Bois plate charts.
+
+Every function here builds the outlines of *all* segments of a chart in a
+few NumPy operations and returns them stacked in one array (or, for
+:func:`spiral_path`, one compound ``Path``), ready to hand to a single
+collection. No ``Patch`` objects are created.
+
+Angles are in radians, measured counter-clockwise from the positive x axis.
+"""
+
+import numpy as np
+
+__all__ = [
+    "rectangles",
+    "arc_bands",
+    "spiral_path",
+]
+
+
+def rectangles(x, y, width, height) -> np.ndarray:
+    """
+    Corners of many axis-aligned rectangles.
+
+    Parameters
+    ----------
+    x, y : array_like
+        Lower-left corners; broadcast against ``width`` and ``height``.
+    width, height : array_like
+        Rectangle sizes.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(N, 4, 2)`` vertices, counter-clockwise from the lower-left corner.
+    """
+    x, y, width, height = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float).ravel() for a in (x, y, width, height))
+    )
+    xs = np.stack((x, x + width, x + width, x), axis=-1)
+    ys = np.stack((y, y, y + height, y + height), axis=-1)
+    return np.stack((xs, ys), axis=-1)
+
+
+def arc_bands(
+    theta_start,
+    theta_end,
+    r_inner,
+    r_outer,
+    *,
+    pitch: float = 0.0,
+    center: tuple[float, float] = (0.0, 0.0),
+    resolution: int = 64,
+) -> np.ndarray:
+    """
+    Outlines of many annular bands (wedges, ring segments, spiral arms).
+
+    Each band runs from ``theta_start`` to ``theta_end`` between two radii.
+    With a non-zero ``pitch`` both radii shrink by ``pitch`` per full turn
+    travelled, turning the band into an Archimedean spiral arm.
+
+    Parameters
+    ----------
+    theta_start, theta_end : array_like
+        Start and end angle of each band; the band may turn either way and
+        more than once.
+    r_inner, r_outer : array_like
+        Radii at ``theta_start``; broadcast against the angles.
+    pitch : float, default 0.0
+        Radial distance lost per full turn.
+    center : tuple[float, float], default (0, 0)
+        Center of all bands.
+    resolution : int, default 64
+        Vertices along each edge of a band.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(N, 2 * resolution, 2)`` vertices: the outer edge forward, then the
+        inner edge back.
+    """
+    theta_start, theta_end, r_inner, r_outer = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float).ravel()
+          for a in (theta_start, theta_end, r_inner, r_outer))
+    )
+    t = np.linspace(0.0, 1.0, resolution)
+    sweep = (theta_end - theta_start)[:, None]
+    theta = theta_start[:, None] + sweep * t
+    drift = pitch * np.abs(sweep) * t / (2 * np.pi)
+    radii = np.concatenate((r_outer[:, None] - drift, (r_inner[:, None] - drift)[:, ::-1]), axis=1)
+    angles = np.concatenate((theta, theta[:, ::-1]), axis=1)
+    return np.stack(
+        (center[0] + radii * np.cos(angles), center[1] + radii * np.sin(angles)),
+        axis=-1,
+    )
+
+
+def spiral_path(
+    theta_start,
+    sweep,
+    r_inner,
+    r_outer,
+    *,
+    pitch: float = 0.0,
+    center: tuple[float, float] = (0.0, 0.0),
+    points_per_turn: int = 64,
+):
+    """
+    One compound ``Path`` holding the outlines of N spiral bars.
+
+    Like :func:`arc_bands`, but the number of vertices follows each bar's
+    length (``points_per_turn`` per full turn, at least two per edge), so
+    short bars stay cheap next to long ones. All vertices and codes are
+    computed in one pass; each bar is a closed sub-path.
+
+    Parameters
+    ----------
+    theta_start : array_like
+        Start angle of each bar, in radians.
+    sweep : array_like
+        Signed angle each bar covers; negative runs clockwise.
+    r_inner, r_outer : array_like
+        Radii at the start of each bar.
+    pitch : float, default 0.0
+        Radial distance lost per full turn.
+    center : tuple[float, float], default (0, 0)
+        Center of the spiral.
+    points_per_turn : int, default 64
+        Vertices per edge per full turn.
+
+    Returns
+    -------
+    matplotlib.path.Path
+
+    Examples
+    --------
+    >>> path = spiral_path(np.pi / 2, -values / values.max() * 2 * np.pi,
+    ...                    r_outer - 0.8 * step, r_outer, pitch=len(values) * step)
+    >>> ax.add_patch(PathPatch(path))
+    """
+    from matplotlib.path import Path
+
+    theta_start, sweep, r_inner, r_outer = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float).ravel()
+          for a in (theta_start, sweep, r_inner, r_outer))
+    )
+    turns = np.abs(sweep) / (2 * np.pi)
+    # vertices per edge; each bar is outer edge + inner edge + close
+    edge = np.maximum(2, np.ceil(turns * points_per_turn).astype(np.intp) + 1)
+    sizes = 2 * edge + 1
+    base = np.cumsum(sizes) - sizes
+
+    bar = np.repeat(np.arange(len(edge)), edge)
+    k = np.arange(len(bar)) - np.repeat(np.cumsum(edge) - edge, edge)
+    t = k / (edge[bar] - 1)
+    theta = theta_start[bar] + sweep[bar] * t
+    drift = pitch * turns[bar] * t
+    cos, sin = np.cos(theta), np.sin(theta)
+
+    vertices = np.empty((sizes.sum(), 2))
+    outer = base[bar] + k
+    inner = base[bar] + 2 * edge[bar] - 1 - k
+    r = r_outer[bar] - drift
+    vertices[outer, 0], vertices[outer, 1] = center[0] + r * cos, center[1] + r * sin
+    r = r_inner[bar] - drift
+    vertices[inner, 0], vertices[inner, 1] = center[0] + r * cos, center[1] + r * sin
+    vertices[base + 2 * edge] = vertices[base]
+
+    codes = np.full(len(vertices), Path.LINETO, dtype=Path.code_type)
+    codes[base] = Path.MOVETO
+    codes[base + 2 * edge] = Path.CLOSEPOLY
+    return Path(vertices, codes)
@@ -0,0 +1,289 @@
+"""Live, blitted Du Bois charts for streaming data.
+
+:class:`DuboisLiveChart` keeps one styled figure alive. The static parts —
+spines, ticks, title, the :func:`~dubois_style.dubois_legend` legend — are
+rendered once and cached as a background image; each update restores that
+image and redraws only the series artists. A full redraw happens only when
+new data leaves the current axis limits.
+
+Series data lives in fixed-capacity ring buffers, so memory stays bounded no
+matter how long the stream runs.
+"""
+
+import numpy as np
+
+__all__ = [
+    "RingBuffer",
+    "DuboisLiveChart",
+]
+
+
+class RingBuffer:
+    """
+    Fixed-capacity buffer of ``(x, y)`` samples with contiguous views.
+
+    Every sample is written twice, ``capacity`` apart, so the most recent
+    ``len(self)`` samples are always one contiguous slice: :meth:`view` never
+    copies.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of most recent samples kept.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._data = np.zeros((2, 2 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, x, y) -> None:
+        """Append samples; only the last ``capacity`` of them are kept."""
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        if x.shape != y.shape:
+            raise ValueError("x and y must have the same length")
+        if len(x) > self.capacity:
+            x, y = x[-self.capacity:], y[-self.capacity:]
+        n = len(x)
+        pos = (self._next + np.arange(n)) % self.capacity
+        for offset in (0, self.capacity):
+            self._data[0, pos + offset] = x
+            self._data[1, pos + offset] = y
+        self._next = (self._next + n) % self.capacity
+        self._size = min(self._size + n, self.capacity)
+
+    def view(self) -> tuple[np.ndarray, np.ndarray]:
+        """Read-only ``(x, y)`` views of the buffered samples, oldest first."""
+        start = (self._next - self._size) % self.capacity
+        block = self._data[:, start:start + self._size]
+        block = block.view()
+        block.setflags(write=False)
+        return block[0], block[1]
+
+
+class DuboisLiveChart:
+    """
+    A styled figure that is updated incrementally with blitting.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure | None, default None
+        Figure to draw into. A new pyplot-free ``Figure`` with an Agg canvas
+        is created if None; pass a pyplot figure for an on-screen wallboard.
+    capacity : int, default 1000
+        Samples kept per series.
+    window : float | None, default None
+        Width of the visible x range. The view scrolls with the newest data,
+        jumping ahead by ``scroll`` of a window at a time. If None the x
+        range grows to fit all buffered data.
+    ylim : tuple[float, float] | None, default None
+        Fixed y limits. If None the y range grows (with ``headroom``) when
+        data leaves it.
+    scroll : float, default 0.25
+        Fraction of ``window`` to jump when the data reaches the right edge.
+    headroom : float, default 0.1
+        Extra fraction added to an auto-grown y range.
+    legend : bool, default True
+        Draw a :func:`~dubois_style.dubois_legend` for the series.
+    style : dict | None, default None
+        Options for :func:`~dubois_style.dubois_style_context`, applied while
+        the chart creates artists and redraws fully.
+    figsize : tuple[float, float] | None, default None
+        Size of the created figure.
+
+    Examples
+    --------
+    >>> chart = DuboisLiveChart(window=60, style={"use_contrast_colors": True})
+    >>> chart.add_line("latency")
+    >>> chart.add_area("throughput")
+    >>> for t, latency, rps in stream():
+    ...     chart.push("latency", t, latency)
+    ...     chart.push("throughput", t, rps)
+    ...     chart.update()
+    """
+
+    def __init__(
+        self,
+        fig=None,
+        *,
+        capacity: int = 1000,
+        window: float | None = None,
+        ylim: tuple[float, float] | None = None,
+        scroll: float = 0.25,
+        headroom: float = 0.1,
+        legend: bool = True,
+        style: dict | None = None,
+        figsize: tuple[float, float] | None = None,
+    ):
+        from .style import dubois_style_context
+
+        self.capacity = capacity
+        self.window = window
+        self.scroll = scroll
+        self.headroom = headroom
+        self.legend = legend
+        self.style = dict(style or {})
+        self.full_redraws = 0
+        self.blits = 0
+
+        self._fixed_ylim = ylim
+        # name -> (buffer, artist, kind, area baseline or None)
+        self._series: dict[str, tuple[RingBuffer, object, str, float | None]] = {}
+        self._dirty: set[str] = set()
+        self._background = None
+        self._legend = None
+
+        with dubois_style_context(**self.style):
+            if fig is None:
+                from matplotlib.backends.backend_agg import FigureCanvasAgg
+                from matplotlib.figure import Figure
+
+                fig = Figure(figsize=figsize)
+                FigureCanvasAgg(fig)
+            self.fig = fig
+            self.ax = fig.add_subplot()
+        if ylim is not None:
+            self.ax.set_ylim(ylim)
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    # ------------------------------------------------------------------
+    # Series
+    # ------------------------------------------------------------------
+    def add_line(self, name: str, **kwargs):
+        """Add a line series; ``kwargs`` go to ``Line2D``."""
+        from .style import dubois_style_context
+
+        with dubois_style_context(**self.style):
+            (artist,) = self.ax.plot([], [], label=name, animated=True, **kwargs)
+        return self._add(name, artist, "line", None)
+
+    def add_area(self, name: str, *, baseline: float = 0.0, alpha: float = 0.7, **kwargs):
+        """Add a filled area series down to ``baseline``; ``kwargs`` go to ``Polygon``."""
+        import matplotlib as mpl
+        from matplotlib.patches import Polygon
+
+        from .style import dubois_style_context
+
+        with dubois_style_context(**self.style):
+            if "facecolor" not in kwargs and "color" not in kwargs:
+                # areas step through the style's color cycle on their own,
+                # as fill_between does
+                colors = mpl.rcParams["axes.prop_cycle"].by_key().get("color", ["C0"])
+                areas = sum(kind == "area" for _, _, kind, _ in self._series.values())
+                kwargs["facecolor"] = colors[areas % len(colors)]
+            artist = Polygon(np.empty((0, 2)), closed=True, label=name, alpha=alpha,
+                             animated=True, **kwargs)
+            self.ax.add_patch(artist)
+        return self._add(name, artist, "area", baseline)
+
+    def _add(self, name, artist, kind, baseline):
+        if name in self._series:
+            raise ValueError(f"series {name!r} already exists")
+        self._series[name] = (RingBuffer(self.capacity), artist, kind, baseline)
+        self._background = None
+        # rebuilt with the new series on the next full redraw
+        self._legend = None
+        return artist
+
+    def push(self, name: str, x, y) -> None:
+        """Append one sample (or arrays of samples) to a series."""
+        buffer = self._series[name][0]
+        buffer.extend(x, y)
+        self._dirty.add(name)
+
+    def data(self, name: str) -> tuple[np.ndarray, np.ndarray]:
+        """Buffered ``(x, y)`` of a series, oldest first."""
+        return self._series[name][0].view()
+
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
+    def update(self) -> None:
+        """Push changed series to their artists and repaint the figure."""
+        for name in self._dirty:
+            buffer, artist, kind, base = self._series[name]
+            x, y = buffer.view()
+            if kind == "line":
+                artist.set_data(x, y)
+            elif len(x):
+                artist.set_xy(np.concatenate((
+                    [[x[0], base]], np.column_stack((x, y)), [[x[-1], base]]
+                )))
+        self._dirty.clear()
+
+        canvas = self.fig.canvas
+        rescaled = self._rescale()
+        if rescaled or self._background is None or not canvas.supports_blit:
+            self.redraw()
+            return
+        canvas.restore_region(self._background)
+        self._draw_series()
+        canvas.blit(self.fig.bbox)
+        self.blits += 1
+
+    def redraw(self) -> None:
+        """Full redraw: static elements, cached background and series."""
+        from .style import dubois_legend, dubois_style_context
+
+        with dubois_style_context(**self.style):
+            if self.legend and self._series and self._legend is None:
+                self._legend = dubois_legend(self.ax, outside=True, reserve_space=True)
+            # draw_event -> _on_draw caches the background and paints series
+            self.fig.canvas.draw()
+        self.full_redraws += 1
+
+    def _on_draw(self, event) -> None:
+        canvas = event.canvas
+        if (canvas is self.fig.canvas and getattr(canvas, "supports_blit", False)
+                and not canvas.is_saving()):
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        # series are animated, so the full draw (or savefig) skipped them
+        self._draw_series(event.renderer)
+
+    def _draw_series(self, renderer=None) -> None:
+        for _, artist, _, _ in self._series.values():
+            if renderer is None:
+                self.ax.draw_artist(artist)
+            else:
+                artist.draw(renderer)
+
+    def _rescale(self) -> bool:
+        """Move the axis limits if data left them; True if they changed."""
+        xs, ys = [], []
+        for buffer, _, _, _ in self._series.values():
+            if len(buffer):
+                x, y = buffer.view()
+                xs.append((x.min(), x.max()))
+                ys.append((y.min(), y.max()))
+        if not xs:
+            return False
+        x_lo, x_hi = min(lo for lo, _ in xs), max(hi for _, hi in xs)
+        y_lo, y_hi = min(lo for lo, _ in ys), max(hi for _, hi in ys)
+        changed = False
+
+        (cur_x0, cur_x1), (cur_y0, cur_y1) = self.ax.get_xlim(), self.ax.get_ylim()
+        if self.window is not None:
+            if self._background is None and x_hi - x_lo < self.window:
+                # first frame: start the window at the oldest sample
+                self.ax.set_xlim(x_lo, x_lo + self.window)
+                changed = True
+            elif x_hi > cur_x1:
+                right = x_hi + self.scroll * self.window
+                self.ax.set_xlim(right - self.window, right)
+                changed = True
+        elif x_lo < cur_x0 or x_hi > cur_x1:
+            self.ax.set_xlim(x_lo, x_hi + self.scroll * (x_hi - x_lo))
+            changed = True
+
+        if self._fixed_ylim is None and (y_lo < cur_y0 or y_hi > cur_y1):
+            pad = self.headroom * max(y_hi - y_lo, abs(y_hi), 1e-12)
+            self.ax.set_ylim(min(y_lo, cur_y0) - pad, max(y_hi, cur_y1) + pad)
+            changed = True
+        return changed
@@ -0,0 +1,291 @@
+"""Choropleth maps in the style of Du Bois' Georgia plates.
+
+:func:`dubois_map` draws every region as one ``PolyCollection`` (a single
+draw call regardless of region count), colors the regions with the
+vectorized :func:`~dubois_style.colors.map_values`, and computes all label
+anchors in one NumPy pass.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from .colors import map_values
+
+__all__ = [
+    "dubois_map",
+    "polygon_centroids",
+]
+
+
+def _ring(coords) -> np.ndarray:
+    return np.asarray(coords, dtype=float)[:, :2]
+
+
+def _as_polygons(geometry) -> list[tuple[np.ndarray, list[np.ndarray]]]:
+    """Parts of one region as ``(exterior, holes)`` pairs of ``(N, 2)`` arrays.
+
+    Accepts vertex arrays, shapely (Multi)Polygons and any object exposing
+    ``__geo_interface__``.
+    """
+    if hasattr(geometry, "geoms"):
+        return [poly for part in geometry.geoms for poly in _as_polygons(part)]
+    if hasattr(geometry, "exterior"):
+        holes = [_ring(ring.coords) for ring in getattr(geometry, "interiors", ())]
+        return [(_ring(geometry.exterior.coords), holes)]
+    if hasattr(geometry, "__geo_interface__"):
+        geo = geometry.__geo_interface__
+        if geo["type"] == "Polygon":
+            polygons = [geo["coordinates"]]
+        elif geo["type"] == "MultiPolygon":
+            polygons = geo["coordinates"]
+        else:
+            raise TypeError(f"unsupported geometry type {geo['type']!r}")
+        return [(_ring(rings[0]), [_ring(r) for r in rings[1:]]) for rings in polygons]
+    return [(np.asarray(geometry, dtype=float), [])]
+
+
+def _compound_path(exterior: np.ndarray, holes: list[np.ndarray]):
+    """Vertices and codes of one polygon part, holes wound against the exterior."""
+    from matplotlib.path import Path
+
+    rings = [exterior]
+    if holes:
+        _, areas = polygon_centroids([exterior, *holes])
+        # nonzero fill rule: a ring wound the other way cuts a hole
+        rings += [h[::-1] if np.sign(a) == np.sign(areas[0]) else h
+                  for h, a in zip(holes, areas[1:])]
+    verts, codes = [], []
+    for ring in rings:
+        ring_codes = np.full(len(ring) + 1, Path.LINETO, dtype=Path.code_type)
+        ring_codes[0], ring_codes[-1] = Path.MOVETO, Path.CLOSEPOLY
+        verts.append(np.concatenate((ring, ring[:1])))
+        codes.append(ring_codes)
+    return np.concatenate(verts), np.concatenate(codes)
+
+
+def _part_centroids(parts) -> tuple[np.ndarray, np.ndarray]:
+    """Centroids and unsigned areas of polygon parts, net of their holes."""
+    centroids, areas = polygon_centroids([exterior for exterior, _ in parts])
+    areas = np.abs(areas)
+    owner = np.fromiter((i for i, (_, holes) in enumerate(parts) for _ in holes),
+                        dtype=np.intp)
+    if not len(owner):
+        return centroids, areas
+    hole_centroids, hole_areas = polygon_centroids(
+        [hole for _, holes in parts for hole in holes])
+    moments = centroids * areas[:, None]
+    np.subtract.at(moments, owner, hole_centroids * np.abs(hole_areas)[:, None])
+    np.subtract.at(areas, owner, np.abs(hole_areas))
+    holed = np.unique(owner)
+    holed = holed[areas[holed] > 0]
+    centroids[holed] = moments[holed] / areas[holed, None]
+    return centroids, areas
+
+
+def polygon_centroids(rings: Sequence[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Area-weighted centroids and signed areas of many polygons at once.
+
+    Parameters
+    ----------
+    rings : Sequence[np.ndarray]
+        Polygons as ``(N_i, 2)`` vertex arrays (closed or open).
+
+    Returns
+    -------
+    centroids : np.ndarray
+        ``(len(rings), 2)`` array. Degenerate polygons fall back to the mean
+        of their vertices.
+    areas : np.ndarray
+        Signed shoelace areas.
+    """
+    lengths = np.fromiter((len(r) for r in rings), dtype=np.intp, count=len(rings))
+    if not len(rings):
+        return np.empty((0, 2)), np.empty(0)
+    xy = np.concatenate(rings)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    # index of the next vertex, wrapping around within each polygon
+    nxt = np.arange(len(xy)) + 1
+    nxt[starts + lengths - 1] = starts
+    x, y = xy[:, 0], xy[:, 1]
+    cross = x * y[nxt] - x[nxt] * y
+
+    area = 0.5 * np.add.reduceat(cross, starts)
+    cx = np.add.reduceat((x + x[nxt]) * cross, starts)
+    cy = np.add.reduceat((y + y[nxt]) * cross, starts)
+    mean = np.add.reduceat(xy, starts) / lengths[:, None]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centroids = np.column_stack((cx, cy)) / (6.0 * area[:, None])
+    degenerate = ~np.isfinite(centroids).all(axis=1) | (area == 0)
+    centroids[degenerate] = mean[degenerate]
+    return centroids, area
+
+
+def _labels_fit(ax, rings, texts, *, fontsize, fontweight) -> np.ndarray:
+    """Boolean mask of labels whose extent fits their polygon's bbox."""
+    from .metrics import text_extents
+
+    extents = text_extents(texts, size=fontsize, weight=fontweight)
+    lengths = np.fromiter((len(r) for r in rings), dtype=np.intp, count=len(rings))
+    xy = np.concatenate(rings)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    span = np.maximum.reduceat(xy, starts) - np.minimum.reduceat(xy, starts)
+
+    # data units per point along each axis, from the current view
+    box = ax.get_window_extent()
+    points_per_pixel = 72 / ax.get_figure().dpi
+    (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+    scale = np.array([
+        abs(x1 - x0) / (box.width * points_per_pixel),
+        abs(y1 - y0) / (box.height * points_per_pixel),
+    ])
+    return np.all(extents[:, :2] * scale <= span, axis=1)
+
+
+def dubois_map(
+    ax,
+    geometries,
+    values,
+    *,
+    palette="light",
+    vmin: float | None = None,
+    vmax: float | None = None,
+    bins=None,
+    steps: int | None = None,
+    edgecolor: str = "#111111",
+    linewidth: float = 1.5,
+    labels: bool | Sequence[str] | None = None,
+    label_fmt: str = "{:g}",
+    fontsize: float = 10,
+    fontweight: str = "bold",
+    min_label_area: float = 0.0,
+    fit_labels: bool = False,
+    autoscale: bool = True,
+    **collection_kwargs,
+):
+    """
+    Draw a Du Bois–style choropleth as a single collection.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Axes to draw on.
+    geometries : Sequence
+        One entry per region: an ``(N, 2)`` vertex array, a shapely
+        ``Polygon``/``MultiPolygon``, or anything with ``__geo_interface__``.
+        Multi-part regions share their region's color; interior rings
+        (holes, e.g. enclaves) are left unfilled.
+    values : array_like
+        One value per region.
+    palette, vmin, vmax, bins, steps
+        Color mapping options, see :func:`~dubois_style.colors.map_values`.
+    edgecolor : str, default "#111111"
+        Region outline color.
+    linewidth : float, default 1.5
+        Region outline width.
+    labels : bool | Sequence[str] | None, default None
+        ``True`` labels each region with its value (``label_fmt``); a
+        sequence supplies the label text per region.
+    label_fmt : str, default "{:g}"
+        Format for value labels.
+    fontsize, fontweight
+        Label font options.
+    min_label_area : float, default 0.0
+        Skip labels for regions whose largest part is smaller than this (in
+        data units squared); useful with thousands of small regions.
+    fit_labels : bool, default False
+        Skip labels whose text does not fit inside the bounding box of the
+        region part it is anchored on. Text is measured through the shared
+        :data:`~dubois_style.metrics.text_metrics` cache, so re-rendering the
+        same map measures nothing. Uses the current axes limits and size,
+        so set those (and the figure size) first.
+    autoscale : bool, default True
+        Fit the axes limits to the regions.
+    **collection_kwargs
+        Passed to ``PolyCollection``.
+
+    Returns
+    -------
+    matplotlib.collections.PolyCollection
+        The region collection. Labels, if any, are added to ``ax.texts``.
+
+    Examples
+    --------
+    >>> fig, ax = plt.subplots()
+    >>> dubois_map(ax, county_polygons, county_values, palette="dark", labels=True)
+    >>> ax.axis("off")
+    """
+    from matplotlib.collections import PolyCollection
+
+    values = np.asarray(values, dtype=float)
+    if len(geometries) != len(values):
+        raise ValueError(
+            f"got {len(geometries)} geometries but {len(values)} values"
+        )
+
+    parts, owner = [], []
+    for region, geometry in enumerate(geometries):
+        polygons = _as_polygons(geometry)
+        parts.extend(polygons)
+        owner.extend([region] * len(polygons))
+    owner = np.asarray(owner, dtype=np.intp)
+    rings = [exterior for exterior, _ in parts]
+
+    region_colors = map_values(values, palette=palette, vmin=vmin, vmax=vmax, bins=bins,
+                               steps=steps)
+    collection = PolyCollection(
+        [],
+        facecolors=region_colors[owner],
+        edgecolors=edgecolor,
+        linewidths=linewidth,
+        **collection_kwargs,
+    )
+    # one compound path per part, so holes (enclaves) stay unfilled
+    if parts:
+        collection.set_verts_and_codes(*zip(*(_compound_path(*part) for part in parts)))
+    ax.add_collection(collection, autolim=autoscale)
+    if autoscale:
+        ax.autoscale_view()
+
+    if labels is None or labels is False or not len(rings):
+        return collection
+
+    centroids, areas = _part_centroids(parts)
+    # label each region once, on its largest part
+    order = np.lexsort((-areas, owner))
+    regions, first = np.unique(owner[order], return_index=True)
+    anchor = order[first]
+    keep = areas[anchor] >= min_label_area
+    regions, anchor = regions[keep], anchor[keep]
+
+    if labels is True:
+        texts = [label_fmt.format(v) for v in values[regions]]
+    else:
+        texts = [labels[i] for i in regions]
+
+    if fit_labels and len(anchor):
+        fits = _labels_fit(ax, [rings[i] for i in anchor], texts,
+                           fontsize=fontsize, fontweight=fontweight)
+        regions, anchor = regions[fits], anchor[fits]
+        texts = [text for text, fit in zip(texts, fits) if fit]
+
+    # white text on the darker half of the ramp, as in the Georgia plates
+    finite = values[np.isfinite(values)]
+    lo = vmin if vmin is not None else (finite.min() if finite.size else 0.0)
+    hi = vmax if vmax is not None else (finite.max() if finite.size else 0.0)
+    span = hi - lo
+    normalized = (values[regions] - lo) / span if span > 0 else np.zeros(len(regions))
+    dark = normalized > 0.5
+
+    for (x, y), text, on_dark in zip(centroids[anchor], texts, dark):
+        ax.text(
+            x, y, text,
+            ha="center",
+            va="center",
+            fontsize=fontsize,
+            fontweight=fontweight,
+            color="white" if on_dark else "#111111",
+        )
+    return collection
@@ -0,0 +1,208 @@
+"""Cached text measurement for the package's label layout helpers.
+
+Measuring a string with matplotlib means loading the font and laying out
+every glyph. The helpers here do that without a renderer (sizes are in
+points, independent of dpi) and memoize the result per
+``(font file, size, weight, style, text)`` in a bounded LRU cache with
+hit/miss counters. The font file is the one ``findfont`` resolves the family
+to, so two names for the same font share entries, and a family that
+resolves to a newly registered font is measured again. Layout code in this package (``dubois_legend(reserve_space=True)``,
+``dubois_map(fit_labels=True)``) measures through this cache, so building the
+same dense chart again re-uses those measurements.
+
+The cache only serves these pre-draw layout decisions. It does not change
+how matplotlib measures text while drawing: that goes through matplotlib's
+own per-renderer cache, so a figure's text is still measured again when a
+new figure (or a resized canvas) draws it.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .profiling import _profiled
+
+__all__ = [
+    "TextMetricsCache",
+    "text_metrics",
+    "text_extent",
+    "text_extents",
+]
+
+
+def _is_math(text: str) -> bool:
+    return text.count("$") - text.count(r"\$") >= 2
+
+
+def _font_file(family: tuple[str, ...], weight: str | int, style: str) -> str:
+    """The font file matplotlib draws ``family`` with (memoized by matplotlib)."""
+    from matplotlib.font_manager import FontProperties, findfont
+
+    return findfont(FontProperties(family=list(family), weight=weight, style=style))
+
+
+def _measure(
+    text: str,
+    family: tuple[str, ...],
+    size: float,
+    weight: str | int,
+    style: str,
+) -> tuple[float, float, float]:
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.textpath import text_to_path
+
+    prop = FontProperties(family=list(family), size=size, weight=weight, style=style)
+    lines = text.split("\n")
+    widths, heights, descents = zip(*(
+        text_to_path.get_text_width_height_descent(line, prop, ismath=_is_math(line))
+        for line in lines
+    ))
+    # matplotlib's default linespacing between stacked lines
+    height = sum(heights) + 0.2 * size * (len(lines) - 1)
+    return max(widths), height, descents[-1]
+
+
+class TextMetricsCache:
+    """
+    Bounded LRU cache of text extents.
+
+    Parameters
+    ----------
+    max_entries : int, default 65536
+        Entries kept before the least recently used are dropped. Each entry
+        is a short string key plus three floats, so the default stays in the
+        low tens of megabytes.
+
+    Attributes
+    ----------
+    hits, misses : int
+        Lookup counters since creation or the last :meth:`clear`.
+    """
+
+    def __init__(self, max_entries: int = 65536):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[float, float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        text: str,
+        family: tuple[str, ...],
+        size: float,
+        weight: str | int = "normal",
+        style: str = "normal",
+    ) -> tuple[float, float, float]:
+        """Width, height and descent in points, measuring on a miss."""
+        font = _font_file(family, weight, style)
+        return self._lookup(font, text, family, size, weight, style)
+
+    def _lookup(self, font, text, family, size, weight, style):
+        key = (font, size, weight, style, text)
+        with self._lock:
+            extent = self._entries.get(key)
+            if extent is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return extent
+            self.misses += 1
+
+        extent = _measure(text, family, size, weight, style)
+        with self._lock:
+            self._entries[key] = extent
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return extent
+
+    def stats(self) -> dict:
+        """Lookup counters, hit rate and the number of cached extents."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+# Shared cache used by text_extent() and the package's layout helpers
+text_metrics = TextMetricsCache()
+
+
+def _font_args(family, size) -> tuple[tuple[str, ...], float]:
+    import matplotlib as mpl
+    from matplotlib.font_manager import FontProperties
+
+    if family is None:
+        family = mpl.rcParams["font.family"]
+    family = (family,) if isinstance(family, str) else tuple(family)
+    if size is None or isinstance(size, str):
+        size = FontProperties(size=size).get_size_in_points()
+    return family, float(size)
+
+
+@_profiled("text_layout")
+def text_extent(
+    text: str,
+    *,
+    family: str | list[str] | tuple[str, ...] | None = None,
+    size: float | str | None = None,
+    weight: str | int = "normal",
+    style: str = "normal",
+) -> tuple[float, float, float]:
+    """
+    Width, height and descent of ``text`` in points.
+
+    Parameters
+    ----------
+    text : str
+        Text to measure; newlines start new lines.
+    family : str | list[str] | None, default None
+        Font family or fallback chain; defaults to ``rcParams["font.family"]``
+        (the ``base_font`` given to :func:`~dubois_style.apply_dubois_style`).
+    size : float | str | None, default None
+        Font size in points or a named size ("small", "large", ...);
+        defaults to ``rcParams["font.size"]``.
+    weight, style
+        Font weight and style.
+
+    Examples
+    --------
+    >>> width, height, descent = text_extent("Series 1", size=10)
+    """
+    family, size = _font_args(family, size)
+    return text_metrics.get(text, family, size, weight, style)
+
+
+@_profiled("text_layout")
+def text_extents(
+    texts,
+    *,
+    family: str | list[str] | tuple[str, ...] | None = None,
+    size: float | str | None = None,
+    weight: str | int = "normal",
+    style: str = "normal",
+) -> np.ndarray:
+    """
+    Measure many strings with one font; returns an ``(N, 3)`` array.
+
+    Columns are width, height and descent in points. Repeated strings are
+    measured once.
+    """
+    family, size = _font_args(family, size)
+    font = _font_file(family, weight, style)
+    unique = {text: text_metrics._lookup(font, text, family, size, weight, style)
+              for text in dict.fromkeys(texts)}
+    return np.array([unique[text] for text in texts], dtype=float).reshape(-1, 3)
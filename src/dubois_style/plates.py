@@ -0,0 +1,339 @@
+"""Du Bois' signature chart types: spiral bars, fans and proportional bars.
+
+Each function draws its whole chart as one collection whose outlines come
+from :mod:`dubois_style.geometry`, so a plate with thousands of segments is
+a single draw call rather than thousands of ``Wedge`` or ``Rectangle``
+patches. Colors default to the active Du Bois color cycle and
+outlines to ``rcParams["patch.edgecolor"]``.
+"""
+
+import numpy as np
+
+from .geometry import arc_bands, rectangles, spiral_path
+
+__all__ = [
+    "dubois_spiral",
+    "dubois_fan",
+    "dubois_stacked_bars",
+]
+
+
+def _segment_colors(n: int, colors) -> np.ndarray:
+    """``(n, 4)`` RGBA, cycling ``colors`` (default: the active prop cycle)."""
+    import matplotlib as mpl
+    from matplotlib.colors import to_rgba_array
+
+    if colors is None:
+        colors = mpl.rcParams["axes.prop_cycle"].by_key()["color"]
+    table = to_rgba_array(colors)
+    return table[np.arange(n) % len(table)]
+
+
+def _text_colors(facecolors: np.ndarray) -> list[str]:
+    """White on dark segments, near-black on light ones."""
+    luminance = facecolors[:, :3] @ np.array([0.2126, 0.7152, 0.0722])
+    return ["white" if lum < 0.45 else "#111111" for lum in luminance]
+
+
+def _add_collection(ax, polygons, facecolors, kwargs, *, paths=False):
+    """Add one collection of ``polygons`` (vertex arrays, or ``Path`` objects)."""
+    import matplotlib as mpl
+    from matplotlib.collections import PathCollection, PolyCollection
+
+    kwargs.setdefault("edgecolors", mpl.rcParams["patch.edgecolor"])
+    kwargs.setdefault("linewidths", 0.5)
+    cls = PathCollection if paths else PolyCollection
+    collection = cls(polygons, facecolors=facecolors, **kwargs)
+    ax.add_collection(collection, autolim=True)
+    ax.autoscale_view()
+    return collection
+
+
+def _split_subpaths(path) -> list:
+    """One ``Path`` per ``MOVETO`` of ``path``, sharing its vertex buffer."""
+    from matplotlib.path import Path
+
+    bounds = np.append(np.flatnonzero(path.codes == Path.MOVETO), len(path.codes))
+    return [Path(path.vertices[a:b], path.codes[a:b])
+            for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def _legend_proxies(ax, facecolors, labels) -> None:
+    """Invisible patches so ``dubois_legend`` lists one entry per category."""
+    from matplotlib.patches import Rectangle
+
+    # add_artist, not add_patch: the proxies must not touch the data limits
+    for color, label in zip(facecolors, labels):
+        ax.add_artist(Rectangle((0, 0), 0, 0, facecolor=color, label=label))
+
+
+def dubois_spiral(
+    ax,
+    values,
+    *,
+    labels=None,
+    colors=None,
+    max_turns: float = 1.0,
+    radius: float = 1.0,
+    hole: float = 0.15,
+    width: float = 0.8,
+    start_angle: float = 90.0,
+    clockwise: bool = True,
+    points_per_turn: int = 64,
+    fontsize: float = 10,
+    **kwargs,
+):
+    """
+    Spiral bar chart: each bar is an arm that curls inward with its length.
+
+    Bars start side by side at ``start_angle``, outermost first. The largest
+    value turns ``max_turns`` times; every arm loses one full band of bars
+    per turn, so the arms nest without overlapping.
+
+    All outlines are generated at once as one compound path (see
+    :func:`~dubois_style.geometry.spiral_path`) and handed to a single
+    ``PathCollection`` as per-bar slices of it; Agg fills many small paths
+    faster than one path with many sub-paths.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Axes to draw on; its aspect is set to equal.
+    values : array_like
+        Non-negative bar lengths.
+    labels : Sequence[str], optional
+        Text placed just before each bar's start.
+    colors : Sequence, optional
+        Bar colors, cycled; defaults to the active color cycle.
+    max_turns : float, default 1.0
+        Turns made by the longest bar.
+    radius : float, default 1.0
+        Outer radius of the first bar.
+    hole : float, default 0.15
+        Fraction of ``radius`` left empty in the middle.
+    width : float, default 0.8
+        Bar thickness as a fraction of the spacing between bars.
+    start_angle : float, default 90.0
+        Angle in degrees where every bar starts (90 is the top).
+    clockwise : bool, default True
+        Direction the bars run.
+    points_per_turn : int, default 64
+        Vertices per bar edge per full turn.
+    fontsize : float, default 10
+        Label font size.
+    **kwargs
+        Passed to ``PathCollection``.
+
+    Returns
+    -------
+    matplotlib.collections.PathCollection
+
+    Examples
+    --------
+    >>> dubois_spiral(ax, [4_000, 2_800, 1_200, 600],
+    ...               labels=["Atlanta", "Savannah", "Augusta", "Macon"],
+    ...               max_turns=1.5)
+    >>> ax.axis("off")
+    """
+    values = np.asarray(values, dtype=float)
+    if np.any(values < 0):
+        raise ValueError("spiral bar values must be non-negative")
+    n = len(values)
+    vmax = values.max() if n and values.max() > 0 else 1.0
+
+    spacing = radius * (1.0 - hole) / (n * (max_turns + 1)) if n else 0.0
+    r_outer = radius - spacing * np.arange(n)
+    r_inner = r_outer - width * spacing
+    theta0 = np.deg2rad(start_angle)
+    sweep = values / vmax * max_turns * 2 * np.pi * (-1 if clockwise else 1)
+
+    compound = spiral_path(theta0, sweep, r_inner, r_outer,
+                           pitch=n * spacing, points_per_turn=points_per_turn)
+    paths = _split_subpaths(compound)
+    collection = _add_collection(ax, paths, _segment_colors(n, colors), kwargs, paths=True)
+    ax.set_aspect("equal")
+
+    if labels is not None:
+        mid = r_outer - width * spacing / 2
+        for r, text in zip(mid, labels):
+            ax.annotate(text, (r * np.cos(theta0), r * np.sin(theta0)),
+                        xytext=(-4, 0), textcoords="offset points",
+                        ha="right", va="center", fontsize=fontsize)
+    return collection
+
+
+def dubois_fan(
+    ax,
+    values,
+    *,
+    labels=None,
+    colors=None,
+    center: tuple[float, float] = (0.0, 0.0),
+    radius: float = 1.0,
+    inner_radius: float = 0.0,
+    start_angle: float = 180.0,
+    span: float = 180.0,
+    clockwise: bool = True,
+    fmt: str | None = None,
+    fontsize: float = 10,
+    resolution: int | None = None,
+    **kwargs,
+):
+    """
+    Fan chart: a half (or any fraction of a) disc split into wedges.
+
+    Wedge angles are proportional to ``values`` and together cover ``span``
+    degrees from ``start_angle``; the default is the upper half disc read
+    left to right, as in Du Bois' occupation plates. Draw a second fan with
+    ``start_angle=180, clockwise=False`` for the mirrored lower half.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Axes to draw on; its aspect is set to equal.
+    values : array_like
+        Non-negative wedge sizes.
+    labels : Sequence[str], optional
+        Legend entries, one per wedge.
+    colors : Sequence, optional
+        Wedge colors, cycled; defaults to the active color cycle.
+    center, radius, inner_radius
+        Geometry of the fan; ``inner_radius > 0`` draws a ring.
+    start_angle, span : float
+        Start angle and total sweep, in degrees.
+    clockwise : bool, default True
+        Direction the wedges are laid out.
+    fmt : str | None, default None
+        Format for each wedge's share, e.g. ``"{:.0%}"``, drawn inside it.
+    fontsize : float, default 10
+        Font size of the ``fmt`` text.
+    resolution : int | None, default None
+        Vertices per wedge edge; defaults to 64 per full turn of ``span``.
+    **kwargs
+        Passed to ``PolyCollection``.
+
+    Returns
+    -------
+    matplotlib.collections.PolyCollection
+
+    Examples
+    --------
+    >>> dubois_fan(ax, occupations, labels=names, fmt="{:.0%}")
+    >>> dubois_legend(ax, outside=True)
+    """
+    values = np.asarray(values, dtype=float)
+    if np.any(values < 0):
+        raise ValueError("fan values must be non-negative")
+    total = values.sum()
+    shares = values / total if total > 0 else np.zeros_like(values)
+
+    direction = -1 if clockwise else 1
+    edges = np.deg2rad(start_angle) + direction * np.deg2rad(span) * np.concatenate(
+        ([0.0], np.cumsum(shares))
+    )
+    resolution = resolution or max(8, int(np.ceil(64 * span / 360)))
+    polygons = arc_bands(edges[:-1], edges[1:], inner_radius, radius,
+                         center=center, resolution=resolution)
+    facecolors = _segment_colors(len(values), colors)
+    collection = _add_collection(ax, polygons, facecolors, kwargs)
+    ax.set_aspect("equal")
+
+    if labels is not None:
+        _legend_proxies(ax, facecolors, labels)
+    if fmt is not None:
+        mid_angle = (edges[:-1] + edges[1:]) / 2
+        mid_radius = (radius + inner_radius) / 2
+        for angle, share, color in zip(mid_angle, shares, _text_colors(facecolors)):
+            ax.text(center[0] + mid_radius * np.cos(angle),
+                    center[1] + mid_radius * np.sin(angle),
+                    fmt.format(share), ha="center", va="center",
+                    fontsize=fontsize, color=color)
+    return collection
+
+
+def dubois_stacked_bars(
+    ax,
+    values,
+    *,
+    labels=None,
+    bar_labels=None,
+    colors=None,
+    normalize: bool = True,
+    orientation: str = "horizontal",
+    width: float = 0.8,
+    fmt: str | None = None,
+    fontsize: float = 10,
+    **kwargs,
+):
+    """
+    Proportional stacked bars, Du Bois' "bar of life" layout.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Axes to draw on.
+    values : array_like
+        ``(n_bars, n_segments)`` segment sizes.
+    labels : Sequence[str], optional
+        Legend entries, one per segment column.
+    bar_labels : Sequence[str], optional
+        Tick labels, one per bar.
+    colors : Sequence, optional
+        Segment colors by column, cycled; defaults to the active color cycle.
+    normalize : bool, default True
+        Scale every bar to a total of 1, so segments show shares.
+    orientation : {"horizontal", "vertical"}, default "horizontal"
+        Direction the bars extend.
+    width : float, default 0.8
+        Bar thickness, in bar positions.
+    fmt : str | None, default None
+        Format for each segment's value, e.g. ``"{:.0%}"``, drawn inside it.
+    fontsize : float, default 10
+        Font size of the ``fmt`` text.
+    **kwargs
+        Passed to ``PolyCollection``.
+
+    Returns
+    -------
+    matplotlib.collections.PolyCollection
+
+    Examples
+    --------
+    >>> dubois_stacked_bars(ax, [[0.78, 0.22], [0.55, 0.45]],
+    ...                     labels=["Rural", "City"], bar_labels=["1870", "1890"],
+    ...                     fmt="{:.0%}")
+    """
+    if orientation not in ("horizontal", "vertical"):
+        raise ValueError("orientation must be 'horizontal' or 'vertical'")
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    n_bars, n_segments = values.shape
+    if normalize:
+        totals = values.sum(axis=1, keepdims=True)
+        values = np.divide(values, totals, out=np.zeros_like(values), where=totals != 0)
+
+    starts = np.cumsum(values, axis=1) - values
+    positions = np.repeat(np.arange(n_bars, dtype=float), n_segments)
+    lengths, offsets = values.ravel(), starts.ravel()
+    if orientation == "horizontal":
+        polygons = rectangles(offsets, positions - width / 2, lengths, width)
+    else:
+        polygons = rectangles(positions - width / 2, offsets, width, lengths)
+
+    column_colors = _segment_colors(n_segments, colors)
+    facecolors = np.tile(column_colors, (n_bars, 1))
+    collection = _add_collection(ax, polygons, facecolors, kwargs)
+
+    if bar_labels is not None:
+        if orientation == "horizontal":
+            ax.set_yticks(np.arange(n_bars), bar_labels)
+        else:
+            ax.set_xticks(np.arange(n_bars), bar_labels)
+    if labels is not None:
+        _legend_proxies(ax, column_colors, labels)
+    if fmt is not None:
+        centers = polygons.mean(axis=1)
+        for (x, y), value, color in zip(centers, lengths, _text_colors(facecolors)):
+            if value > 0:
+                ax.text(x, y, fmt.format(value), ha="center", va="center",
+                        fontsize=fontsize, color=color)
+    return collection
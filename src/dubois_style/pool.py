@@ -0,0 +1,292 @@
+"""A pool of pre-styled figures for low-latency chart rendering.
+
+Creating a ``Figure``, its canvas and its axes under the Du Bois style is a
+measurable share of the time to render a small chart. :class:`FigurePool`
+keeps figures that have been rendered and released, keyed on their layout
+and style options, and hands them out again instead of building new ones.
+
+Released figures are reset before they go back into the pool, so nothing
+drawn for one chart can show up in the next. Idle figures are capped by an
+estimate of their memory use, least recently released first out.
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+from ._figures import _clear_figure
+
+__all__ = [
+    "FigurePool",
+]
+
+# rough size of a figure's artists and transforms, excluding pixel buffers
+_FIGURE_OVERHEAD = 256 * 1024
+
+
+def _reset_axes(ax) -> None:
+    """Remove an axes' artists and restore the settings charts usually change."""
+    import matplotlib as mpl
+
+    for artist in [*ax.lines, *ax.patches, *ax.collections, *ax.images,
+                   *ax.texts, *ax.tables, *ax.artists]:
+        artist.remove()
+    if ax.legend_ is not None:
+        ax.legend_.remove()
+    for loc in ("center", "left", "right"):
+        if ax.get_title(loc):
+            ax.set_title("", loc=loc)
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    for axis, set_scale in ((ax.xaxis, ax.set_xscale), (ax.yaxis, ax.set_yscale)):
+        if axis.get_scale() != "linear" or not (
+            axis.isDefault_majloc and axis.isDefault_minloc
+            and axis.isDefault_majfmt and axis.isDefault_minfmt
+        ):
+            # also restores the default tick locators and formatters
+            set_scale("linear")
+    ax.set_aspect("auto")
+    ax.set_prop_cycle(None)
+    ax.relim()
+    ax.set_xlim(0, 1, auto=True)
+    ax.set_ylim(0, 1, auto=True)
+    for name, spine in ax.spines.items():
+        spine.set_visible(mpl.rcParams[f"axes.spines.{name}"])
+
+
+def _figure_bytes(fig) -> int:
+    """Estimated memory held by ``fig``, including a cached Agg buffer."""
+    renderer = getattr(fig.canvas, "renderer", None)
+    if renderer is None:
+        return _FIGURE_OVERHEAD
+    return _FIGURE_OVERHEAD + 4 * int(renderer.width) * int(renderer.height)
+
+
+class FigurePool:
+    """
+    Re-usable, pre-styled figures keyed on layout and style.
+
+    Parameters
+    ----------
+    max_bytes : int, default 128 MiB
+        Cap on the estimated memory of idle figures (artists plus the cached
+        Agg pixel buffer). Releasing a figure past the cap drops the least
+        recently released ones.
+    reset : {"artists", "full"}, default "artists"
+        What happens to a released figure:
+
+        - ``"artists"``: extra axes (colorbars, insets, twins) and every
+          figure- and axes-level artist are removed; titles, axis labels,
+          scales, tick locators and formatters, limits, autoscaling, aspect,
+          the color cycle, spine visibility and subplot parameters are
+          restored. Other axes settings made with ``tick_params``, ``grid``
+          or ``margins`` persist. About four times cheaper than ``"full"``.
+        - ``"full"``: all axes are removed and rebuilt, leaving no state
+          behind at all.
+
+    Attributes
+    ----------
+    hits, misses, evictions : int
+        Acquisitions served from the pool, acquisitions that built a new
+        figure, and idle figures dropped to honor ``max_bytes``.
+
+    Notes
+    -----
+    The pool's bookkeeping is thread-safe. Drawing still uses matplotlib's
+    process-wide rcParams through :func:`~dubois_style.dubois_style_context`.
+
+    Examples
+    --------
+    >>> pool = FigurePool()
+    >>> def handle(request):
+    ...     with pool.figure(figsize=(6, 4), style={"cycle": "dark"}) as (fig, ax):
+    ...         ax.bar(request.labels, request.values)
+    ...         buf = io.BytesIO()
+    ...         fig.savefig(buf, format="png")
+    ...     return buf.getvalue()
+    """
+
+    def __init__(self, max_bytes: int = 128 * 1024 * 1024, *, reset: str = "artists"):
+        if reset not in ("artists", "full"):
+            raise ValueError("reset must be 'artists' or 'full'")
+        self.max_bytes = max_bytes
+        self.reset = reset
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._idle: dict[tuple, list[tuple]] = {}
+        self._order: OrderedDict[int, tuple] = OrderedDict()
+        self._out: dict[int, tuple] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of idle figures."""
+        return len(self._order)
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimated memory of the idle figures."""
+        return self._bytes
+
+    @staticmethod
+    def _key(figsize, dpi, nrows, ncols, layout, style, subplots_kwargs) -> tuple:
+        return (
+            None if figsize is None else tuple(figsize), dpi, nrows, ncols, layout,
+            repr(sorted(style.items())), repr(sorted(subplots_kwargs.items())),
+        )
+
+    def acquire(
+        self,
+        *,
+        figsize: tuple[float, float] | None = None,
+        dpi: float | None = None,
+        nrows: int = 1,
+        ncols: int = 1,
+        layout: str | None = None,
+        style: dict | None = None,
+        **subplots_kwargs,
+    ):
+        """
+        A figure and its axes for the given layout, pooled if available.
+
+        ``figsize``, ``dpi`` and ``layout`` go to ``Figure``, the remaining
+        keyword arguments to ``Figure.subplots``; ``style`` holds the
+        :func:`~dubois_style.apply_dubois_style` options the figure is built
+        under. Draw inside ``dubois_style_context(**style)`` (as
+        :meth:`figure` does) so artists pick up the same style, then hand
+        the figure back with :meth:`release`.
+
+        Returns
+        -------
+        (matplotlib.figure.Figure, Axes or array of Axes)
+        """
+        style = dict(style or {})
+        key = self._key(figsize, dpi, nrows, ncols, layout, style, subplots_kwargs)
+        entry = None
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                entry = idle.pop()
+                self._bytes -= entry[2]
+                del self._order[id(entry[0])]
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if entry is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            from .style import dubois_style_context
+
+            with dubois_style_context(**style):
+                fig = Figure(figsize=figsize, dpi=dpi, layout=layout)
+                FigureCanvasAgg(fig)
+                axes = fig.subplots(nrows, ncols, **subplots_kwargs)
+            entry = (fig, axes, 0)
+
+        fig, axes, _ = entry
+        with self._lock:
+            self._out[id(fig)] = (key, fig, axes, style, (nrows, ncols, subplots_kwargs))
+        return fig, axes
+
+    def release(self, fig) -> None:
+        """
+        Reset a figure from :meth:`acquire` and return it to the pool.
+
+        Raises
+        ------
+        ValueError
+            If ``fig`` is not currently checked out from this pool.
+        """
+        import matplotlib as mpl
+
+        from .style import dubois_style_context
+
+        with self._lock:
+            checked_out = self._out.pop(id(fig), None)
+        if checked_out is None or checked_out[1] is not fig:
+            raise ValueError("figure is not checked out from this pool")
+        key, fig, axes, style, (nrows, ncols, subplots_kwargs) = checked_out
+
+        with dubois_style_context(**style):
+            if self.reset == "full":
+                _clear_figure(fig)
+                axes = fig.subplots(nrows, ncols, **subplots_kwargs)
+            else:
+                template = np.ravel(axes)
+                _clear_figure(fig, keep=template)
+                for ax in template:
+                    _reset_axes(ax)
+            figsize, dpi = key[:2]
+            fig.set_size_inches(figsize or mpl.rcParams["figure.figsize"], forward=False)
+            fig.set_dpi(dpi or mpl.rcParams["figure.dpi"])
+
+        nbytes = _figure_bytes(fig)
+        with self._lock:
+            if nbytes > self.max_bytes:
+                self.evictions += 1
+                return
+            self._idle.setdefault(key, []).append((fig, axes, nbytes))
+            self._order[id(fig)] = key
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        fig_id, key = self._order.popitem(last=False)
+        idle = self._idle[key]
+        for i, (fig, _, nbytes) in enumerate(idle):
+            if id(fig) == fig_id:
+                del idle[i]
+                self._bytes -= nbytes
+                self.evictions += 1
+                return
+
+    @contextmanager
+    def figure(self, **kwargs):
+        """
+        Acquire a figure, apply its style for the block, release it after.
+
+        Takes the arguments of :meth:`acquire` and yields ``(fig, axes)``.
+        Save or copy anything you need from the figure inside the block.
+        """
+        from .style import dubois_style_context
+
+        fig, axes = self.acquire(**kwargs)
+        try:
+            with dubois_style_context(**(kwargs.get("style") or {})):
+                yield fig, axes
+        finally:
+            self.release(fig)
+
+    def stats(self) -> dict:
+        """
+        Reuse counters and memory use of the pool.
+
+        Besides the counters described under Attributes and their hit rate:
+        ``idle`` and ``checked_out`` figure counts, and ``bytes``, the
+        estimated size of the idle figures, against ``max_bytes``.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "idle": len(self._order),
+            "checked_out": len(self._out),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        """Drop all idle figures and reset the counters."""
+        with self._lock:
+            self._idle.clear()
+            self._order.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,455 @@
+"""Opt-in profiling of where the time to render a Du Bois chart goes.
+
+Inside ``with profile() as prof:``, the package's entry points and the
+matplotlib phases they lead to are timed:
+
+===============  ==========================================================
+``style``        :func:`~dubois_style.apply_dubois_style`,
+                 :func:`~dubois_style.build_dubois_rc` and entering
+                 :func:`~dubois_style.dubois_style_context`
+``fonts``        font registration and matplotlib font lookup
+                 (``FontManager.findfont``)
+``legend``       :func:`~dubois_style.dubois_legend`, legend construction
+                 and drawing
+``text_layout``  :func:`~dubois_style.text_extent(s)` and matplotlib's
+                 text layout (``Text._get_layout``)
+``draw``         ``Figure.draw``: artist drawing not covered by a nested
+                 phase
+``rasterize``    Agg rasterization (``RendererAgg.draw_*``)
+``savefig``      ``print_figure``: encoding and writing the output
+===============  ==========================================================
+
+Phases nest; each reports its *self* time, excluding the phases nested in
+it, so the self times of a chart add up to the time spent on it. Work done
+while a figure is drawn or saved, or on a legend or text of a figure, is
+also attributed to that figure: :meth:`Profile.stats` has a per-chart
+breakdown, labelled with ``Figure.get_label()``.
+
+matplotlib methods are patched while at least one profile is active and
+restored afterwards; the package's own entry points check a flag, so with
+no profile active the cost is one branch per call. The patches are
+process-wide: while a profile is active, charts rendered on every thread
+are timed and counted in it, and pay the (small) cost of the timing
+wrappers. Agg rasterization is timed by wrapping the drawing methods that
+``RendererAgg`` binds per instance, which follows a matplotlib
+implementation detail; a renderer without one of them is simply not
+timed for it. Several hooks (``Text._get_layout``,
+``FontManager._find_fonts_by_props``) and the font cache counters use
+private matplotlib names too. Each is applied only if it exists, so on a
+matplotlib version without one that part is left untimed (or counted as
+0) instead of failing.
+"""
+
+import functools
+import json
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+__all__ = [
+    "PHASES",
+    "Profile",
+    "profile",
+]
+
+PHASES = ("style", "fonts", "legend", "text_layout", "draw", "rasterize", "savefig")
+
+# Active profiles; replaced, never mutated, so readers need no lock
+_sessions: tuple = ()
+_lock = threading.Lock()
+_local = threading.local()
+
+
+# ---------------------------------------------------------------------------
+# Timing frames
+# ---------------------------------------------------------------------------
+
+
+def _begin(phase: str, chart) -> list | None:
+    """Open a frame ``[phase, start, nested seconds, chart]`` on this thread."""
+    frames = getattr(_local, "frames", None)
+    if frames is None:
+        frames = _local.frames = []
+    for frame in frames:
+        if frame[0] == phase:
+            # re-entered (e.g. findfont -> findfont): the outer frame times it
+            return None
+    if chart is None and frames:
+        chart = frames[-1][3]
+    frame = [phase, time.perf_counter(), 0.0, chart]
+    frames.append(frame)
+    return frame
+
+
+def _end(frame: list) -> None:
+    elapsed = time.perf_counter() - frame[1]
+    frames = _local.frames
+    frames.pop()
+    if frames:
+        frames[-1][2] += elapsed
+    for session in _sessions:
+        session._record(frame[0], frame[3], elapsed, elapsed - frame[2])
+
+
+def _timed(phase: str, func, chart=None):
+    """``func`` timed as ``phase`` while a profile is active."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _sessions:
+            return func(*args, **kwargs)
+        frame = _begin(phase, chart(*args) if chart is not None else None)
+        if frame is None:
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _end(frame)
+
+    return wrapper
+
+
+def _profiled(phase: str, chart=None):
+    """Decorator form of :func:`_timed` for the package's entry points."""
+    return functools.partial(_timed, phase, chart=chart)
+
+
+@contextmanager
+def _phase(phase: str, chart=None):
+    """Time a block as ``phase`` while a profile is active."""
+    frame = _begin(phase, chart) if _sessions else None
+    try:
+        yield
+    finally:
+        if frame is not None:
+            _end(frame)
+
+
+def _root_figure(artist):
+    # follow ``.figure`` up from subfigures; a Figure is its own ``.figure``
+    fig = getattr(artist, "figure", None)
+    while fig is not None and getattr(fig, "figure", fig) is not fig:
+        fig = fig.figure
+    return fig
+
+
+def _self_figure(fig, *args):
+    return fig
+
+
+def _canvas_figure(canvas, *args):
+    return canvas.figure
+
+
+def _artist_figure(artist, *args):
+    return _root_figure(artist)
+
+
+def _parent_figure(legend, parent, *args):
+    return _root_figure(parent)
+
+
+def _axes_figure(*args):
+    # dubois_legend(ax, ...)
+    return _root_figure(args[0]) if args else None
+
+
+# ---------------------------------------------------------------------------
+# matplotlib hooks
+# ---------------------------------------------------------------------------
+
+# RendererAgg binds these from its C++ renderer per instance (in the private
+# RendererAgg._update_methods), so they are wrapped on each renderer rather
+# than on the class
+_RENDERER_METHODS = (
+    "draw_gouraud_triangles", "draw_image", "draw_markers",
+    "draw_path_collection", "draw_quad_mesh",
+)
+_patched: list = []
+# renderer -> {name: the bound method it had before it was hooked}
+_hooked_renderers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _hook_renderer(renderer) -> None:
+    if renderer in _hooked_renderers:
+        return
+    originals = {}
+    for name in _RENDERER_METHODS:
+        method = getattr(renderer, name, None)
+        if method is not None:
+            originals[name] = method
+            setattr(renderer, name, _timed("rasterize", method))
+    _hooked_renderers[renderer] = originals
+
+
+def _install() -> None:
+    from matplotlib.backend_bases import FigureCanvasBase
+    from matplotlib.backends.backend_agg import FigureCanvasAgg, RendererAgg
+    from matplotlib.figure import Figure
+    from matplotlib.font_manager import FontManager
+    from matplotlib.legend import Legend
+    from matplotlib.text import Text
+
+    hooks = [
+        (FontManager, "findfont", "fonts", None),
+        (FontManager, "_find_fonts_by_props", "fonts", None),
+        (Legend, "__init__", "legend", _parent_figure),
+        (Legend, "draw", "legend", None),
+        (Text, "_get_layout", "text_layout", _artist_figure),
+        (Figure, "draw", "draw", _self_figure),
+        (FigureCanvasBase, "print_figure", "savefig", _canvas_figure),
+        *((RendererAgg, name, "rasterize", None)
+          for name in ("draw_path", "draw_text", "draw_mathtext", "draw_tex")),
+    ]
+    for owner, name, phase, chart in hooks:
+        original = vars(owner).get(name)
+        if original is None:
+            continue  # not in this matplotlib version: that part goes untimed
+        _patched.append((owner, name, original))
+        setattr(owner, name, _timed(phase, original, chart))
+
+    get_renderer = vars(FigureCanvasAgg).get("get_renderer")
+    if get_renderer is None:
+        return
+
+    @functools.wraps(get_renderer)
+    def hooked_get_renderer(self):
+        renderer = get_renderer(self)
+        _hook_renderer(renderer)
+        return renderer
+
+    _patched.append((FigureCanvasAgg, "get_renderer", get_renderer))
+    FigureCanvasAgg.get_renderer = hooked_get_renderer
+
+
+def _uninstall() -> None:
+    while _patched:
+        owner, name, original = _patched.pop()
+        setattr(owner, name, original)
+    for renderer, originals in list(_hooked_renderers.items()):
+        for name, method in originals.items():
+            setattr(renderer, name, method)
+    _hooked_renderers.clear()
+
+
+def _cache_counters() -> dict[str, int]:
+    from matplotlib.font_manager import FontManager
+
+    from .metrics import text_metrics
+
+    # matplotlib's private findfont cache; counted as 0 where it is missing
+    cache_info = getattr(getattr(FontManager, "_findfont_cached", None), "cache_info", None)
+    fonts = cache_info() if cache_info is not None else None
+    return {
+        "font_cache_hits": getattr(fonts, "hits", 0),
+        "font_cache_misses": getattr(fonts, "misses", 0),
+        "text_metrics_hits": text_metrics.hits,
+        "text_metrics_misses": text_metrics.misses,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Profiles
+# ---------------------------------------------------------------------------
+
+
+def _phase_dict(totals: dict) -> dict:
+    return {
+        phase: {"calls": calls, "seconds": own, "inclusive_seconds": inclusive}
+        for phase, (calls, inclusive, own) in sorted(
+            totals.items(), key=lambda item: PHASES.index(item[0])
+        )
+    }
+
+
+def _label_value(value) -> str:
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+class Profile:
+    """
+    Timers and counters collected while a profile is active.
+
+    Use :func:`profile` to create one. Entering it again after it exited
+    keeps accumulating.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._phases: dict[str, list] = {}
+        # figure -> index into self._charts of [figure ref, label, phases]
+        self._chart_index = weakref.WeakKeyDictionary()
+        self._charts: list[list] = []
+        self._seconds = 0.0
+        self._started: float | None = None
+        self._counters = dict.fromkeys(
+            ("font_cache_hits", "font_cache_misses", "text_metrics_hits", "text_metrics_misses"), 0
+        )
+        self._counters_at_start: dict[str, int] = {}
+
+    def __enter__(self) -> "Profile":
+        global _sessions
+        with _lock:
+            if self in _sessions:
+                raise RuntimeError("this profile is already active")
+            if not _sessions:
+                _install()
+            self._counters_at_start = _cache_counters()
+            self._started = time.perf_counter()
+            _sessions = (*_sessions, self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global _sessions
+        with _lock:
+            _sessions = tuple(s for s in _sessions if s is not self)
+            self._seconds += time.perf_counter() - self._started
+            self._started = None
+            for name, value in _cache_counters().items():
+                self._counters[name] += value - self._counters_at_start[name]
+            if not _sessions:
+                _uninstall()
+
+    def _record(self, phase: str, chart, inclusive: float, own: float) -> None:
+        with self._lock:
+            totals = self._phases.setdefault(phase, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += inclusive
+            totals[2] += own
+            if chart is None:
+                return
+            index = self._chart_index.get(chart)
+            if index is None:
+                index = self._chart_index[chart] = len(self._charts)
+                self._charts.append([weakref.ref(chart), f"chart-{index + 1}", {}])
+            entry = self._charts[index]
+            # keep the latest label, in case the figure is gone by stats()
+            entry[1] = chart.get_label() or entry[1]
+            totals = entry[2].setdefault(phase, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += inclusive
+            totals[2] += own
+
+    def stats(self) -> dict:
+        """
+        Everything collected so far, as JSON-ready data.
+
+        Returns
+        -------
+        dict
+            ``seconds`` (wall time while active), ``phases`` (per phase:
+            ``calls``, ``seconds`` of self time and ``inclusive_seconds``),
+            ``counters`` (charts seen and font and text-metrics cache hits
+            and misses) and ``charts``, one entry per figure with its
+            ``chart`` label, total ``seconds`` and ``phases``.
+        """
+        with self._lock:
+            seconds = self._seconds
+            counters = dict(self._counters)
+            if self._started is not None:
+                seconds += time.perf_counter() - self._started
+                for name, value in _cache_counters().items():
+                    counters[name] += value - self._counters_at_start[name]
+            charts = []
+            for ref, fallback, phases in self._charts:
+                fig = ref()
+                label = (fig.get_label() if fig is not None else "") or fallback
+                charts.append({
+                    "chart": label,
+                    "seconds": sum(own for _, _, own in phases.values()),
+                    "phases": _phase_dict(phases),
+                })
+            return {
+                "seconds": seconds,
+                "phases": _phase_dict(self._phases),
+                "counters": {"charts": len(charts), **counters},
+                "charts": charts,
+            }
+
+    def to_json(self, **kwargs) -> str:
+        """:meth:`stats` as a JSON string; ``kwargs`` go to ``json.dumps``."""
+        return json.dumps(self.stats(), **kwargs)
+
+    def to_prometheus(self, *, prefix: str = "dubois_style", labels: dict | None = None) -> str:
+        """
+        The totals in the Prometheus text exposition format.
+
+        Per-phase self time and calls are counters labelled by ``phase``;
+        chart times are a summary (quantiles 0.5, 0.9 and 0.99) rather than
+        one series per chart, to keep label cardinality bounded.
+
+        Parameters
+        ----------
+        prefix : str, default "dubois_style"
+            Metric name prefix.
+        labels : dict | None, default None
+            Constant labels added to every sample, e.g. ``{"job": "reports"}``.
+        """
+        import numpy as np
+
+        stats = self.stats()
+        base = [f'{key}="{_label_value(value)}"' for key, value in (labels or {}).items()]
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for suffix, extra, value in samples:
+                pairs = base + [f'{key}="{_label_value(v)}"' for key, v in extra.items()]
+                label_text = "{" + ",".join(pairs) + "}" if pairs else ""
+                lines.append(f"{prefix}_{name}{suffix}{label_text} {value!r}")
+
+        phases = stats["phases"]
+        metric("phase_seconds_total", "counter",
+               "Self time spent in each rendering phase.",
+               [("", {"phase": p}, float(v["seconds"])) for p, v in phases.items()])
+        metric("phase_calls_total", "counter", "Calls of each rendering phase.",
+               [("", {"phase": p}, v["calls"]) for p, v in phases.items()])
+        counters = stats["counters"]
+        metric("charts_total", "counter", "Charts rendered while profiling.",
+               [("", {}, counters["charts"])])
+        for cache, what in (("font_cache", "Font lookup cache"),
+                            ("text_metrics", "Text metrics cache")):
+            metric(f"{cache}_hits_total", "counter", f"{what} hits.",
+                   [("", {}, counters[f"{cache}_hits"])])
+            metric(f"{cache}_misses_total", "counter", f"{what} misses.",
+                   [("", {}, counters[f"{cache}_misses"])])
+        chart_seconds = np.array([chart["seconds"] for chart in stats["charts"]])
+        quantiles = [
+            ("", {"quantile": str(q)},
+             float(np.quantile(chart_seconds, q)) if chart_seconds.size else float("nan"))
+            for q in (0.5, 0.9, 0.99)
+        ]
+        metric("chart_seconds", "summary", "Profiled time per chart.", quantiles + [
+            ("_sum", {}, float(chart_seconds.sum())),
+            ("_count", {}, int(chart_seconds.size)),
+        ])
+        metric("profile_seconds", "gauge", "Wall time the profile was active.",
+               [("", {}, float(stats["seconds"]))])
+        return "\n".join(lines) + "\n"
+
+
+def profile() -> Profile:
+    """
+    Profile Du Bois chart rendering inside a ``with`` block.
+
+    Returns
+    -------
+    Profile
+        A context manager; read its results with :meth:`Profile.stats`,
+        :meth:`Profile.to_json` or :meth:`Profile.to_prometheus`.
+
+    Examples
+    --------
+    >>> with dubois_style.profile() as prof:
+    ...     apply_dubois_style()
+    ...     fig, ax = plt.subplots()
+    ...     fig.set_label("revenue")
+    ...     ax.bar(names, values)
+    ...     dubois_legend(ax)
+    ...     fig.savefig("revenue.png")
+    >>> prof.stats()["charts"][0]["phases"]["rasterize"]["seconds"]
+    >>> open("metrics.prom", "w").write(prof.to_prometheus(labels={"job": "reports"}))
+    """
+    return Profile()
@@ -0,0 +1,113 @@
+"""Sequential ramps of any length, interpolated in a perceptual color space.
+
+The Du Bois palettes have seven colors, so continuous data mapped straight
+onto them falls into seven steps. :func:`dubois_ramp` interpolates between
+the palette's stops in CAM02-UCS (or CIELAB) to any number of steps, up to
+:data:`MAX_RAMP_STEPS`, with one vectorized pass per ramp. Stops are spaced
+by their perceptual distance from one another, so equal steps along the
+ramp look like equal changes in color.
+
+Ramps are memoized per ``(colors, steps, space)`` and returned as read-only
+arrays, so a heatmap redrawn at the same resolution costs nothing extra.
+"""
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+
+from .analysis import _FROM_SRGB, _TO_SRGB, SPACES, _check
+from .colors import _palette_colors, _rgba_table
+from .palettes import DUBOIS_FAMILIES
+
+__all__ = [
+    "MAX_RAMP_STEPS",
+    "dubois_ramp",
+]
+
+MAX_RAMP_STEPS = 65536
+
+
+def _ramp_colors(palette: str | Sequence[str]) -> tuple[str, ...]:
+    if isinstance(palette, str) and palette in DUBOIS_FAMILIES:
+        family = DUBOIS_FAMILIES[palette]
+        return (family["light"], family["dark"])
+    return _palette_colors(palette)
+
+
+@lru_cache(maxsize=32)
+def _ramp(colors: tuple[str, ...], steps: int, space: str) -> np.ndarray:
+    stops = _rgba_table(colors)
+    coords = _FROM_SRGB[space](stops[:, :3])
+    # place each stop at its cumulative distance along the ramp
+    position = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(coords, axis=0), axis=1))])
+    if position[-1] > 0:
+        position /= position[-1]
+    else:
+        position = np.linspace(0.0, 1.0, len(colors))
+    t = np.linspace(0.0, 1.0, steps)
+
+    out = np.empty((steps, 4))
+    ramp = np.column_stack([np.interp(t, position, coords[:, i]) for i in range(3)])
+    out[:, :3] = np.clip(_TO_SRGB[space](ramp), 0.0, 1.0)
+    out[:, 3] = np.interp(t, position, stops[:, 3])
+    out.setflags(write=False)
+    return out
+
+
+@lru_cache(maxsize=32)
+def _ramp8(colors: tuple[str, ...], steps: int, space: str) -> np.ndarray:
+    out = np.rint(_ramp(colors, steps, space) * 255).astype(np.uint8)
+    out.setflags(write=False)
+    return out
+
+
+def dubois_ramp(
+    steps: int,
+    palette: str | Sequence[str] = "light",
+    *,
+    space: str = "cam02ucs",
+    dtype=np.float64,
+) -> np.ndarray:
+    """
+    A palette interpolated to ``steps`` colors, as a read-only RGBA array.
+
+    The first and last colors are the palette's end stops. In between,
+    colors are interpolated linearly in ``space``, with each stop placed at
+    its cumulative perceptual distance from the first, and converted back
+    to sRGB (clipped to the gamut).
+
+    Parameters
+    ----------
+    steps : int
+        Number of colors, from 2 to :data:`MAX_RAMP_STEPS`.
+    palette : str | Sequence[str], default "light"
+        A name from :data:`~dubois_style.colors.PALETTES`, a family name
+        from :data:`~dubois_style.palettes.DUBOIS_FAMILIES` (its light
+        stop to its dark stop), or a sequence of colors.
+    space : {"cam02ucs", "lab"}, default "cam02ucs"
+        Interpolation space.
+    dtype : numpy dtype, default np.float64
+        ``np.uint8`` returns 0–255 channels.
+
+    Returns
+    -------
+    numpy.ndarray
+        Shared array of shape ``(steps, 4)``; copy it before modifying.
+
+    Examples
+    --------
+    >>> ramp = dubois_ramp(1024, "dark")
+    >>> ax.imshow(grid, cmap=ListedColormap(ramp))
+    >>> dubois_ramp(256, "Deep Navy", dtype=np.uint8).shape
+    (256, 4)
+    """
+    _check(space, SPACES, "space")
+    if not 2 <= steps <= MAX_RAMP_STEPS:
+        raise ValueError(f"steps must be between 2 and {MAX_RAMP_STEPS}, got {steps}")
+    colors = _ramp_colors(palette)
+    if len(colors) < 2:
+        raise ValueError("a ramp needs at least two colors")
+    if np.dtype(dtype) == np.uint8:
+        return _ramp8(colors, int(steps), space)
+    return _ramp(colors, int(steps), space).astype(dtype, copy=False)
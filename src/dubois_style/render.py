@@ -0,0 +1,264 @@
+"""Batch rendering of Du Bois–styled figures across worker processes.
+
+Each worker process is initialized once — Agg backend, Du Bois rcParams,
+custom fonts registered and the font lookup warmed — and then renders many
+figures. Figures are created as bare ``matplotlib.figure.Figure`` objects, so
+pyplot's global figure registry is never involved.
+
+Draw callables are sent to worker processes, so they must be picklable
+(module-level functions, ``functools.partial`` of them, ...).
+"""
+
+import os
+import time
+import traceback
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+__all__ = [
+    "RenderJob",
+    "RenderResult",
+    "render_batch",
+]
+
+
+@dataclass
+class RenderJob:
+    """
+    One figure to render.
+
+    Parameters
+    ----------
+    draw : Callable
+        Called as ``draw(fig, *args, **kwargs)`` with a fresh, empty
+        ``Figure``. It may populate that figure or return a different
+        ``Figure`` to save instead.
+    output : str | os.PathLike
+        Output path. The format is taken from the suffix unless ``formats``
+        is given.
+    args, kwargs
+        Extra arguments for ``draw``.
+    formats : Sequence[str] | None, default None
+        Write one file per format (e.g. ``("png", "svg", "pdf")``), replacing
+        the suffix of ``output``.
+    figsize : tuple[float, float] | None, default None
+        Figure size in inches; rcParams default if None.
+    dpi : float | None, default None
+        Output resolution; falls back to ``render_batch(dpi=...)``.
+    savefig_kwargs : dict
+        Extra keyword arguments for ``Figure.savefig``.
+    """
+
+    draw: Callable
+    output: str | os.PathLike
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    formats: Sequence[str] | None = None
+    figsize: tuple[float, float] | None = None
+    dpi: float | None = None
+    savefig_kwargs: dict = field(default_factory=dict)
+
+    def output_paths(self) -> list[Path]:
+        output = Path(self.output)
+        if not self.formats:
+            return [output]
+        return [output.with_suffix(f".{fmt.lstrip('.')}") for fmt in self.formats]
+
+
+@dataclass
+class RenderResult:
+    """Outcome and timing of one :class:`RenderJob`."""
+
+    index: int
+    outputs: list[Path]
+    draw_seconds: float = 0.0
+    save_seconds: float = 0.0
+    worker: int = 0
+    error: str | None = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def total_seconds(self) -> float:
+        return self.draw_seconds + self.save_seconds
+
+
+def _init_worker(style: dict) -> None:
+    """Process initializer: Agg backend, style and fonts, done once."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    from matplotlib import font_manager
+
+    from .style import apply_dubois_style
+
+    apply_dubois_style(**style)
+    # resolve the configured family now so the first figure doesn't pay for it
+    font_manager.findfont(
+        font_manager.FontProperties(family=matplotlib.rcParams["font.family"])
+    )
+
+
+def _render_one(index: int, job: RenderJob, dpi: float | None) -> RenderResult:
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    outputs = job.output_paths()
+    result = RenderResult(index=index, outputs=outputs, worker=os.getpid())
+    try:
+        start = time.perf_counter()
+        fig = Figure(figsize=job.figsize)
+        FigureCanvasAgg(fig)
+        returned = job.draw(fig, *job.args, **job.kwargs)
+        if returned is not None:
+            fig = returned
+        result.draw_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        save_dpi = job.dpi if job.dpi is not None else dpi
+        for path in outputs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fig.savefig(path, dpi=save_dpi if save_dpi is not None else "figure",
+                        **job.savefig_kwargs)
+        result.save_seconds = time.perf_counter() - start
+    except Exception:
+        result.error = traceback.format_exc()
+    return result
+
+
+def _render_chunk(
+    items: list[tuple[int, RenderJob]], dpi: float | None
+) -> list[RenderResult]:
+    return [_render_one(index, job, dpi) for index, job in items]
+
+
+def render_batch(
+    jobs: Sequence[RenderJob],
+    *,
+    max_workers: int | None = None,
+    dpi: float | None = None,
+    chunksize: int | None = None,
+    cache=None,
+    **style,
+) -> list[RenderResult]:
+    """
+    Render many figures in parallel with the Du Bois style applied.
+
+    Parameters
+    ----------
+    jobs : Sequence[RenderJob]
+        Figures to render.
+    max_workers : int | None, default None
+        Worker processes (one per CPU if None). ``1`` renders in the calling
+        process inside :func:`~dubois_style.dubois_style_context`, which is
+        handy for debugging draw functions.
+    dpi : float | None, default None
+        Default output resolution for jobs that don't set their own.
+    chunksize : int | None, default None
+        Jobs sent to a worker per round trip. Defaults to spreading the
+        batch into roughly four chunks per worker.
+    cache : RenderCache | None, default None
+        Optional :class:`~dubois_style.cache.RenderCache`. Jobs whose every
+        output is cached are written straight from the cache (``cached`` is
+        set on their result) and never reach a worker; fresh renders are
+        added to it.
+    **style
+        Keyword arguments for :func:`~dubois_style.apply_dubois_style`
+        (``cycle``, ``use_contrast_colors``, ``custom_font_paths``, ...),
+        applied once per worker.
+
+    Returns
+    -------
+    list[RenderResult]
+        One result per job, in input order. A failing job does not stop the
+        batch; its traceback is stored in ``RenderResult.error``.
+
+    Examples
+    --------
+    >>> def bar_chart(fig, values):
+    ...     ax = fig.subplots()
+    ...     ax.bar(range(len(values)), values)
+    >>> jobs = [
+    ...     RenderJob(bar_chart, f"out/chart_{i}.png", args=(v,), formats=("png", "svg"))
+    ...     for i, v in enumerate(all_values)
+    ... ]
+    >>> results = render_batch(jobs, cycle="dark", dpi=150)
+    >>> sum(r.total_seconds for r in results)
+    """
+    items = list(enumerate(jobs))
+    if not items:
+        return []
+
+    done: dict[int, RenderResult] = {}
+    keys: dict[int, list[str]] = {}
+    if cache is not None:
+        items, done, keys = _from_cache(cache, items, dpi, style)
+
+    fresh = _render_items(items, max_workers, dpi, chunksize, style) if items else []
+
+    if cache is not None:
+        for result in fresh:
+            if result.ok:
+                for key, path in zip(keys[result.index], result.outputs):
+                    cache.put(key, path.read_bytes())
+    done.update((result.index, result) for result in fresh)
+    return [done[index] for index in sorted(done)]
+
+
+def _from_cache(cache, items, dpi, style):
+    """Split ``items`` into cache misses and results written from the cache."""
+    pending, done, keys = [], {}, {}
+    for index, job in items:
+        outputs = job.output_paths()
+        job_dpi = job.dpi if job.dpi is not None else dpi
+        keys[index] = [
+            cache.key(job.draw, job.args, job.kwargs, style=style,
+                      fmt=path.suffix, dpi=job_dpi, figsize=job.figsize,
+                      savefig_kwargs=job.savefig_kwargs)
+            for path in outputs
+        ]
+        start = time.perf_counter()
+        blobs = []
+        for key in keys[index]:
+            data = cache.get(key)
+            if data is None:
+                break
+            blobs.append(data)
+        if len(blobs) < len(outputs):
+            pending.append((index, job))
+            continue
+        for path, data in zip(outputs, blobs):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        done[index] = RenderResult(
+            index=index, outputs=outputs, worker=os.getpid(), cached=True,
+            save_seconds=time.perf_counter() - start,
+        )
+    return pending, done, keys
+
+
+def _render_items(items, max_workers, dpi, chunksize, style) -> list[RenderResult]:
+    if max_workers == 1:
+        from .style import dubois_style_context
+
+        with dubois_style_context(**style):
+            return _render_chunk(items, dpi)
+
+    workers = max_workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(items) // (workers * 4))
+    chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+
+    results: list[RenderResult] = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(style,)
+    ) as pool:
+        for chunk_results in pool.map(_render_chunk, chunks, [dpi] * len(chunks)):
+            results.extend(chunk_results)
+    return results
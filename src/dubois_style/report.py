@@ -0,0 +1,151 @@
+"""Streaming multi-page PDF reports of Du Bois–styled figures.
+
+:class:`DuboisReport` writes every page to disk as soon as it is finished,
+so a 500-page report holds one figure per page layout in memory, not 500.
+Pages with the same layout reuse one template figure; between pages it is
+emptied and its axes are rebuilt from the layout.
+
+All pages go into a single ``PdfPages`` document. matplotlib's PDF backend
+tracks the glyphs used across the whole document and writes each font —
+subset to those glyphs — once, when the report is closed, rather than once
+per page as happens when separately saved PDFs are concatenated.
+"""
+
+import os
+from contextlib import contextmanager
+from typing import BinaryIO
+
+from ._figures import _clear_figure
+
+__all__ = [
+    "DuboisReport",
+]
+
+
+def _close_figure(fig) -> None:
+    """Release a figure: close it in pyplot if it is managed there, else clear it."""
+    if getattr(fig.canvas, "manager", None) is not None:
+        import matplotlib.pyplot as plt
+
+        plt.close(fig)
+    else:
+        fig.clear()
+
+
+class DuboisReport:
+    """
+    Multi-page PDF writer that streams Du Bois–styled pages to disk.
+
+    Parameters
+    ----------
+    path : str | os.PathLike | file-like
+        Output PDF file, or a binary file object.
+    style : dict | None, default None
+        Options for :func:`~dubois_style.dubois_style_context`, active while
+        each page is drawn and saved.
+    metadata : dict | None, default None
+        PDF document metadata (``Title``, ``Author``, ...).
+    savefig_kwargs : dict | None, default None
+        Extra keyword arguments for every page's ``savefig`` (``dpi`` for
+        rasterized artists, ``bbox_inches``, ...).
+
+    Attributes
+    ----------
+    pages : int
+        Pages written so far.
+
+    Examples
+    --------
+    >>> with DuboisReport("report.pdf", style={"use_contrast_colors": True}) as report:
+    ...     for county, series in data.items():
+    ...         with report.page(figsize=(8.5, 11), nrows=2) as (fig, (top, bottom)):
+    ...             top.plot(series.index, series.values)
+    ...             bottom.bar(series.index, series.diff())
+    ...             fig.suptitle(county)
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | BinaryIO,
+        *,
+        style: dict | None = None,
+        metadata: dict | None = None,
+        savefig_kwargs: dict | None = None,
+    ):
+        from matplotlib.backends.backend_pdf import PdfPages
+
+        self.path = path
+        self.style = dict(style or {})
+        self.savefig_kwargs = dict(savefig_kwargs or {})
+        self.pages = 0
+        self._pdf = PdfPages(self.path, metadata=metadata)
+        self._templates: dict[tuple, object] = {}
+
+    def __enter__(self) -> "DuboisReport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Write the fonts and trailer and close the file; safe to call twice."""
+        if self._pdf is None:
+            return
+        self._pdf.close()
+        self._pdf = None
+        self._templates.clear()
+
+    @contextmanager
+    def page(
+        self,
+        *,
+        figsize: tuple[float, float] | None = None,
+        nrows: int = 1,
+        ncols: int = 1,
+        layout: str | None = None,
+        **subplots_kwargs,
+    ):
+        """
+        Draw one page; it is written when the ``with`` block exits.
+
+        The arguments describe the page layout and are passed to ``Figure``
+        (``figsize``, ``layout``) and ``Figure.subplots`` (the rest). The
+        first page of a layout creates its template figure; later pages get
+        the same figure back, emptied, with newly created axes. If the block
+        raises, the page is not written.
+
+        Yields
+        ------
+        (matplotlib.figure.Figure, Axes or array of Axes)
+        """
+        if self._pdf is None:
+            raise ValueError("report is closed")
+        from .style import dubois_style_context
+
+        key = (None if figsize is None else tuple(figsize), nrows, ncols, layout,
+               repr(sorted(subplots_kwargs.items())))
+        with dubois_style_context(**self.style):
+            fig = self._templates.get(key)
+            if fig is None:
+                from matplotlib.backends.backend_agg import FigureCanvasAgg
+                from matplotlib.figure import Figure
+
+                fig = self._templates[key] = Figure(figsize=figsize, layout=layout)
+                FigureCanvasAgg(fig)
+            else:
+                _clear_figure(fig)
+            yield fig, fig.subplots(nrows, ncols, **subplots_kwargs)
+            self._pdf.savefig(fig, **self.savefig_kwargs)
+            self.pages += 1
+
+    def add_figure(self, fig) -> None:
+        """
+        Write an already drawn figure as the next page, then release it.
+
+        pyplot figures are closed with ``plt.close``; others are cleared.
+        """
+        if self._pdf is None:
+            raise ValueError("report is closed")
+        self._pdf.savefig(fig, **self.savefig_kwargs)
+        self.pages += 1
+        _close_figure(fig)
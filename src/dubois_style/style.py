@@ -1,8 +1,14 @@
-"""Apply Du Bois–inspired styling to matplotlib plots."""
+"""Apply Du Bois–inspired styling to matplotlib plots.
 
-from cycler import cycler
-from matplotlib import pyplot as plt
-from matplotlib import font_manager
+matplotlib is imported inside the functions rather than at module level so
+that importing this module (or the package) stays cheap; the cost is paid
+once, on the first call to :func:`apply_dubois_style`.
+"""
+
+from collections.abc import Mapping
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
 
 from .palettes import (
     DUBOIS_CATEGORICAL_CYCLE,
@@ -10,6 +16,7 @@ from .palettes import (
     DUBOIS_FAMILIES,
     DUBOIS_LIGHT_CYCLE,
 )
+from .profiling import _axes_figure, _phase, _profiled
 
 # Re-export palettes for convenience
 __all__ = [
@@ -18,10 +25,13 @@ __all__ = [
     "DUBOIS_DARK_CYCLE",
     "DUBOIS_CATEGORICAL_CYCLE",
     "apply_dubois_style",
+    "build_dubois_rc",
+    "dubois_style_context",
     "dubois_legend",
 ]
 
 
+@_profiled("style")
 def apply_dubois_style(
     *,
     cycle: str = "light",
@@ -57,10 +67,16 @@ def apply_dubois_style(
         - ["Public Sans", "DejaVu Sans"] (if Public Sans installed)
     custom_font_paths : list[str] | None, default None
         Optional paths to custom font files (.ttf, .otf) to register.
-        Fonts will be registered with matplotlib's font manager.
+        Fonts will be registered with matplotlib's font manager. Files
+        already registered (same path, mtime and size) are skipped; see
+        :mod:`dubois_style.fonts`.
 
     Notes
     -----
+    The Du Bois colormaps (``"dubois_light"``, ``"dubois_dark"``, ...) are
+    registered with matplotlib on the first call; see
+    :mod:`dubois_style.colormaps`.
+
     This package uses open-source fonts by default:
     - **DejaVu Sans**: Pre-installed with matplotlib, excellent readability
     - **Liberation Sans**: Often pre-installed, Arial/Helvetica alternative
@@ -91,10 +107,168 @@ def apply_dubois_style(
     ...     cycle="dark"
     ... )
     """
-    # Register custom font files if provided
-    if custom_font_paths is not None:
-        for font_path in custom_font_paths:
-            font_manager.fontManager.addfont(font_path)
+    from .colormaps import register_dubois_colormaps
+
+    _register_fonts(custom_font_paths)
+    register_dubois_colormaps()
+    rc = _build_rc(
+        cycle, show_x_axis, show_y_axis, use_contrast_colors, _font_key(base_font)
+    )
+    if not _rc_is_active(rc):
+        _swap_in(rc)
+
+
+@contextmanager
+def dubois_style_context(
+    *,
+    cycle: str = "light",
+    show_x_axis: bool = False,
+    show_y_axis: bool = False,
+    use_contrast_colors: bool = False,
+    base_font: str | list[str] = "DejaVu Sans",
+    custom_font_paths: list[str] | None = None,
+):
+    """
+    Apply the DuBois style for a block of code and restore rcParams afterwards.
+
+    Takes the same keyword arguments as :func:`apply_dubois_style`. The rc
+    dictionary for each option combination is built and validated once and
+    cached, so entering the context is a plain dict swap. On exit every
+    rcParam (including ones changed inside the block) is restored.
+
+    Can also be used as a decorator.
+
+    Notes
+    -----
+    matplotlib keeps rcParams in a single process-wide dict; this context
+    scopes the change in time, not per thread. Concurrent threads that enter
+    different contexts still see each other's settings.
+
+    Examples
+    --------
+    >>> with dubois_style_context(cycle="dark", use_contrast_colors=True):
+    ...     fig, ax = plt.subplots()
+    ...     ax.plot([1, 2, 3])
+    ...     fig.savefig("dark.png")
+
+    >>> @dubois_style_context(show_x_axis=True)
+    ... def make_chart():
+    ...     ...
+    """
+    import matplotlib as mpl
+
+    from .colormaps import register_dubois_colormaps
+
+    with _phase("style"):
+        _register_fonts(custom_font_paths)
+        register_dubois_colormaps()
+        rc = _build_rc(
+            cycle, show_x_axis, show_y_axis, use_contrast_colors, _font_key(base_font)
+        )
+        # raw dict operations: values in `rc` and `saved` are already validated
+        saved = dict.copy(mpl.rcParams)
+        saved.pop("backend", None)
+        _swap_in(rc)
+    try:
+        yield
+    finally:
+        dict.update(mpl.rcParams, saved)
+
+
+@_profiled("style")
+def build_dubois_rc(
+    *,
+    cycle: str = "light",
+    show_x_axis: bool = False,
+    show_y_axis: bool = False,
+    use_contrast_colors: bool = False,
+    base_font: str | list[str] = "DejaVu Sans",
+) -> Mapping:
+    """
+    Return the validated DuBois rc mapping for one set of style options.
+
+    Results are memoized per option tuple, so repeated calls are a cache
+    lookup. The returned mapping is read-only, with list-valued settings
+    (``font.family``) as tuples; pass it to ``matplotlib.rc_context`` or
+    ``Figure``-level tooling as needed, or copy it with ``dict(...)`` before
+    modifying.
+
+    Parameters
+    ----------
+    cycle, show_x_axis, show_y_axis, use_contrast_colors, base_font
+        Same meaning as in :func:`apply_dubois_style`.
+
+    Returns
+    -------
+    Mapping
+        Frozen mapping of rcParam name to validated value.
+
+    Examples
+    --------
+    >>> rc = build_dubois_rc(cycle="dark", use_contrast_colors=True)
+    >>> with matplotlib.rc_context(rc):
+    ...     fig, ax = plt.subplots()
+    """
+    return _build_rc(
+        cycle, show_x_axis, show_y_axis, use_contrast_colors, _font_key(base_font)
+    )
+
+
+def _font_key(base_font: str | list[str]) -> tuple[str, ...]:
+    """Normalize ``base_font`` to a hashable fallback chain."""
+    return (base_font,) if isinstance(base_font, str) else tuple(base_font)
+
+
+def _register_fonts(custom_font_paths: list[str] | None) -> None:
+    """Register custom font files with matplotlib's font manager."""
+    if custom_font_paths is None:
+        return
+    from .fonts import font_registry
+
+    font_registry.register(custom_font_paths)
+
+
+def _rc_value(value):
+    """A cached rc value in the form rcParams stores it (tuples as lists)."""
+    return list(value) if isinstance(value, tuple) else value
+
+
+def _rc_is_active(rc: Mapping) -> bool:
+    """Return True if every entry of ``rc`` is already in effect."""
+    import matplotlib as mpl
+
+    params = mpl.rcParams
+    for key, value in rc.items():
+        current = dict.get(params, key)
+        if current is not value and current != _rc_value(value):
+            return False
+    return True
+
+
+def _swap_in(rc: Mapping) -> None:
+    """Write pre-validated ``rc`` values into rcParams, skipping validators."""
+    import matplotlib as mpl
+
+    dict.update(mpl.rcParams, {k: _rc_value(v) for k, v in rc.items()})
+
+
+@lru_cache(maxsize=128)
+def _build_rc(
+    cycle: str,
+    show_x_axis: bool,
+    show_y_axis: bool,
+    use_contrast_colors: bool,
+    base_font: tuple[str, ...],
+) -> Mapping:
+    """
+    Build and validate the DuBois rc mapping for one option set.
+
+    The result is shared by every caller, so it is frozen: a read-only
+    mapping whose list values (``font.family``) are stored as tuples.
+    :func:`_rc_value` turns them back into the lists rcParams holds.
+    """
+    import matplotlib as mpl
+    from cycler import cycler
 
     if use_contrast_colors:
         # same categorical palette regardless of base light/dark choice
@@ -107,7 +281,7 @@ def apply_dubois_style(
         else:
             raise ValueError("cycle must be 'light' or 'dark'")
 
-    plt.rcParams.update({
+    rc = {
         # Transparency & backgrounds
         "figure.facecolor": "none",
         "axes.facecolor": "none",
@@ -133,7 +307,7 @@ def apply_dubois_style(
         "ytick.labelsize": 10,
 
         # Text & legend
-        "font.family": [base_font] if isinstance(base_font, str) else base_font,
+        "font.family": list(base_font),
         "text.color": "#111111",
         "axes.labelcolor": "#111111",
         "xtick.color": "#666666",
@@ -144,14 +318,22 @@ def apply_dubois_style(
         # Lines & patches
         "lines.linewidth": 2.0,
         "patch.edgecolor": "#111111",
+    }
+    # run every value through matplotlib's validators once, here
+    validated = mpl.RcParams(rc)
+    return MappingProxyType({
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in dict.items(validated)
     })
 
 
+@_profiled("legend", chart=_axes_figure)
 def dubois_legend(
     ax,
     *args,
     outside: bool = True,
     outside_pad: float = 0.02,
+    reserve_space: bool = False,
     **kwargs,
 ):
     """
@@ -167,6 +349,15 @@ def dubois_legend(
         If False, fall back to an inside location (default 'best' or kwargs["loc"]).
     outside_pad : float, default 0.02
         Horizontal padding beyond the axes when outside=True.
+    reserve_space : bool, default False
+        Only with ``outside=True``. Measure the labels up front (cached, see
+        :func:`~dubois_style.metrics.text_extent`), wrap long series lists
+        into as many columns as needed to fit the axes height (unless
+        ``ncols`` is given), and shrink the figure's right margin so the
+        legend fits. The figure can then be saved without
+        ``bbox_inches="tight"`` or ``tight_layout()``, which avoids their
+        extra full-figure text measurement passes. Skipped when a layout
+        engine that manages positions itself (constrained layout) is active.
     *args, **kwargs :
         Passed through to ax.legend().
 
@@ -181,11 +372,17 @@ def dubois_legend(
     >>> fig, ax = plt.subplots()
     >>> ax.plot([1, 2, 3], label="Series 1")
     >>> dubois_legend(ax, outside=True)
+
+    >>> # 60 series: wrap into columns and make room without a tight bbox
+    >>> dubois_legend(ax, reserve_space=True)
+    >>> fig.savefig("many_series.png")
     """
     if outside:
         # Get the current loc/bbox if provided, otherwise use defaults
         loc = kwargs.pop("loc", "center left")
         bbox = kwargs.pop("bbox_to_anchor", (1.0 + outside_pad, 0.5))
+        if reserve_space:
+            _reserve_legend_space(ax, args, kwargs, outside_pad)
         return ax.legend(
             *args,
             loc=loc,
@@ -199,3 +396,97 @@ def dubois_legend(
         kwargs.setdefault("loc", "best")
         kwargs.setdefault("frameon", False)
         return ax.legend(*args, **kwargs)
+
+
+def _legend_labels(ax, args, kwargs) -> list[str]:
+    """The labels ax.legend(*args, **kwargs) would show."""
+    if "labels" in kwargs:
+        return [str(label) for label in kwargs["labels"]]
+    if len(args) == 2:
+        return [str(label) for label in args[1]]
+    if len(args) == 1:
+        return [str(label) for label in args[0]]
+    if "handles" in kwargs:
+        return [h.get_label() for h in kwargs["handles"]]
+    return ax.get_legend_handles_labels()[1]
+
+
+def _reserve_legend_space(ax, args, kwargs, outside_pad: float) -> None:
+    """Pick a column count and move the right margin to fit the legend.
+
+    Mirrors the legend geometry matplotlib uses (handle length, paddings,
+    column-major filling) with label sizes from the text metrics cache, so
+    no draw is needed. Sets ``kwargs["ncols"]`` unless one was given.
+    """
+    import matplotlib as mpl
+    from matplotlib.font_manager import FontProperties
+
+    from .metrics import text_extent
+
+    labels = _legend_labels(ax, args, kwargs)
+    if not labels:
+        return
+    fig = ax.get_figure()
+    params = mpl.rcParams
+
+    def option(name):
+        value = kwargs.get(name)
+        return params[f"legend.{name}"] if value is None else value
+
+    prop = kwargs.get("prop")
+    if isinstance(prop, dict):
+        prop = FontProperties(**prop)
+    if prop is None:
+        prop = FontProperties(size=kwargs.get("fontsize", params["legend.fontsize"]))
+    fontsize = prop.get_size_in_points()
+    family = prop.get_family()
+
+    extents = [
+        text_extent(label, family=family, size=fontsize,
+                    weight=prop.get_weight(), style=prop.get_style())
+        for label in labels
+    ]
+    handle_w = (option("handlelength") + option("handletextpad")) * fontsize
+    row_h = max(max(h for _, h, _ in extents), option("handleheight") * fontsize)
+    border = 2 * option("borderpad") * fontsize
+
+    ax_box = ax.get_position()
+    fig_w_pt = fig.get_figwidth() * 72
+    axes_h_pt = ax_box.height * fig.get_figheight() * 72
+
+    def columns(ncols):
+        rows, large = divmod(len(labels), ncols)
+        sizes = [rows + 1] * large + [rows] * (ncols - large)
+        start = 0
+        for size in sizes:
+            yield extents[start:start + size]
+            start += size
+
+    def legend_size(ncols):
+        cols = [c for c in columns(ncols) if c]
+        width = sum(handle_w + max(w for w, _, _ in col) for col in cols)
+        width += (len(cols) - 1) * option("columnspacing") * fontsize + border
+        nrows = max(len(col) for col in cols)
+        height = nrows * row_h + (nrows - 1) * option("labelspacing") * fontsize + border
+        return width, height
+
+    ncols = kwargs.get("ncols", kwargs.get("ncol"))
+    if ncols is None:
+        ncols = 1
+        while ncols < len(labels) and legend_size(ncols)[1] > axes_h_pt:
+            ncols += 1
+        kwargs["ncols"] = ncols
+    width_pt, _ = legend_size(ncols)
+
+    engine = fig.get_layout_engine()
+    if engine is not None and not engine.adjust_compatible:
+        return
+    needed = (width_pt + outside_pad * ax_box.width * fig_w_pt) / fig_w_pt
+    # keep a sliver of blank figure beyond the legend
+    right = 1.0 - needed - 0.01
+    if right >= ax_box.x1 or right <= ax_box.x0:
+        return
+    if ax.get_subplotspec() is not None and right < fig.subplotpars.right:
+        fig.subplots_adjust(right=right)
+    else:
+        ax.set_position([ax_box.x0, ax_box.y0, right - ax_box.x0, ax_box.height])
@@ -0,0 +1,122 @@
+"""Tests for dubois_style.analysis."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from dubois_style import (
+    DUBOIS_CATEGORICAL_CYCLE,
+    categorical_cycle,
+    delta_e_matrix,
+    order_palette,
+    palette_coordinates,
+    simulate_cvd,
+)
+from dubois_style.analysis import (
+    _ciede2000,
+    _min_distance,
+    cam02ucs_to_srgb,
+    dubois_candidates,
+    lab_to_srgb,
+    srgb_to_cam02ucs,
+    srgb_to_lab,
+)
+
+
+def test_reference_values():
+    np.testing.assert_allclose(srgb_to_lab([1, 0, 0]), [53.24, 80.09, 67.20], atol=0.02)
+    np.testing.assert_allclose(srgb_to_lab([1, 1, 1]), [100, 0, 0], atol=1e-6)
+    np.testing.assert_allclose(srgb_to_cam02ucs([1, 0, 0]), [60.05, 38.69, 24.32], atol=0.05)
+
+
+def test_ciede2000_sharma_pairs():
+    # Sharma, Wu & Dalal (2005), test data pairs 1, 7, 17, 25, 31, 34
+    pairs = np.array([
+        [[50, 2.6772, -79.7751], [50, 0, -82.7485], 2.0425],
+        [[50, 0, 0], [50, -1, 2], 2.3669],
+        [[50, 2.5, 0], [56, -27, -3], 31.9030],
+        [[60.2574, -34.0099, 36.2677], [60.4626, -34.1751, 39.4387], 1.2644],
+        [[90.8027, -2.0831, 1.4410], [91.1528, -1.6435, 0.0447], 1.4441],
+        [[35.0831, -44.1164, 3.7933], [35.0232, -40.0716, 1.5901], 1.8645],
+    ], dtype=object)
+    lab1 = np.array(pairs[:, 0].tolist(), dtype=float)
+    lab2 = np.array(pairs[:, 1].tolist(), dtype=float)
+    np.testing.assert_allclose(_ciede2000(lab1, lab2), pairs[:, 2].astype(float), atol=1e-4)
+
+
+def test_round_trips():
+    rgb = np.random.default_rng(0).random((500, 3))
+    np.testing.assert_allclose(lab_to_srgb(srgb_to_lab(rgb)), rgb, atol=1e-10)
+    np.testing.assert_allclose(cam02ucs_to_srgb(srgb_to_cam02ucs(rgb)), rgb, atol=1e-10)
+
+
+def test_simulate_cvd():
+    rgb = np.random.default_rng(1).random((50, 3))
+    np.testing.assert_allclose(simulate_cvd(rgb, "deutan", severity=0), rgb, atol=1e-12)
+    # dichromats can't tell red from green apart along the confusion line
+    red, green = simulate_cvd([[0.8, 0.3, 0.2], [0.45, 0.45, 0.2]], "protan")
+    assert np.abs(red - green).max() < 0.15
+    with pytest.raises(ValueError, match="cvd kind"):
+        simulate_cvd(rgb, "achromat")
+
+
+def test_cached_arrays_are_read_only():
+    coords = palette_coordinates("categorical")
+    assert coords.shape == (len(DUBOIS_CATEGORICAL_CYCLE), 3)
+    assert palette_coordinates(list(DUBOIS_CATEGORICAL_CYCLE)) is coords
+    d = delta_e_matrix("categorical")
+    assert delta_e_matrix("categorical") is d
+    with pytest.raises(ValueError):
+        d[0, 1] = 0
+    np.testing.assert_allclose(d, d.T)
+    np.testing.assert_allclose(np.diag(d), 0, atol=1e-12)
+
+
+def test_worst_case_cvd():
+    normal = delta_e_matrix("categorical", metric="ciede2000")
+    worst = delta_e_matrix("categorical", metric="ciede2000", cvd="all")
+    assert np.all(worst <= normal + 1e-12)
+    for kind in ("protan", "deutan", "tritan"):
+        assert np.all(worst <= delta_e_matrix("categorical", metric="ciede2000", cvd=kind) + 1e-12)
+    with pytest.raises(ValueError, match="metric"):
+        delta_e_matrix("categorical", metric="cie94")
+
+
+def test_order_palette():
+    ordered = order_palette("categorical")
+    assert sorted(ordered) == sorted(DUBOIS_CATEGORICAL_CYCLE)
+    d = delta_e_matrix(ordered, cvd="all")
+    # each prefix's weakest pair only gets worse as colors are added
+    mins = [_min_distance(d, range(k)) for k in range(2, len(ordered) + 1)]
+    assert mins == sorted(mins, reverse=True)
+    assert order_palette("categorical", start=3)[0] == DUBOIS_CATEGORICAL_CYCLE[3]
+
+
+@pytest.mark.parametrize("n", [4, 6])
+def test_exact_search_matches_brute_force(n):
+    colors = dubois_candidates(14)
+    d = delta_e_matrix(colors, cvd="all")
+    best = max(_min_distance(d, combo) for combo in itertools.combinations(range(len(d)), n))
+    chosen = categorical_cycle(n, colors, method="exact")
+    assert _min_distance(d, [colors.index(c) for c in chosen]) == pytest.approx(best)
+
+
+def test_categorical_cycle_many_series():
+    colors = categorical_cycle(24)
+    assert len(colors) == len(set(colors)) == 24
+    candidates = dubois_candidates(24)
+    d = delta_e_matrix(candidates, cvd="all")
+    greedy = categorical_cycle(24, method="greedy")
+    index = {c: i for i, c in enumerate(candidates)}
+    assert (_min_distance(d, [index[c] for c in colors])
+            >= _min_distance(d, [index[c] for c in greedy]))
+
+
+def test_categorical_cycle_errors():
+    with pytest.raises(ValueError, match="between 1 and 7"):
+        categorical_cycle(8, "categorical")
+    with pytest.raises(ValueError, match="method"):
+        categorical_cycle(3, method="annealing")
+    with pytest.raises(ValueError):
+        categorical_cycle(0)
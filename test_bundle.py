@@ -0,0 +1,31 @@
+"""Tests for dubois_style.bundle."""
+
+import json
+
+import matplotlib as mpl
+import pytest
+from cycler import cycler
+
+from dubois_style import build_dubois_rc
+from dubois_style.bundle import bundle_key, wasm_bundle, write_wasm_bundle
+
+
+def test_bundle_rc_matches_the_package_style():
+    bundle = json.loads(json.dumps(wasm_bundle()))
+    assert len(bundle["rc"]) == 16
+    rc = dict(bundle["rc"][bundle_key(cycle="dark", show_x_axis=True)])
+    rc["axes.prop_cycle"] = cycler(**rc["axes.prop_cycle"])
+    assert dict(mpl.RcParams(rc)) == dict(mpl.RcParams(build_dubois_rc(cycle="dark", show_x_axis=True)))
+    assert bundle["cycles"]["categorical"][0] == bundle["families"]["Deep Navy"]["light"]
+    with pytest.raises(ValueError):
+        bundle_key(cycle="sepia")
+
+
+def test_write_bundle_only_when_changed(tmp_path):
+    path = tmp_path / "bundle.json"
+    digest = write_wasm_bundle(path)
+    mtime = path.stat().st_mtime_ns
+    assert write_wasm_bundle(path) == digest
+    assert path.stat().st_mtime_ns == mtime
+    assert write_wasm_bundle(path, base_font="serif") != digest
+
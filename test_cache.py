@@ -0,0 +1,114 @@
+"""Tests for dubois_style.cache."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from dubois_style import RenderCache, RenderJob, render_batch
+
+
+def draw_line(fig, values, color=None):
+    ax = fig.subplots()
+    ax.plot(values, color=color)
+
+
+def draw_line_edited(fig, values, color=None):
+    ax = fig.subplots()
+    ax.plot(values, color=color, linewidth=4)
+
+
+def test_key_depends_on_every_input(tmp_path):
+    cache = RenderCache(tmp_path)
+    base = cache.key(draw_line, (np.arange(5),), style={"cycle": "light"})
+    assert base == cache.key(draw_line, (np.arange(5),), style={"cycle": "light"})
+    variants = [
+        cache.key(draw_line, (np.arange(6),), style={"cycle": "light"}),
+        cache.key(draw_line, (np.arange(5.0),), style={"cycle": "light"}),
+        cache.key(draw_line, (np.arange(5),), style={"cycle": "dark"}),
+        cache.key(draw_line, (np.arange(5),), style={"cycle": "light"}, fmt="svg"),
+        cache.key(draw_line, (np.arange(5),), style={"cycle": "light"}, dpi=200),
+        cache.key(draw_line_edited, (np.arange(5),), style={"cycle": "light"}),
+    ]
+    assert len({base, *variants}) == len(variants) + 1
+
+
+def test_object_arrays_are_keyed_by_content(tmp_path):
+    cache = RenderCache(tmp_path)
+    labels = np.array(["north", "south"], dtype=object)
+    key = cache.key(draw_line, (labels,))
+    # equal contents in different objects, as in another process
+    copies = np.array(["".join(["nor", "th"]), "".join(["sou", "th"])], dtype=object)
+    assert key == cache.key(draw_line, (copies,))
+    labels[1] = "west"
+    assert key != cache.key(draw_line, (labels,))
+    assert key != cache.key(draw_line, (labels.reshape(2, 1),))
+
+
+def _line_drawer(values):
+    def draw(fig):
+        draw_line(fig, values)
+
+    return draw
+
+
+def test_key_depends_on_closed_over_values(tmp_path):
+    cache = RenderCache(tmp_path)
+    assert cache.key(_line_drawer([1, 2])) == cache.key(_line_drawer([1, 2]))
+    assert cache.key(_line_drawer([1, 2])) != cache.key(_line_drawer([2, 1]))
+    assert cache.key(_line_drawer(np.arange(3))) != cache.key(_line_drawer(np.arange(4)))
+
+    lock = threading.Lock()
+
+    def draw(fig):
+        with lock:
+            draw_line(fig, [1])
+
+    with pytest.raises(TypeError, match="'lock'"):
+        cache.key(draw)
+
+
+_CALLS = []
+
+
+def draw_counted(fig, values):
+    _CALLS.append(values)
+    draw_line(fig, values)
+
+
+def test_get_or_render_hits_without_drawing(tmp_path):
+    cache = RenderCache(tmp_path)
+    _CALLS.clear()
+    first = cache.get_or_render(draw_counted, [1, 3, 2], dpi=40)
+    second = cache.get_or_render(draw_counted, [1, 3, 2], dpi=40)
+    assert first == second and first.startswith(b"\x89PNG")
+    assert len(_CALLS) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction(tmp_path):
+    cache = RenderCache(tmp_path, max_bytes=1000)
+    for i in range(5):
+        cache.put(f"{i:064x}", bytes(300))
+    assert cache.size_bytes <= 1000
+    assert cache.get(f"{4:064x}") is not None
+    assert cache.get(f"{0:064x}") is None
+
+
+def test_overwriting_an_entry_keeps_the_size(tmp_path):
+    cache = RenderCache(tmp_path)
+    for _ in range(3):
+        cache.put("ab" * 32, bytes(300))
+    assert cache.size_bytes == 300
+    assert RenderCache(tmp_path).size_bytes == 300
+
+
+def test_render_batch_uses_cache(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    jobs = [RenderJob(draw_line, tmp_path / "out" / f"{i}.png", args=([i, 1],))
+            for i in range(3)]
+    first = render_batch(jobs, max_workers=1, dpi=40, cache=cache)
+    assert not any(r.cached for r in first)
+    second = render_batch(jobs, max_workers=1, dpi=40, cache=cache)
+    assert all(r.cached and r.ok for r in second)
+    assert all(r.outputs[0].read_bytes().startswith(b"\x89PNG") for r in second)
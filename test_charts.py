@@ -0,0 +1,196 @@
+"""Tests for dubois_style.downsample and dubois_style.charts."""
+
+import io
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from dubois_style import (
+    dubois_area,
+    dubois_line,
+    dubois_scatter,
+    lttb_downsample,
+    minmax_downsample,
+    pixel_buckets,
+)
+
+
+def _axes(figsize=(4, 2), dpi=50):
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+
+def test_minmax_keeps_every_bucket_extreme():
+    rng = np.random.default_rng(1)
+    x = np.sort(rng.uniform(0, 100, 50_000))
+    y = rng.normal(size=x.size)
+    keep = minmax_downsample(x, y, 100)
+    assert len(keep) <= 400
+    assert keep[0] == 0 and keep[-1] == x.size - 1
+    assert np.all(np.diff(keep) > 0)
+    bucket = np.minimum((x / 100 * 100).astype(int), 99)
+    for b in (0, 37, 99):
+        in_bucket = bucket == b
+        assert y[in_bucket].max() in y[keep] and y[in_bucket].min() in y[keep]
+
+
+def test_lttb_keeps_spike_and_endpoints():
+    y = np.zeros(10_000)
+    y[5_000] = 10.0
+    keep = lttb_downsample(np.arange(y.size), y, 100)
+    assert len(keep) == 100
+    assert 5_000 in keep
+    assert keep[0] == 0 and keep[-1] == y.size - 1
+
+
+def _reference_lttb(x, y, n_out):
+    """Textbook LTTB (Steinarsson 2013), one bucket at a time."""
+    n = len(x)
+    every = (n - 2) / (n_out - 2)
+    keep, a = [0], 0
+    for i in range(n_out - 2):
+        lo, hi = int(i * every) + 1, int((i + 1) * every) + 1
+        next_hi = min(int((i + 2) * every) + 1, n)
+        mx, my = np.mean(x[hi:next_hi]), np.mean(y[hi:next_hi])
+        area = [abs((x[a] - mx) * (y[j] - y[a]) - (x[a] - x[j]) * (my - y[a]))
+                for j in range(lo, hi)]
+        a = lo + int(np.argmax(area))
+        keep.append(a)
+    return [*keep, n - 1]
+
+
+def test_lttb_matches_reference():
+    x = np.arange(20.0)
+    y = np.zeros(20)
+    y[-1] = 1000.0
+    assert lttb_downsample(x, y, 5).tolist() == _reference_lttb(x, y, 5)
+    rng = np.random.default_rng(3)
+    y = rng.normal(size=997).cumsum()
+    x = np.arange(y.size)
+    for n_out in (3, 10, 101):
+        assert lttb_downsample(x, y, n_out).tolist() == _reference_lttb(x, y, n_out)
+
+
+def test_minmax_keeps_first_and_last_per_bucket():
+    x = np.arange(1000)
+    y = np.sin(x / 7.0)
+    keep = minmax_downsample(x, y, 10)
+    assert len(keep) <= 40
+    starts = np.searchsorted(x, np.linspace(0, 999, 11)[:-1])
+    assert set(starts) <= set(keep) and set(np.append(starts[1:] - 1, 999)) <= set(keep)
+
+
+def test_pixel_buckets_uses_dpi():
+    fig, ax = _axes(figsize=(4, 2), dpi=50)
+    assert abs(pixel_buckets(ax, dpi=100) - 2 * pixel_buckets(ax)) <= 1
+
+
+def test_line_and_area_render_identically_to_full_data():
+    rng = np.random.default_rng(0)
+    x = np.arange(200_000)
+    y = rng.normal(size=x.size).cumsum()
+
+    def render(reduce):
+        fig, ax = _axes()
+        if reduce:
+            line = dubois_line(ax, x, y, color="k", antialiased=False)
+        else:
+            (line,) = ax.plot(x, y, color="k", antialiased=False)
+        ax.set_xlim(x[0], x[-1])
+        ax.set_ylim(y.min(), y.max())
+        buf = io.BytesIO()
+        fig.savefig(buf, format="rgba", dpi=50)
+        return line, np.frombuffer(buf.getvalue(), dtype=np.uint8)
+
+    line, reduced = render(True)
+    _, full = render(False)
+    assert len(line.get_xdata()) < 2_000
+    # same pixels up to a handful of rasterization differences at bucket joins
+    assert np.mean(reduced != full) < 0.01
+
+    fig, ax = _axes()
+    area = dubois_area(ax, x, y, baseline=np.zeros(x.size), method="lttb", max_points=500)
+    assert len(area.get_paths()[0].vertices) < 1_100
+
+    with pytest.raises(ValueError, match="method"):
+        dubois_line(ax, x, y, method="every-other")
+
+
+def test_scatter_switches_to_density_above_threshold():
+    from matplotlib.collections import PathCollection
+    from matplotlib.image import AxesImage
+
+    rng = np.random.default_rng(2)
+    x, y = rng.normal(size=(2, 10_000))
+    groups = np.repeat(["Group 1", "Group 2"], 5_000)
+
+    fig, ax = _axes()
+    small = dubois_scatter(ax, x, y, groups, threshold=20_000)
+    assert [a.get_label() for a in small] == ["Group 1", "Group 2"]
+    assert all(isinstance(a, PathCollection) for a in small)
+    assert len(small[0].get_offsets()) == 5_000
+
+    fig, ax = _axes()
+    image, *proxies = dubois_scatter(ax, x, y, groups, threshold=1_000)
+    assert isinstance(image, AxesImage) and image.get_rasterized()
+    assert [p.get_label() for p in proxies] == ["Group 1", "Group 2"]
+    assert all(len(p.get_offsets()) == 0 for p in proxies)
+    rgba = image.get_array()
+    assert rgba.shape[-1] == 4
+    # opaque cells are blends of the two group colors, empty cells transparent
+    assert rgba[..., 3].max() == 1.0 and rgba[..., 3].min() == 0.0
+
+    fig, ax = _axes()
+    (image,) = dubois_scatter(ax, x, y, threshold=1_000)
+    assert image.get_array().sum() == x.size
+    buf = io.BytesIO()
+    fig.savefig(buf, format="svg")
+    assert buf.getvalue().count(b"<image") == 1
+
+
+def test_scatter_kwargs_colormaps_and_missing_data():
+    from matplotlib.colors import ListedColormap
+
+    rng = np.random.default_rng(3)
+    x, y = rng.normal(size=(2, 2_000))
+    groups = np.repeat(["a", "b"], 1_000)
+
+    # scatter and image options go to their own call, in either mode
+    fig, ax = _axes()
+    (points,) = dubois_scatter(ax, x, y, scatter_kwargs={"marker": "x"})
+    fig, ax = _axes()
+    image, *proxies = dubois_scatter(ax, x, y, groups, threshold=100,
+                                     scatter_kwargs={"marker": "x"},
+                                     image_kwargs={"interpolation": "bilinear"})
+    assert image.get_interpolation() == "bilinear"
+    np.testing.assert_array_equal(proxies[0].get_paths()[0].vertices,
+                                  points.get_paths()[0].vertices)
+
+    cmap = ListedColormap(["#000000", "#ffffff"])
+    fig, ax = _axes()
+    (image,) = dubois_scatter(ax, x, y, threshold=100, cmap=cmap)
+    assert image.get_cmap() is cmap
+    fig, ax = _axes()
+    (image,) = dubois_scatter(ax, x, y, threshold=100, cmap="viridis")
+    assert image.get_cmap().name == "viridis"
+
+    # scatter_kwargs override the explicit defaults instead of clashing
+    fig, ax = _axes()
+    (points,) = dubois_scatter(ax, [1, 2], [1, 2], scatter_kwargs={"s": 5, "alpha": 1})
+    assert points.get_sizes().tolist() == [5] and points.get_alpha() == 1
+    fig, ax = _axes()
+    a, b = dubois_scatter(ax, [1, 2], [1, 2], ["a", "b"],
+                          scatter_kwargs={"s": 5, "color": "k", "label": "ignored"})
+    assert [a.get_label(), b.get_label()] == ["a", "b"]
+    assert a.get_sizes().tolist() == [5] and a.get_facecolor()[0, :3].tolist() == [0, 0, 0]
+
+    # no finite points, or a single repeated point, above the threshold
+    fig, ax = _axes()
+    (empty,) = dubois_scatter(ax, np.full(500, np.nan), np.full(500, np.nan), threshold=100)
+    assert len(empty.get_offsets()) == 500
+    fig, ax = _axes()
+    (image,) = dubois_scatter(ax, np.ones(500), np.ones(500), threshold=100)
+    assert image.get_array().sum() == 500
@@ -0,0 +1,38 @@
+"""Tests for dubois_style.colormaps."""
+
+import matplotlib
+import numpy as np
+import pytest
+
+from dubois_style import (
+    DUBOIS_CMAP_NAMES,
+    apply_dubois_style,
+    get_dubois_cmap,
+    palette_rgba,
+)
+
+
+def test_cmaps_are_cached_with_lut_built():
+    cmap = get_dubois_cmap("dubois_dark", lut=512)
+    assert cmap is get_dubois_cmap("dubois_dark", lut=512)
+    assert cmap.N == 512
+    assert cmap._isinit
+
+
+def test_endpoints_and_reversed():
+    dark = palette_rgba("dark")
+    np.testing.assert_allclose(get_dubois_cmap("dubois_dark")(0.0), dark[0])
+    np.testing.assert_allclose(get_dubois_cmap("dubois_dark_r")(0.0), dark[-1])
+    listed = get_dubois_cmap("dubois_categorical")
+    assert listed.N == len(palette_rgba("categorical"))
+
+
+def test_registered_by_name_after_apply():
+    apply_dubois_style()
+    for name in DUBOIS_CMAP_NAMES:
+        assert name in matplotlib.colormaps
+
+
+def test_unknown_cmap():
+    with pytest.raises(ValueError, match="unknown colormap"):
+        get_dubois_cmap("dubois_sepia")
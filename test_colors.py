@@ -0,0 +1,46 @@
+"""Tests for dubois_style.colors."""
+
+import numpy as np
+import pytest
+from matplotlib.colors import to_rgba
+
+from dubois_style import DUBOIS_LIGHT_CYCLE, map_values, palette_rgba, palette_rgba8
+
+
+def test_palette_tables_match_matplotlib():
+    table = palette_rgba("light")
+    assert table.shape == (len(DUBOIS_LIGHT_CYCLE), 4)
+    np.testing.assert_allclose(table, [to_rgba(c) for c in DUBOIS_LIGHT_CYCLE])
+    assert palette_rgba8("light").dtype == np.uint8
+    assert not table.flags.writeable
+
+
+def test_map_values_matches_scalar_loop():
+    values = np.random.default_rng(0).uniform(30, 100, size=500)
+    lo, hi = values.min(), values.max()
+    expected = [
+        to_rgba(DUBOIS_LIGHT_CYCLE[int((v - lo) / (hi - lo) * (len(DUBOIS_LIGHT_CYCLE) - 1))])
+        for v in values
+    ]
+    np.testing.assert_allclose(map_values(values), expected)
+
+
+def test_map_values_bins_nan_and_uint8():
+    out = map_values([np.nan, 0, 5, 50], palette="dark", bins=[0, 1, 10, 100], dtype=np.uint8)
+    assert out.dtype == np.uint8
+    assert out.shape == (4, 4)
+    assert tuple(out[0]) == (0, 0, 0, 0)
+    np.testing.assert_array_equal(out[1:], palette_rgba8("dark")[[0, 1, 2]])
+
+
+def test_map_values_infinite_values_get_end_colors():
+    table = palette_rgba("light")
+    out = map_values([1.0, 2.0, np.inf, -np.inf, np.nan])
+    np.testing.assert_array_equal(out[:4], table[[0, -1, -1, 0]])
+    assert tuple(out[4]) == (0, 0, 0, 0)
+    np.testing.assert_array_equal(map_values([np.inf, -np.inf]), table[[0, 0]])
+
+
+def test_unknown_palette():
+    with pytest.raises(ValueError, match="unknown palette"):
+        palette_rgba("sepia")
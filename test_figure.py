@@ -0,0 +1,105 @@
+"""Tests for dubois_style.figure."""
+
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib as mpl
+import numpy as np
+import pytest
+
+from dubois_style import DuboisFigure, apply_dubois_style, dubois_style_context
+
+STYLES = [
+    {"cycle": "light"},
+    {"cycle": "dark", "use_contrast_colors": True},
+    {"cycle": "light", "show_x_axis": True, "show_y_axis": True},
+    {"cycle": "dark", "rc": {"lines.linewidth": 4, "axes.facecolor": "#202020"}},
+]
+
+
+def _render(style, seed) -> bytes:
+    rng = np.random.default_rng(seed)
+    fig = DuboisFigure(figsize=(3, 2), dpi=50, **style)
+    with fig:
+        ax = fig.subplots()
+        for _ in range(3):
+            ax.plot(rng.random(20).cumsum())
+        ax.bar(range(5), rng.random(5))
+        ax.set_title("title")
+        ax.legend(["a", "b", "c"])
+        with mpl.rc_context({"lines.linewidth": 0.5}):
+            ax.axhline(1.0)
+    fig.suptitle("plate")
+    buf = io.BytesIO()
+    fig.savefig(buf, format="rgba")
+    return buf.getvalue()
+
+
+def _global_rc() -> dict:
+    # rc_context never restores the backend, which may resolve meanwhile
+    return {k: repr(v) for k, v in dict.items(mpl.rcParams) if k != "backend"}
+
+
+def test_figure_rc_is_scoped_to_the_figure():
+    before = _global_rc()
+    fig = DuboisFigure(cycle="dark", rc={"lines.linewidth": 5})
+    assert fig.canvas.figure is fig
+    assert type(mpl.rcParams) is mpl.RcParams
+    with fig:
+        assert mpl.rcParams["lines.linewidth"] == 5
+        assert mpl.rcParams["axes.prop_cycle"] == fig.rc["axes.prop_cycle"]
+        mpl.rcParams["lines.markersize"] = 11
+        with mpl.rc_context({"lines.linewidth": 1}):
+            assert mpl.rcParams["lines.linewidth"] == 1
+        assert mpl.rcParams["lines.linewidth"] == 5
+        line, = fig.subplots().plot([1, 2])
+    assert line.get_linewidth() == 5 and line.get_markersize() == 11
+    assert _global_rc() == before
+    fig.savefig(io.BytesIO(), format="svg")
+    assert _global_rc() == before
+
+
+def test_concurrent_rendering_matches_serial():
+    jobs = [(STYLES[i % len(STYLES)], i) for i in range(32)]
+    expected = [_render(style, seed) for style, seed in jobs]
+    before = _global_rc()
+
+    barrier = threading.Barrier(8)
+
+    def job(args):
+        if args[1] < 8:
+            barrier.wait()  # start the first wave together
+        return _render(*args)
+
+    with ThreadPoolExecutor(8) as workers:
+        results = list(workers.map(job, jobs))
+
+    assert results == expected
+    assert _global_rc() == before
+    # styles really differ, so a mix-up between threads would have shown
+    assert len(set(expected[: len(STYLES)])) == len(STYLES)
+
+
+def test_outside_a_figure_rcparams_behave_as_usual():
+    DuboisFigure()
+    old = mpl.rcParams["lines.linewidth"]
+    with mpl.rc_context({"lines.linewidth": 9}):
+        assert mpl.rcParams["lines.linewidth"] == 9
+    assert mpl.rcParams["lines.linewidth"] == old
+    assert isinstance(mpl.rcParams.copy(), mpl.RcParams)
+    with pytest.raises(ValueError):
+        DuboisFigure(rc={"lines.linewidth": "wide"})
+
+
+def test_style_functions_inside_a_figure_last_until_it_exits():
+    before = _global_rc()
+    fig = DuboisFigure(cycle="light")
+    light = fig.rc["axes.prop_cycle"]
+    with fig:
+        apply_dubois_style(cycle="dark")
+        assert mpl.rcParams["axes.prop_cycle"] != light
+        with dubois_style_context(cycle="light", show_x_axis=True):
+            assert mpl.rcParams["axes.spines.bottom"]
+    assert fig.rc["axes.prop_cycle"] == light
+    assert _global_rc() == before
@@ -0,0 +1,147 @@
+"""Tests for dubois_style.fonts."""
+
+import dataclasses
+import os
+import shutil
+from pathlib import Path
+
+import matplotlib
+import pytest
+from matplotlib import font_manager
+
+from dubois_style import FontRegistry
+from dubois_style import fonts
+
+FONT_DIR = Path(matplotlib.get_data_path()) / "fonts" / "ttf"
+
+
+def _forget(directory):
+    """Unregister every font under ``directory``, as in a fresh process."""
+    for path in [p for p in fonts._manager_registry() if p.startswith(str(directory))]:
+        fonts._unregister(path)
+    font_manager.fontManager._findfont_cached.cache_clear()
+
+
+@pytest.fixture
+def font_dir(tmp_path):
+    for name in ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf", "DejaVuSerif.ttf"):
+        shutil.copy(FONT_DIR / name, tmp_path / name)
+    yield tmp_path
+    # keep entries for deleted temp files out of the global font manager
+    _forget(tmp_path)
+
+
+def _entries_for(path):
+    return [e for e in font_manager.fontManager.ttflist if e.fname == str(path)]
+
+
+def test_register_is_idempotent(font_dir):
+    registry = FontRegistry()
+    path = font_dir / "DejaVuSans.ttf"
+    assert registry.register([path]) == [str(path)]
+    count = len(_entries_for(path))
+    assert count >= 1
+    assert registry.register([path]) == []
+    assert len(_entries_for(path)) == count
+
+
+def test_changed_file_replaces_entries(font_dir):
+    registry = FontRegistry()
+    path = font_dir / "DejaVuSans.ttf"
+    registry.register([path])
+    count = len(_entries_for(path))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert registry.register([path]) == [str(path)]
+    assert len(_entries_for(path)) == count
+
+
+def test_directory_and_disk_cache(font_dir, tmp_path, monkeypatch):
+    cache_file = tmp_path / "cache" / "fonts.json"
+    registered = FontRegistry(cache_file=cache_file).register_directory(
+        font_dir, max_workers=2
+    )
+    assert len(registered) == 3
+    assert cache_file.exists()
+    _forget(font_dir)
+
+    # a fresh registry must not parse anything that is in the cache
+    def fail(path):
+        raise AssertionError(f"re-parsed {path}")
+
+    monkeypatch.setattr("dubois_style.fonts._parse_font", fail)
+    assert len(FontRegistry(cache_file=cache_file).register_directory(font_dir)) == 3
+
+
+def test_registrations_are_shared_between_registries(font_dir):
+    path = font_dir / "DejaVuSans.ttf"
+    first, second = FontRegistry(), FontRegistry()
+    assert first.register([path]) == [str(path)]
+    count = len(_entries_for(path))
+    assert second.register([path]) == []
+    assert fonts.register_fonts([path]) == []
+    assert len(_entries_for(path)) == count
+    assert second.registered == first.registered == [str(path)]
+
+
+def test_parsed_entries_match_matplotlib(font_dir):
+    ttf, afm = fonts._parse_font(str(font_dir / "DejaVuSans-Bold.ttf"))
+    # matplotlib's own entry for the bundled copy of the same file
+    bundled = _entries_for(FONT_DIR / "DejaVuSans-Bold.ttf")[0]
+    assert afm == [] and len(ttf) == 1
+    assert dataclasses.replace(ttf[0], fname=bundled.fname) == bundled
+
+
+def test_cache_file_can_be_set_later(font_dir, tmp_path):
+    registry = FontRegistry()
+    registry.cache_file = tmp_path / "fonts.json"
+    assert registry.cache_file == tmp_path / "fonts.json"
+    registry.register([font_dir / "DejaVuSerif.ttf"])
+    assert str(font_dir / "DejaVuSerif.ttf") in (tmp_path / "fonts.json").read_text()
+
+
+def test_registration_goes_through_addfont(font_dir, monkeypatch):
+    calls = []
+    addfont = font_manager.FontManager.addfont
+
+    def counting_addfont(self, path):
+        calls.append(path)
+        return addfont(self, path)
+
+    monkeypatch.setattr(font_manager.FontManager, "addfont", counting_addfont)
+    path = font_dir / "DejaVuSerif.ttf"
+    assert FontRegistry().register([path]) == [str(path)]
+    assert calls == [str(path)]
+    assert fonts._manager_registry()[str(path)][1] == _entries_for(path)
+
+    # without a lookup cache to invalidate, cached entries aren't installed directly
+    _forget(font_dir)
+    monkeypatch.setattr(fonts, "_lookup_cache", lambda manager: None)
+    assert FontRegistry().register_directory(font_dir, max_workers=2) != []
+    assert len(calls) == 4
+
+
+def test_parsing_does_not_hold_the_lock(font_dir, monkeypatch):
+    parse = fonts._parse_font
+
+    def checked_parse(path):
+        assert not fonts._lock.locked()
+        return parse(path)
+
+    monkeypatch.setattr(fonts, "ProcessPoolExecutor", _InlineExecutor)
+    monkeypatch.setattr(fonts, "_parse_font", checked_parse)
+    assert len(FontRegistry().register_directory(font_dir, max_workers=2)) == 3
+
+
+class _InlineExecutor:
+    def __init__(self, max_workers=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def map(self, func, items):
+        return map(func, items)
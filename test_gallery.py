@@ -0,0 +1,57 @@
+"""Tests for the gallery build in notebooks/build.py."""
+
+import dataclasses
+import json
+
+from notebooks.build import build, chart_inputs
+from notebooks.gallery_charts import GALLERY
+
+SMALL = {"thumb": 8, "1x": 16}
+
+
+def test_chart_inputs_follow_helpers_and_data():
+    bar = chart_inputs(GALLERY["bar"])
+    assert "function:notebooks.gallery_charts._cycle_colors" in bar
+    line = chart_inputs(GALLERY["line"])
+    assert "function:dubois_style.style.dubois_legend" in line
+    palette = chart_inputs(GALLERY["palette"])
+    assert "data:notebooks.gallery_charts.DUBOIS_FAMILIES" in palette
+    # attribute names like ``ax.bar`` are not module data
+    assert not any(key.endswith(".bar") for key in bar)
+
+
+def test_build_is_incremental(tmp_path):
+    charts = {"bar": GALLERY["bar"], "dark": GALLERY["style_dark_sequential"]}
+    first = build(tmp_path, resolutions=SMALL, charts=charts)
+    assert first["rendered"] == {"bar": ["*"], "dark": ["*"]}
+
+    manifest = json.loads((tmp_path / "gallery" / "manifest.json").read_text())
+    assert manifest == first["manifest"]
+    images = manifest["charts"]["bar"]["images"]
+    assert {(i["format"], i["resolution"]) for i in images} == {
+        (fmt, res) for fmt in ("webp", "png") for res in SMALL
+    }
+    assert all((tmp_path / i["path"]).stat().st_size == i["bytes"] for i in images)
+    assert {i["width"] for i in images} == {8 * 8, 8 * 16}
+    assert (tmp_path / "dubois_bundle.json").exists()
+
+    again = build(tmp_path, resolutions=SMALL, charts=charts)
+    assert again["rendered"] == {} and sorted(again["up_to_date"]) == ["bar", "dark"]
+    assert again["manifest"] == manifest
+
+    # only the chart whose inputs changed is rendered; its old images go
+    charts["dark"] = dataclasses.replace(charts["dark"], style={"cycle": "light"})
+    third = build(tmp_path, resolutions=SMALL, charts=charts)
+    assert third["rendered"] == {"dark": ["style"]} and third["up_to_date"] == ["bar"]
+    on_disk = {p.name for p in (tmp_path / "gallery").iterdir()} - {"manifest.json"}
+    assert on_disk == {
+        i["path"].split("/")[1] for entry in third["manifest"]["charts"].values()
+        for i in entry["images"]
+    }
+
+    # missing files and --force re-render
+    (tmp_path / images[0]["path"]).unlink()
+    assert list(build(tmp_path, resolutions=SMALL, charts=charts)["rendered"]) == ["bar"]
+    forced = build(tmp_path, resolutions=SMALL, formats=("png",), charts=charts, force=True)
+    assert forced["rendered"] == {"bar": ["*"], "dark": ["*"]}
+    assert not list((tmp_path / "gallery").glob("*.webp"))
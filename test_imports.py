@@ -0,0 +1,69 @@
+"""Import-time regression tests for dubois-style.
+
+Each check runs in a fresh interpreter so modules imported by other tests
+(or by pytest plugins) cannot mask a regression.
+"""
+
+import subprocess
+import sys
+import textwrap
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_palettes_do_not_import_matplotlib():
+    out = _run(
+        """
+        import sys
+        from dubois_style import DUBOIS_CATEGORICAL_CYCLE, DUBOIS_FAMILIES
+        assert DUBOIS_CATEGORICAL_CYCLE and DUBOIS_FAMILIES
+        print("matplotlib.pyplot" in sys.modules, "matplotlib" in sys.modules)
+        """
+    )
+    assert out == "False False"
+
+
+def test_style_module_import_is_lazy():
+    out = _run(
+        """
+        import sys
+        import dubois_style
+        apply = dubois_style.apply_dubois_style
+        print("matplotlib.pyplot" in sys.modules, "matplotlib.font_manager" in sys.modules)
+        """
+    )
+    assert out == "False False"
+
+
+def test_apply_dubois_style_loads_matplotlib_on_first_call():
+    out = _run(
+        """
+        import sys
+        from dubois_style import apply_dubois_style
+        apply_dubois_style(cycle="dark")
+        import matplotlib
+        print("matplotlib" in sys.modules, matplotlib.rcParams["figure.facecolor"])
+        """
+    )
+    assert out == "True none"
+
+
+def test_unknown_attribute_raises():
+    out = _run(
+        """
+        import dubois_style
+        try:
+            dubois_style.not_a_thing
+        except AttributeError as exc:
+            print(type(exc).__name__)
+        """
+    )
+    assert out == "AttributeError"
@@ -0,0 +1,84 @@
+"""Tests for dubois_style.live."""
+
+import io
+
+import numpy as np
+import pytest
+
+from dubois_style import DuboisLiveChart, RingBuffer
+
+
+def test_ring_buffer_keeps_latest_contiguously():
+    buffer = RingBuffer(5)
+    buffer.extend([0, 1, 2], [10, 11, 12])
+    buffer.extend(np.arange(3, 9), np.arange(13, 19))
+    x, y = buffer.view()
+    np.testing.assert_array_equal(x, [4, 5, 6, 7, 8])
+    np.testing.assert_array_equal(y, [14, 15, 16, 17, 18])
+    assert x.base is not None and not x.flags.writeable
+    buffer.extend(9, 19)
+    np.testing.assert_array_equal(buffer.view()[0], [5, 6, 7, 8, 9])
+    with pytest.raises(ValueError):
+        RingBuffer(0)
+
+
+def test_live_chart_blits_until_data_leaves_view():
+    chart = DuboisLiveChart(capacity=50, window=100, ylim=(-2, 2),
+                            style={"use_contrast_colors": True})
+    chart.add_line("sine")
+    chart.add_area("cosine", baseline=-2)
+
+    for t in range(60):
+        chart.push("sine", t, np.sin(t / 5))
+        chart.push("cosine", t, np.cos(t / 5))
+        chart.update()
+
+    # first frame draws fully; the window never scrolls in 60 samples
+    assert chart.full_redraws == 1
+    assert chart.blits == 59
+    x, _ = chart.data("sine")
+    assert len(x) == 50 and x[-1] == 59
+    np.testing.assert_array_equal(chart._series["sine"][1].get_xdata(), x)
+    assert chart._legend is not None
+
+    for t in range(60, 126):
+        chart.push("sine", t, 0.0)
+        chart.update()
+    assert chart.full_redraws == 2
+    assert chart.ax.get_xlim()[1] > 125
+
+
+@pytest.mark.parametrize("fmt", ["svg", "pdf", "png"])
+def test_live_chart_saves_in_any_format(fmt):
+    chart = DuboisLiveChart(window=10)
+    chart.add_line("sine", gid="sine-series")
+    for t in range(5):
+        chart.push("sine", t, np.sin(t))
+        chart.update()
+    buf = io.BytesIO()
+    chart.fig.savefig(buf, format=fmt, dpi=30)
+    if fmt == "svg":
+        assert b'id="sine-series"' in buf.getvalue()
+    # saving neither breaks nor replaces the on-screen background
+    background, blits = chart._background, chart.blits
+    chart.push("sine", 5, 0.0)
+    chart.update()
+    assert chart._background is background and chart.blits == blits + 1
+
+
+def test_legend_follows_added_series_and_fits():
+    chart = DuboisLiveChart(figsize=(6.4, 4.8))
+    chart.add_line("a")
+    chart.push("a", [0, 1], [0, 1])
+    chart.update()
+    chart.add_area("b", baseline=-1)
+    chart.add_area("c")
+    chart.push("b", [0, 1], [1, 0])
+    chart.update()
+    legend = chart.ax.get_legend()
+    assert [t.get_text() for t in legend.get_texts()] == ["a", "b", "c"]
+    renderer = chart.fig.canvas.get_renderer()
+    assert legend.get_window_extent(renderer).x1 <= chart.fig.bbox.x1
+    b, c = chart._series["b"][1], chart._series["c"][1]
+    assert b.get_facecolor()[:3] != c.get_facecolor()[:3]
+    assert chart.data("b")[1].tolist() == [1, 0] and b.get_xy()[0, 1] == -1
@@ -0,0 +1,94 @@
+"""Tests for dubois_style.maps."""
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from dubois_style import dubois_map, map_values, polygon_centroids
+
+
+def _square(x, y, size=1.0):
+    return np.array([[x, y], [x + size, y], [x + size, y + size], [x, y + size]])
+
+
+def test_polygon_centroids():
+    triangle = np.array([[0, 0], [3, 0], [0, 3]], dtype=float)
+    centroids, areas = polygon_centroids([_square(2, 2, 2), triangle, np.zeros((3, 2))])
+    np.testing.assert_allclose(centroids, [[3, 3], [1, 1], [0, 0]])
+    np.testing.assert_allclose(areas, [4, 4.5, 0])
+
+
+def test_dubois_map_single_collection_with_labels():
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    squares = [_square(i, j) for i in range(30) for j in range(30)]
+    values = np.arange(len(squares), dtype=float)
+
+    collection = dubois_map(ax, squares, values, labels=True, palette="dark")
+
+    assert list(ax.collections) == [collection]
+    np.testing.assert_allclose(collection.get_facecolors(), map_values(values, palette="dark"))
+    assert len(ax.texts) == len(squares)
+    assert ax.texts[0].get_text() == "0" and ax.texts[0].get_position() == (0.5, 0.5)
+    assert ax.texts[-1].get_color() == "white"
+    fig.canvas.draw()
+
+
+def test_multipart_regions_share_color_and_label_once():
+    fig = Figure()
+    ax = fig.subplots()
+    regions = [[_square(0, 0, 2), _square(5, 5)], _square(3, 0)]
+
+    class Multi:
+        def __init__(self, parts):
+            self.geoms = [type("P", (), {"exterior": type("R", (), {"coords": p})})
+                          for p in parts]
+
+    dubois_map(ax, [Multi(regions[0]), regions[1]], [1, 2], labels=["A", "B"])
+    assert [t.get_text() for t in ax.texts] == ["A", "B"]
+    assert ax.texts[0].get_position() == (1.0, 1.0)
+
+
+def test_length_mismatch():
+    with pytest.raises(ValueError, match="geometries"):
+        dubois_map(Figure().subplots(), [_square(0, 0)], [1, 2])
+
+
+def test_fit_labels_drops_labels_that_do_not_fit():
+    fig = Figure(figsize=(4, 4))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    squares = [_square(0, 0, 10), _square(10, 0, 0.1)]
+    dubois_map(ax, squares, [1, 2], labels=["Big region", "Tiny region"], fit_labels=True)
+    assert [t.get_text() for t in ax.texts] == ["Big region"]
+
+
+def test_holes_are_left_unfilled():
+    fig = Figure(figsize=(2, 2), dpi=50)
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    outer = _square(0, 0, 4)
+    hole = np.array([[2.5, 1], [3.5, 1], [3.5, 3], [2.5, 3]])  # same winding as outer
+
+    class Holed:
+        __geo_interface__ = {"type": "Polygon",
+                             "coordinates": [outer.tolist(), hole.tolist()]}
+
+    dubois_map(ax, [Holed()], [1], labels=["Ring"], linewidth=0, palette=["#ff0000"])
+    ax.set_facecolor("#0000ff")
+    ax.set_xlim(0, 4)
+    ax.set_ylim(0, 4)
+    fig.canvas.draw()
+    image = np.asarray(fig.canvas.buffer_rgba())
+
+    def pixel(x, y):
+        px, py = ax.transData.transform((x, y))
+        return image[image.shape[0] - int(py), int(px), :3].tolist()
+
+    assert pixel(1, 1) == [255, 0, 0]
+    assert pixel(3, 2) == [0, 0, 255]
+    # the label sits on the centroid of the ring, net of the hole
+    x, y = ax.texts[0].get_position()
+    assert x == pytest.approx((16 * 2 - 2 * 3) / 14) and y == pytest.approx(2)
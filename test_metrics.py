@@ -0,0 +1,44 @@
+"""Tests for dubois_style.metrics."""
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from dubois_style import TextMetricsCache, text_extent, text_extents
+
+
+def test_extent_matches_drawn_text():
+    fig = Figure(dpi=72)
+    FigureCanvasAgg(fig)
+    text = fig.text(0.5, 0.5, "Deep Navy 1900", fontsize=14, family="DejaVu Sans")
+    drawn = text.get_window_extent(fig.canvas.get_renderer())
+    width, height, _ = text_extent("Deep Navy 1900", family="DejaVu Sans", size=14)
+    assert abs(width - drawn.width) < 1.0
+    assert abs(height - drawn.height) < 3.0
+
+
+def test_cache_counts_and_bounds():
+    cache = TextMetricsCache(max_entries=2)
+    family = ("DejaVu Sans",)
+    cache.get("a", family, 10.0)
+    cache.get("a", family, 10.0)
+    cache.get("b", family, 10.0)
+    cache.get("c", family, 10.0)
+    assert len(cache) == 2
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 3
+    cache.get("a", family, 10.0)
+    assert cache.misses == 4
+
+
+def test_text_extents_batch():
+    out = text_extents(["12", "12", "345"], size=10)
+    assert out.shape == (3, 3)
+    assert out[0, 0] == out[1, 0] < out[2, 0]
+
+
+def test_cache_is_keyed_on_the_resolved_font_file():
+    cache = TextMetricsCache()
+    cache.get("a", ("DejaVu Sans",), 10.0)
+    cache.get("a", ("DejaVu Sans", "Liberation Sans"), 10.0)
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.get("a", ("DejaVu Sans",), 10.0, weight="bold")
+    assert cache.misses == 2
@@ -0,0 +1,85 @@
+"""Tests for dubois_style.plates and dubois_style.geometry."""
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.path import Path
+
+from dubois_style import dubois_fan, dubois_spiral, dubois_stacked_bars
+from dubois_style.geometry import arc_bands, rectangles, spiral_path
+from dubois_style.maps import polygon_centroids
+
+
+def _axes():
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+
+def test_rectangles_and_arc_bands():
+    boxes = rectangles([0, 1], 0, [1, 2], 3)
+    _, areas = polygon_centroids(list(boxes))
+    np.testing.assert_allclose(areas, [3, 6])
+
+    # a full ring of width 1 around radius 1..2
+    ring = arc_bands(0, 2 * np.pi, 1.0, 2.0, resolution=2000)
+    assert ring.shape == (1, 4000, 2)
+    _, (area,) = polygon_centroids(list(ring))
+    assert area == pytest.approx(3 * np.pi, rel=1e-4)
+
+    # one turn with pitch 0.5 ends half a unit further in
+    (arm,) = arc_bands(0, 2 * np.pi, 1.5, 2.0, pitch=0.5, resolution=50)
+    assert np.hypot(*arm[49]) == pytest.approx(1.5)
+
+
+def test_spiral_path_matches_arc_bands_and_scales_with_length():
+    sweeps = np.array([-2 * np.pi, -np.pi / 2, 0.0])
+    path = spiral_path(np.pi / 2, sweeps, [1.5, 1.4, 1.3], [2.0, 1.9, 1.8],
+                       pitch=0.5, points_per_turn=32)
+    starts = np.flatnonzero(path.codes == Path.MOVETO)
+    np.testing.assert_array_equal(np.diff(np.append(starts, len(path.codes))),
+                                  [2 * 33 + 1, 2 * 9 + 1, 2 * 2 + 1])
+    assert (path.codes == Path.CLOSEPOLY).sum() == 3
+
+    (band,) = arc_bands(np.pi / 2, np.pi / 2 + sweeps[0], 1.5, 2.0, pitch=0.5, resolution=33)
+    np.testing.assert_allclose(path.vertices[:66], band, atol=1e-12)
+
+
+def test_plates_draw_one_collection_each():
+    fig, ax = _axes()
+    fan = dubois_fan(ax, [3, 1], labels=["A", "B"], fmt="{:.0%}")
+    assert ax.collections[:] == [fan] and len(fan.get_paths()) == 2
+    assert [t.get_text() for t in ax.texts] == ["75%", "25%"]
+    handles, labels = ax.get_legend_handles_labels()
+    assert labels == ["A", "B"]
+    # the upper half disc, read left to right
+    start = fan.get_paths()[0].vertices[0]
+    np.testing.assert_allclose(start, [-1, 0], atol=1e-12)
+
+    fig, ax = _axes()
+    bars = dubois_stacked_bars(ax, [[1, 3], [0, 0], [2, 2]], labels=["x", "y"],
+                               bar_labels=["a", "b", "c"])
+    assert len(bars.get_paths()) == 6
+    assert [t.get_text() for t in ax.get_yticklabels()] == ["a", "b", "c"]
+    np.testing.assert_allclose(bars.get_paths()[1].vertices[:4, 0], [0.25, 1, 1, 0.25])
+    with pytest.raises(ValueError, match="orientation"):
+        dubois_stacked_bars(ax, [[1]], orientation="diagonal")
+
+    fig, ax = _axes()
+    spiral = dubois_spiral(ax, [4, 2, 1], labels=["p", "q", "r"], max_turns=1.5)
+    assert ax.collections[:] == [spiral] and len(spiral.get_paths()) == 3
+    assert len(ax.texts) == 3
+    # no arm crosses the center hole
+    radii = np.hypot(*np.concatenate([p.vertices for p in spiral.get_paths()]).T)
+    assert radii.min() > 0.15
+    with pytest.raises(ValueError, match="non-negative"):
+        dubois_spiral(ax, [-1])
+
+    # per-bar paths are views into one generated compound path
+    fig, ax = _axes()
+    spiral = dubois_spiral(ax, np.arange(1, 1001), colors=["k", "w"])
+    paths = spiral.get_paths()
+    assert len(paths) == 1000
+    assert paths[0].vertices.base is paths[-1].vertices.base
+    assert all(p.codes[0] == Path.MOVETO and p.codes[-1] == Path.CLOSEPOLY for p in paths)
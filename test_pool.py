@@ -0,0 +1,101 @@
+"""Tests for dubois_style.pool."""
+
+import io
+import warnings
+
+import numpy as np
+import pytest
+
+from dubois_style import FigurePool
+
+
+def _chart(fig, ax):
+    ax.plot([1, 2, 3], label="a")
+    ax.bar([1, 2], [3, 4])
+    ax.set_title("title")
+    ax.set_xlabel("x")
+    ax.set_yscale("log")
+    ax.set_xticks([1, 2, 3])
+    ax.invert_xaxis()
+    ax.legend()
+    ax.spines["top"].set_visible(True)
+    fig.colorbar(ax.scatter([1], [1], c=[1]), ax=ax)
+    fig.suptitle("suptitle")
+    fig.set_size_inches(10, 10)
+    fig.savefig(io.BytesIO(), format="png", dpi=20)
+
+
+@pytest.mark.parametrize("reset", ["artists", "full"])
+def test_released_figures_come_back_clean(reset):
+    pool = FigurePool(reset=reset)
+    with pool.figure(figsize=(4, 3), style={"cycle": "dark"}) as (fig, ax):
+        first_color = ax._get_lines.get_next_color()
+        _chart(fig, ax)
+    assert (pool.hits, pool.misses, len(pool)) == (0, 1, 1)
+
+    with pool.figure(figsize=(4, 3), style={"cycle": "dark"}) as (again, ax):
+        assert again is fig
+        assert fig.axes == [ax] and not fig.texts and not fig.legends
+        assert not ax.lines and not ax.patches and not ax.collections
+        assert ax.legend_ is None and ax.get_title() == "" and ax.get_xlabel() == ""
+        assert ax.get_yscale() == "linear" and ax.get_xlim() == (0, 1)
+        assert not ax.spines["top"].get_visible()
+        assert tuple(fig.get_size_inches()) == (4, 3)
+        assert ax._get_lines.get_next_color() == first_color
+        ax.plot([5, 6], [7, 8])
+        ax.autoscale_view()
+        assert ax.get_xlim()[0] < 5 < ax.get_xlim()[1]
+        fig.suptitle("new")
+        assert fig._suptitle.get_text() == "new"
+    assert pool.hits == 1
+
+    # different style, different figure
+    with pool.figure(figsize=(4, 3), style={"cycle": "light"}) as (other, _):
+        assert other is not fig
+
+
+def test_memory_cap_and_release_errors():
+    one = FigurePool(max_bytes=10**9)
+    fig, ax = one.acquire(figsize=(2, 2), dpi=100)
+    fig.savefig(io.BytesIO(), format="png")
+    one.release(fig)
+    per_figure = one.size_bytes
+    assert per_figure > 4 * 200 * 200
+
+    pool = FigurePool(max_bytes=int(2.5 * per_figure))
+    figs = [pool.acquire(figsize=(2, 2), dpi=100)[0] for _ in range(4)]
+    for fig in figs:
+        fig.savefig(io.BytesIO(), format="png")
+        pool.release(fig)
+    assert len(pool) == 2 and pool.evictions == 2
+    assert pool.size_bytes <= pool.max_bytes
+    # least recently released went first
+    assert pool.acquire(figsize=(2, 2), dpi=100)[0] is figs[-1]
+
+    with pytest.raises(ValueError, match="not checked out"):
+        pool.release(figs[0])
+    with pytest.raises(ValueError, match="reset"):
+        FigurePool(reset="some")
+
+    pool.clear()
+    assert len(pool) == 0 and pool.stats()["hits"] == 0
+
+
+def test_grid_layout_round_trip():
+    pool = FigurePool()
+    fig, axes = pool.acquire(nrows=2, ncols=2, sharex=True)
+    assert np.shape(axes) == (2, 2)
+    pool.release(fig)
+    again, axes = pool.acquire(nrows=2, ncols=2, sharex=True)
+    assert again is fig and len(fig.axes) == 4
+
+
+@pytest.mark.parametrize("reset", ["artists", "full"])
+def test_constrained_layout_release_is_quiet(reset):
+    pool = FigurePool(reset=reset)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for _ in range(2):
+            with pool.figure(layout="constrained") as (fig, ax):
+                _chart(fig, ax)
+    assert pool.hits == 1 and fig.get_layout_engine().adjust_compatible is False
@@ -0,0 +1,135 @@
+"""Tests for dubois_style.profiling."""
+
+import io
+import json
+import re
+import threading
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg, RendererAgg
+from matplotlib.figure import Figure
+
+import dubois_style
+from dubois_style import DuboisFigure, build_dubois_rc, dubois_legend, profile, text_extents
+from dubois_style.profiling import PHASES, _root_figure
+
+
+def _chart(label=""):
+    fig = DuboisFigure(figsize=(3, 2), dpi=50, use_contrast_colors=True)
+    fig.set_label(label)
+    with fig:
+        ax = fig.subplots()
+        for k in range(3):
+            ax.plot(np.arange(10) * k, label=f"series {k}")
+        ax.set_title("title")
+        dubois_legend(ax)
+    fig.savefig(io.BytesIO(), format="png")
+    return fig
+
+
+def test_phases_and_charts():
+    with profile() as prof:
+        build_dubois_rc(cycle="dark")
+        text_extents(["a", "bb"])
+        figs = [_chart("first"), _chart()]
+    stats = prof.stats()
+
+    # font lookups may all be cached by now, so "fonts" can be missing
+    assert set(PHASES) - {"fonts"} <= set(stats["phases"])
+    assert list(stats["phases"]) == [p for p in PHASES if p in stats["phases"]]
+    for values in stats["phases"].values():
+        assert values["calls"] > 0
+        assert 0 <= values["seconds"] <= values["inclusive_seconds"] + 1e-9
+    assert stats["phases"]["draw"]["calls"] == 2
+    assert stats["phases"]["savefig"]["calls"] == 2
+
+    assert [chart["chart"] for chart in stats["charts"]] == ["first", "chart-2"]
+    assert stats["counters"]["charts"] == 2
+    for chart in stats["charts"]:
+        assert {"legend", "text_layout", "draw", "rasterize", "savefig"} <= set(chart["phases"])
+        assert chart["seconds"] == pytest.approx(
+            sum(p["seconds"] for p in chart["phases"].values()))
+    # self times never add up to more than the wall time
+    assert sum(p["seconds"] for p in stats["phases"].values()) <= stats["seconds"]
+    assert json.loads(prof.to_json()) == stats
+    del figs
+
+
+def test_matplotlib_is_restored():
+    draw = Figure.__dict__["draw"]
+    get_renderer = FigureCanvasAgg.__dict__["get_renderer"]
+    fig = _chart()
+    with profile() as prof:
+        fig.savefig(io.BytesIO(), format="png")
+        assert Figure.__dict__["draw"] is not draw
+    assert Figure.__dict__["draw"] is draw
+    assert FigureCanvasAgg.__dict__["get_renderer"] is get_renderer
+    renderer = fig.canvas.get_renderer()
+    assert renderer.draw_markers == renderer._renderer.draw_markers
+    assert isinstance(renderer, RendererAgg)
+
+    calls = prof.stats()["phases"]["draw"]["calls"]
+    fig.savefig(io.BytesIO(), format="png")
+    build_dubois_rc()
+    assert prof.stats()["phases"]["draw"]["calls"] == calls
+
+
+def test_nested_profiles_and_threads():
+    with profile() as outer:
+        with profile() as inner:
+            _chart()
+        threads = [threading.Thread(target=_chart) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert inner.stats()["counters"]["charts"] == 1
+    assert outer.stats()["counters"]["charts"] == 3
+    with pytest.raises(RuntimeError, match="already active"):
+        with outer:
+            with outer:
+                pass
+
+
+def test_root_figure_follows_subfigures():
+    fig = Figure()
+    ax = fig.add_subfigure(fig.add_gridspec()[0]).subplots()
+    assert _root_figure(ax) is fig
+    assert _root_figure(fig) is fig
+    assert _root_figure(object()) is None
+
+
+def test_missing_private_hooks_degrade(monkeypatch):
+    from matplotlib.font_manager import FontManager
+
+    # as on a matplotlib without these private names
+    monkeypatch.delattr(RendererAgg, "draw_tex")
+    monkeypatch.setattr(FontManager, "_findfont_cached",
+                        FontManager._findfont_cached.__wrapped__)
+    with profile() as prof:
+        _chart()
+    stats = prof.stats()
+    assert stats["counters"]["font_cache_hits"] == stats["counters"]["font_cache_misses"] == 0
+    assert stats["phases"]["draw"]["calls"] == 1
+    assert "draw_tex" not in vars(RendererAgg)
+
+
+def test_prometheus_export():
+    with profile() as prof:
+        _chart('quote " and \\ slash')
+    text = prof.to_prometheus(prefix="charts", labels={"job": 'a "b"'})
+    assert text.endswith("\n")
+    sample = re.compile(r'^charts_[a-z_]+(\{[a-z_]+="([^"\\]|\\.)*"(,[a-z_]+="([^"\\]|\\.)*")*\})? \S+$')
+    for line in text.splitlines():
+        if line.startswith("#"):
+            assert re.match(r"^# (HELP|TYPE) charts_[a-z_]+ .+$", line)
+        else:
+            assert sample.match(line), line
+    assert 'charts_phase_calls_total{job="a \\"b\\"",phase="savefig"} 1' in text
+    assert "charts_chart_seconds_count" in text
+    assert "# TYPE charts_chart_seconds summary" in text
+
+
+def test_lazy_export():
+    assert dubois_style.profile is profile
@@ -0,0 +1,61 @@
+"""Tests for dubois_style.ramps."""
+
+import numpy as np
+import pytest
+
+from dubois_style import DUBOIS_DARK_CYCLE, dubois_ramp, map_values, palette_rgba
+from dubois_style.analysis import srgb_to_cam02ucs
+from dubois_style.palettes import DUBOIS_FAMILIES
+from dubois_style.ramps import MAX_RAMP_STEPS
+
+
+def test_ramp_ends_on_the_palette_stops():
+    ramp = dubois_ramp(1000, "dark")
+    assert ramp.shape == (1000, 4)
+    np.testing.assert_allclose(ramp[[0, -1]], palette_rgba("dark")[[0, -1]], atol=1e-9)
+    np.testing.assert_allclose(dubois_ramp(2, DUBOIS_DARK_CYCLE)[1], ramp[-1])
+    navy = DUBOIS_FAMILIES["Deep Navy"]
+    np.testing.assert_allclose(
+        dubois_ramp(3, "Deep Navy")[[0, -1]], palette_rgba([navy["light"], navy["dark"]])
+    )
+
+
+@pytest.mark.parametrize("space", ["cam02ucs", "lab"])
+def test_family_ramp_is_perceptually_even(space):
+    jab = srgb_to_cam02ucs(dubois_ramp(512, "Red", space=space)[:, :3])
+    step = np.linalg.norm(np.diff(jab, axis=0), axis=1)
+    assert np.all(np.diff(jab[:, 0]) < 0)  # light to dark
+    if space == "cam02ucs":
+        np.testing.assert_allclose(step, step.mean(), rtol=1e-6)
+
+
+def test_ramps_are_cached_and_read_only():
+    ramp = dubois_ramp(MAX_RAMP_STEPS, "light")
+    assert dubois_ramp(MAX_RAMP_STEPS, "light") is ramp
+    with pytest.raises(ValueError):
+        ramp[0, 0] = 0
+    ramp8 = dubois_ramp(MAX_RAMP_STEPS, "light", dtype=np.uint8)
+    assert ramp8.dtype == np.uint8 and not ramp8.flags.writeable
+    np.testing.assert_array_equal(ramp8, np.rint(ramp * 255))
+
+
+def test_map_values_with_steps():
+    values = np.linspace(0, 1, 10_001)
+    colors = map_values(values, palette="dark", steps=4096)
+    assert len(np.unique(colors, axis=0)) == 4096
+    np.testing.assert_array_equal(colors[[0, -1]], dubois_ramp(4096, "dark")[[0, -1]])
+    colors8 = map_values([np.nan, 0.5], steps=256, dtype=np.uint8, nan_color=(0, 0, 0, 0))
+    assert colors8.dtype == np.uint8 and colors8[0].tolist() == [0, 0, 0, 0]
+    with pytest.raises(ValueError, match="bins or steps"):
+        map_values(values, bins=[0, 0.5, 1], steps=16)
+
+
+def test_ramp_errors():
+    with pytest.raises(ValueError, match="steps"):
+        dubois_ramp(1)
+    with pytest.raises(ValueError, match="steps"):
+        dubois_ramp(MAX_RAMP_STEPS + 1)
+    with pytest.raises(ValueError, match="space"):
+        dubois_ramp(16, space="hsv")
+    with pytest.raises(ValueError, match="two colors"):
+        dubois_ramp(16, ["#000000"])
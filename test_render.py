@@ -0,0 +1,50 @@
+"""Tests for dubois_style.render."""
+
+import pytest
+
+from dubois_style import DUBOIS_DARK_CYCLE, RenderJob, render_batch
+
+
+def draw_bars(fig, values):
+    ax = fig.subplots()
+    ax.bar(range(len(values)), values)
+
+
+def draw_fails(fig):
+    raise RuntimeError("boom")
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_render_batch_writes_outputs(tmp_path, max_workers):
+    jobs = [
+        RenderJob(draw_bars, tmp_path / f"chart_{i}.png", args=([1, 2, i + 1],))
+        for i in range(4)
+    ]
+    jobs.append(RenderJob(draw_bars, tmp_path / "multi", args=([3, 1],),
+                          formats=("png", "svg", "pdf")))
+    jobs.append(RenderJob(draw_fails, tmp_path / "broken.png"))
+
+    results = render_batch(jobs, max_workers=max_workers, cycle="dark", dpi=50)
+
+    assert [r.index for r in results] == list(range(len(jobs)))
+    for result in results[:-1]:
+        assert result.ok, result.error
+        assert result.total_seconds > 0
+        assert all(path.stat().st_size > 0 for path in result.outputs)
+    assert sorted(p.suffix for p in results[4].outputs) == [".pdf", ".png", ".svg"]
+    assert not results[-1].ok
+    assert "boom" in results[-1].error
+
+
+def test_serial_render_restores_rcparams(tmp_path):
+    import matplotlib as mpl
+
+    def draw_checked(fig):
+        assert mpl.rcParams["axes.prop_cycle"].by_key()["color"] == DUBOIS_DARK_CYCLE
+
+    with mpl.rc_context({"axes.prop_cycle": mpl.rcParamsDefault["axes.prop_cycle"]}):
+        before = dict(mpl.rcParams)
+        results = render_batch([RenderJob(draw_checked, tmp_path / "a.png")],
+                               max_workers=1, cycle="dark")
+        assert results[0].ok, results[0].error
+        assert dict(mpl.rcParams) == before
@@ -0,0 +1,81 @@
+"""Tests for dubois_style.report."""
+
+import re
+import warnings
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from dubois_style import DuboisReport
+
+
+def _write(path, n_pages):
+    with DuboisReport(path, metadata={"Title": "Test"}) as report:
+        for i in range(n_pages):
+            with report.page(figsize=(6, 8), nrows=2) as (fig, (top, bottom)):
+                top.plot(np.arange(10) * i, label=f"Series {i}")
+                top.set_title(f"County {i}")
+                top.legend()
+                bottom.bar(range(5), range(5))
+                fig.colorbar(bottom.scatter([1], [1], c=[1]), ax=bottom)
+                fig.suptitle(f"Report page {i}")
+    return path.read_bytes()
+
+
+def test_pages_reuse_one_template_and_reset(tmp_path):
+    seen = []
+    with DuboisReport(tmp_path / "report.pdf") as report:
+        for i in range(3):
+            with report.page(nrows=2) as (fig, axes):
+                seen.append(id(fig))
+                assert len(fig.axes) == 2 and not fig.texts and not fig.legends
+                assert all(not ax.lines and not ax.get_title() for ax in axes)
+                axes[0].plot([0, 1], label="a")
+                axes[0].set_title("title")
+                axes[0].legend()
+                fig.colorbar(axes[1].imshow([[0, 1]]), ax=axes[1])
+                fig.suptitle("suptitle")
+                fig.subplots_adjust(right=0.5)
+                assert fig._suptitle.get_text() == "suptitle"
+            assert fig.subplotpars.right == 0.5
+        with report.page(figsize=(4, 4)) as (other, ax):
+            pass
+        with pytest.raises(RuntimeError), report.page(nrows=2) as (fig, axes):
+            raise RuntimeError("not written")
+        assert report.pages == 4
+    assert len(set(seen)) == 1 and id(other) not in seen
+    assert fig.subplotpars.right != 0.5
+    with pytest.raises(ValueError, match="closed"):
+        with report.page():
+            pass
+
+
+def test_constrained_layout_pages_reset_quietly(tmp_path):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with DuboisReport(tmp_path / "report.pdf") as report:
+            for _ in range(3):
+                with report.page(layout="constrained", nrows=2) as (fig, axes):
+                    axes[0].plot([0, 1])
+        assert report.pages == 3
+    assert fig.get_layout_engine().adjust_compatible is False
+
+
+def test_fonts_embedded_once_per_document(tmp_path):
+    one = _write(tmp_path / "one.pdf", 1)
+    many = _write(tmp_path / "many.pdf", 30)
+    fonts = re.compile(rb"/Type /Font\b")
+    assert len(fonts.findall(many)) == len(fonts.findall(one))
+    assert b"/Count 30" in many
+
+
+def test_add_figure_releases_it(tmp_path):
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    fig.subplots().plot([1, 2, 3])
+    with DuboisReport(tmp_path / "report.pdf") as report:
+        report.add_figure(fig)
+        assert report.pages == 1
+    assert not fig.axes
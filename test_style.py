@@ -0,0 +1,81 @@
+"""Tests for dubois_style.style."""
+
+import matplotlib as mpl
+import pytest
+
+from dubois_style import (
+    DUBOIS_CATEGORICAL_CYCLE,
+    DUBOIS_DARK_CYCLE,
+    apply_dubois_style,
+    build_dubois_rc,
+    dubois_style_context,
+)
+
+
+def _cycle_colors():
+    return mpl.rcParams["axes.prop_cycle"].by_key()["color"]
+
+
+def test_context_applies_and_restores():
+    with mpl.rc_context():
+        mpl.rcParams["lines.linewidth"] = 1.25
+        before = dict(mpl.rcParams)
+        with dubois_style_context(cycle="dark"):
+            assert _cycle_colors() == DUBOIS_DARK_CYCLE
+            assert mpl.rcParams["lines.linewidth"] == 2.0
+            mpl.rcParams["axes.grid"] = True
+        assert dict(mpl.rcParams) == before
+
+
+def test_context_as_decorator():
+    @dubois_style_context(use_contrast_colors=True)
+    def colors():
+        return _cycle_colors()
+
+    assert colors() == DUBOIS_CATEGORICAL_CYCLE
+
+
+def test_invalid_cycle():
+    with pytest.raises(ValueError, match="cycle must be"):
+        apply_dubois_style(cycle="sepia")
+
+
+def test_build_dubois_rc_is_cached_and_read_only():
+    rc = build_dubois_rc(cycle="dark", base_font=["DejaVu Sans"])
+    assert rc is build_dubois_rc(cycle="dark", base_font="DejaVu Sans")
+    with pytest.raises(TypeError):
+        rc["lines.linewidth"] = 3.0
+    # list settings are frozen too
+    assert rc["font.family"] == ("DejaVu Sans",)
+    with mpl.rc_context(rc):
+        assert mpl.rcParams["font.family"] == ["DejaVu Sans"]
+
+
+def test_apply_short_circuits_and_does_not_share_lists():
+    with mpl.rc_context():
+        apply_dubois_style(base_font=["DejaVu Sans"])
+        mpl.rcParams["font.family"].append("Liberation Sans")
+        assert build_dubois_rc()["font.family"] == ("DejaVu Sans",)
+        apply_dubois_style(base_font=["DejaVu Sans"])
+        assert mpl.rcParams["font.family"] == ["DejaVu Sans"]
+
+
+def test_legend_reserve_space_fits_inside_figure():
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from dubois_style import dubois_legend
+
+    fig = Figure(figsize=(8, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    for i in range(60):
+        ax.plot([0, 1], [0, i], label=f"Series {i}")
+    legend = dubois_legend(ax, reserve_space=True)
+    fig.canvas.draw()
+
+    assert legend._ncols > 1
+    box = legend.get_window_extent(fig.canvas.get_renderer())
+    assert box.x1 <= fig.bbox.width
+    assert 0 <= box.y0 and box.y1 <= fig.bbox.height
+    assert ax.get_position().x1 < box.x0 / fig.bbox.width